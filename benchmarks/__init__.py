@@ -0,0 +1 @@
+"""Cache middleware and provider benchmarks."""
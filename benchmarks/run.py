@@ -0,0 +1,343 @@
+"""Cache middleware and provider benchmarks.
+
+The benchmarks drive a falcon.App with the CacheMiddleware in-process (the WSGI callable is
+called directly) and report the per-request time of a bypass, miss and hit compared to the same
+app without the middleware, the cache_key cost by query size, the hit time by payload size and
+the multi-threaded hit throughput. Results are written as JSON and can be compared with a
+previous run to detect regressions.
+
+By default the providers use local stand-ins (fakeredis and the pymemcache mock client), use
+--redis and --memcache to benchmark running servers.
+
+.. code:: bash
+
+    > python -m benchmarks.run --output baseline.json
+    > python -m benchmarks.run --compare baseline.json --threshold 0.1
+"""
+# standard library
+import argparse
+import datetime
+import io
+import itertools
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+# third-party
+import falcon
+from falcon import testing
+
+# first-party
+from falcon_provider_cache.middleware import CacheMiddleware
+from falcon_provider_cache.utils import CacheProvider, MemcacheProvider, RedisCacheProvider
+
+
+class BenchResource:
+    """Resource returning a payload of the requested size."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'timeout': 300,
+        'use_query': True,
+    }
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.payloads: dict[int, bytes] = {}
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response):
+        """Support GET method."""
+        size = req.get_param_as_int('size', default=256)
+        if size not in self.payloads:
+            self.payloads[size] = b'x' * size
+        resp.content_type = falcon.MEDIA_TEXT
+        resp.data = self.payloads[size]
+
+
+class BypassResource(BenchResource):
+    """Resource with caching disabled."""
+
+    cache_control = {'enabled': False}
+
+
+def fake_redis_provider() -> RedisCacheProvider:
+    """Return a Redis provider using fakeredis (requires fakeredis)."""
+    # third-party
+    import fakeredis  # pylint: disable=import-outside-toplevel
+
+    # the client is created on first use, set it before the provider connects
+    provider = RedisCacheProvider()
+    provider.redis_client = fakeredis.FakeRedis(decode_responses=True)
+    return provider
+
+
+def fake_memcache_provider() -> MemcacheProvider:
+    """Return a memcache provider using the pymemcache mock client (requires pymemcache)."""
+    # third-party
+    from pymemcache.test.utils import MockMemcacheClient  # pylint: disable=import-outside-toplevel
+
+    provider = MemcacheProvider()
+    provider.memcache_client = MockMemcacheClient()
+    return provider
+
+
+def _server(value: str) -> tuple[str, int]:
+    """Return the (host, port) of a host:port argument."""
+    host, _, port = value.partition(':')
+    return host, int(port)
+
+
+def providers(args: argparse.Namespace) -> dict[str, CacheProvider]:
+    """Return the providers to benchmark.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        dict[str, CacheProvider]: The providers keyed on name.
+    """
+    factories: dict[str, Callable] = {
+        'redis': fake_redis_provider,
+        'memcache': fake_memcache_provider,
+    }
+    if args.redis:
+        host, port = _server(args.redis)
+        factories['redis'] = lambda: RedisCacheProvider(host=host, port=port)
+    if args.memcache:
+        factories['memcache'] = lambda: MemcacheProvider(server=_server(args.memcache))
+
+    result = {}
+    for name in args.providers:
+        try:
+            result[name] = factories[name]()
+        except ImportError as e:
+            print(f'Skipping the {name} provider ({e}).', file=sys.stderr)
+    return result
+
+
+def create_app(provider: CacheProvider | None) -> falcon.App:
+    """Return the benchmark app with the cache middleware (or without if no provider)."""
+    middleware = [] if provider is None else [CacheMiddleware(provider)]
+    app = falcon.App(middleware=middleware)
+    app.add_route('/cached', BenchResource())
+    app.add_route('/bypass', BypassResource())
+    return app
+
+
+def _start_response(*_args):
+    """WSGI start_response that discards the response."""
+
+
+def request(app: falcon.App, path: str, query_string: str = '') -> bytes:
+    """Call the WSGI app directly and return the response body.
+
+    Args:
+        app: The falcon app.
+        path: The request path.
+        query_string: The request query string.
+
+    Returns:
+        bytes: The response body.
+    """
+    environ = testing.create_environ(path=path, query_string=query_string)
+    environ['wsgi.errors'] = io.StringIO()
+    return b''.join(app(environ, _start_response))
+
+
+def measure(func: Callable, iterations: int) -> dict:
+    """Return the timing statistics (microseconds) of the function calls.
+
+    Args:
+        func: The function to call (takes the iteration number).
+        iterations: The number of calls.
+
+    Returns:
+        dict: The median, mean and p99 time per call and the number of calls.
+    """
+    times = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        func(i)
+        times.append((time.perf_counter() - start) * 1_000_000)
+    times.sort()
+    return {
+        'iterations': iterations,
+        'mean_us': round(statistics.fmean(times), 2),
+        'median_us': round(statistics.median(times), 2),
+        'p99_us': round(times[min(len(times) - 1, int(len(times) * 0.99))], 2),
+    }
+
+
+def bench_overhead(name: str, provider: CacheProvider, iterations: int, run: str) -> dict:
+    """Return the per-request time of a bypass, miss and hit."""
+    app = create_app(provider)
+    request(app, '/cached', f'run={run}&key=hit')  # populate the hit entry
+    return {
+        f'overhead.{name}.bypass': measure(lambda i: request(app, '/bypass'), iterations),
+        f'overhead.{name}.miss': measure(
+            lambda i: request(app, '/cached', f'run={run}&key=miss-{i}'), iterations
+        ),
+        f'overhead.{name}.hit': measure(
+            lambda i: request(app, '/cached', f'run={run}&key=hit'), iterations
+        ),
+    }
+
+
+def bench_cache_key(provider: CacheProvider, iterations: int) -> dict:
+    """Return the cache_key time by number of query parameters."""
+    resource = BenchResource()
+    policy = provider.cache_policy(resource, 'GET')
+    results = {}
+    for count in (1, 10, 50, 200):
+        query_string = '&'.join(f'param{i}=value{i}' for i in range(count))
+        req = testing.create_req(path='/cached', query_string=query_string)
+        results[f'cache_key.params_{count}'] = measure(
+            lambda i, req=req: provider.cache_key(req, resource, policy), iterations
+        )
+    return results
+
+
+def bench_payload(name: str, provider: CacheProvider, iterations: int, run: str) -> dict:
+    """Return the hit time by payload size."""
+    app = create_app(provider)
+    results = {}
+    for size in (1024, 16384, 262144, 1048576):
+        query_string = f'run={run}&size={size}'
+        request(app, '/cached', query_string)  # populate the entry
+        results[f'payload.{name}.{size}'] = measure(
+            lambda i, qs=query_string: request(app, '/cached', qs), iterations
+        )
+    return results
+
+
+def bench_throughput(name: str, provider: CacheProvider, iterations: int, run: str) -> dict:
+    """Return the hit throughput (requests per second) by number of threads."""
+    app = create_app(provider)
+    query_string = f'run={run}&key=throughput'
+    request(app, '/cached', query_string)  # populate the entry
+
+    results = {}
+    for threads in (1, 4, 16):
+        counter = itertools.count()
+
+        def worker(counter=counter):
+            while next(counter) < iterations:
+                request(app, '/cached', query_string)
+
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        start = time.perf_counter()
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        results[f'throughput.{name}.threads_{threads}'] = {
+            'iterations': iterations,
+            'requests_per_second': round(iterations / elapsed, 1),
+        }
+    return results
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    """Run the benchmarks and return the results.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        dict: The run metadata and the results keyed on benchmark name.
+    """
+    run = str(time.time_ns())  # unique query per run so shared servers start cold
+    # the same app without the middleware
+    baseline_app = create_app(None)
+    results = {
+        'overhead.baseline': measure(lambda i: request(baseline_app, '/cached'), args.iterations)
+    }
+    for name, provider in providers(args).items():
+        results.update(bench_overhead(name, provider, args.iterations, run))
+        results.update(bench_payload(name, provider, args.iterations, run))
+        results.update(bench_throughput(name, provider, args.iterations, run))
+    results.update(bench_cache_key(CacheProvider(), args.iterations))
+    return {
+        'metadata': {
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'falcon': falcon.__version__,
+            'iterations': args.iterations,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+        },
+        'results': results,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print the change from the baseline and return the regressed benchmarks.
+
+    Timings regress when the median grows by more than the threshold, throughput regresses
+    when the requests per second drop by more than the threshold.
+
+    Args:
+        results: The current results.
+        baseline: The baseline results.
+        threshold: The allowed relative change (e.g. 0.1 for 10%).
+
+    Returns:
+        list[str]: The names of the regressed benchmarks.
+    """
+    regressions = []
+    for name, result in results['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+        if 'median_us' in result:
+            change = result['median_us'] / previous['median_us'] - 1
+        else:
+            change = previous['requests_per_second'] / result['requests_per_second'] - 1
+        flag = 'REGRESSION' if change > threshold else ''
+        print(f'{name:<40} {change:+8.1%} {flag}')
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks from the command line.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        int: The exit code (1 if a regression was found).
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', 1)[0])
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--providers', nargs='+', default=['redis', 'memcache'])
+    parser.add_argument('--redis', help='benchmark a Redis server (host:port)')
+    parser.add_argument('--memcache', help='benchmark a memcache server (host:port)')
+    parser.add_argument('--output', help='write the results to a JSON file')
+    parser.add_argument('--compare', help='compare the results with a previous JSON file')
+    parser.add_argument('--threshold', type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as fh:
+            baseline = json.load(fh)
+        return 1 if compare(results, baseline, args.threshold) else 0
+
+    json.dump(results, sys.stdout, indent=2, sort_keys=True)
+    print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Access pattern based cache admission and TTLs."""
+# standard library
+import hashlib
+import threading
+
+# counters are halved by translating each byte with this table
+_HALVE = bytes(i >> 1 for i in range(256))
+
+
+class FrequencySketch:
+    """Approximate request frequency counter (TinyLFU style count-min sketch).
+
+    Each key increments one 8-bit counter per row (conservative update) and the estimate is
+    the minimum of its counters, so estimates never undercount. After sample_size increments
+    all counters are halved, so the estimates reflect recent requests and keys that are no
+    longer requested age out. The sketch uses depth * width bytes regardless of the number of
+    keys.
+
+    Args:
+        width: The number of counters per row (rounded up to a power of two).
+        depth: The number of rows (hash functions).
+        sample_size: The number of increments before the counters are halved (default: 10 times
+            the width).
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 4, sample_size: int | None = None):
+        """Initialize class properties."""
+        self.width = 1 << (max(width, 2) - 1).bit_length()
+        self.depth = depth
+        self.sample_size = sample_size or 10 * self.width
+        self._additions = 0
+        self._lock = threading.Lock()
+        self._rows = [bytearray(self.width) for _ in range(depth)]
+
+    def _indexes(self, key: str) -> list[int]:
+        """Return the counter index of the key for each row (double hashing)."""
+        digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little')
+        h1, h2 = digest & 0xFFFFFFFF, (digest >> 32) | 1
+        return [(h1 + i * h2) & (self.width - 1) for i in range(self.depth)]
+
+    def estimate(self, key: str) -> int:
+        """Return the estimated number of recent increments of the key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            int: The estimated count (at most 255).
+        """
+        return min(row[i] for row, i in zip(self._rows, self._indexes(key)))
+
+    def increment(self, key: str) -> int:
+        """Count a request for the key and return its estimated count.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            int: The estimated count including this request (at most 255).
+        """
+        indexes = self._indexes(key)
+        with self._lock:
+            count = min(row[i] for row, i in zip(self._rows, indexes))
+            if count < 255:
+                # conservative update, only the counters at the minimum are incremented
+                for row, i in zip(self._rows, indexes):
+                    if row[i] == count:
+                        row[i] += 1
+                count += 1
+
+            self._additions += 1
+            if self._additions >= self.sample_size:
+                self._rows = [row.translate(_HALVE) for row in self._rows]
+                self._additions //= 2
+        return count
+
+
+def adaptive_timeout(
+    previous: bytes | str | None, digest: str, timeout: int, max_timeout: int
+) -> tuple[int, bytes]:
+    """Return the TTL of a regenerated entry and the TTL state to store with it.
+
+    The TTL is doubled (up to max_timeout) each time the entry is regenerated with the same
+    content and reset to the timeout when the content changes.
+
+    Args:
+        previous: The stored TTL state of the previous entry (digest:ttl) or None.
+        digest: The content hash of the regenerated body.
+        timeout: The configured timeout (seconds).
+        max_timeout: The maximum timeout (seconds).
+
+    Returns:
+        tuple[int, bytes]: The TTL (seconds) and the TTL state.
+    """
+    ttl = timeout
+    if previous is not None:
+        if isinstance(previous, bytes):
+            previous = previous.decode()
+        previous_digest, _, previous_ttl = previous.partition(':')
+        if previous_digest == digest and previous_ttl.isdigit():
+            ttl = max(timeout, min(max_timeout, int(previous_ttl) * 2))
+    return ttl, f'{digest}:{ttl}'.encode()
@@ -0,0 +1,527 @@
+"""Async cache providers for the ASGI middleware."""
+# standard library
+import time
+from collections.abc import Callable
+
+# first-party
+from falcon_provider_cache.compression import Compressor
+from falcon_provider_cache.serializers import Serializer
+from falcon_provider_cache.utils import (
+    BaseCacheProvider,
+    ClientMixin,
+    _expire_options,
+    _expiring_tags,
+    _to_str,
+    _ttl_values,
+)
+
+
+class AsyncCacheProvider(BaseCacheProvider):
+    """Base Async Cache Provider Class.
+
+    The base class of the async providers used by the ASGI middleware, the backend operations
+    are coroutines. See BaseCacheProvider for the arguments.
+    """
+
+    def connect(self):
+        """Create the backend client.
+
+        Async clients connect on the event loop of the first request, so only the client is
+        created. Call from a post fork hook (e.g. gunicorn post_fork).
+        """
+
+    async def acquire_lock(self, key: str, timeout: int) -> bool:  # pylint: disable=unused-argument
+        """Acquire a distributed regeneration lock for the cache key.
+
+        The base provider has no shared backend so the lock is always acquired.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return True
+
+    async def release_lock(self, key: str):
+        """Release the distributed regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+        """
+
+    async def tag_key(self, key: str, tags: list) -> str:  # pylint: disable=unused-argument
+        """Return the cache key for an entry with the provided tags.
+
+        Providers that track tags with index sets return the key unchanged, providers that
+        track tags with generations (memcache) include the tag generations in the key.
+
+        Args:
+            key: The cache key.
+            tags: The entry tags.
+
+        Returns:
+            str: The cache key.
+        """
+        return key
+
+    async def add_tags(self, keys: list, tags: list, timeout: int):
+        """Add the keys to the tag indexes.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+
+    async def get_many(self, keys: list) -> dict:
+        """Return multiple values, keys that are not cached are not included.
+
+        Providers override this method to read the values in a single round trip.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        values = {}
+        for key in keys:
+            value = await self.get_cache(key)  # pylint: disable=no-member
+            if value is not None:
+                values[key] = value
+        return values
+
+    async def get_many_ttl(self, keys: list) -> dict:
+        """Return multiple values and their TTL, keys that are not cached are not included.
+
+        Providers that can read the TTL of the values override this method, by default the TTL
+        is None (unknown).
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The (value, TTL in seconds or None) keyed on the cache key.
+        """
+        return {k: (v, None) for k, v in (await self.get_many(keys)).items()}
+
+    async def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout.
+
+        Providers override this method to write the values in a single round trip.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        for key, value in mapping.items():
+            await self.set_cache(key, value, timeout)  # pylint: disable=no-member
+
+    async def delete_many(self, keys: list):
+        """Delete multiple values.
+
+        Providers override this method to delete the values in a single round trip.
+
+        Args:
+            keys: The cache keys.
+        """
+        for key in keys:
+            await self.delete_cache(key)  # pylint: disable=no-member
+
+
+class AsyncMemcacheProvider(ClientMixin, AsyncCacheProvider):
+    """Async Memcache Provider Class.
+
+    Args:
+        cache_control: A dict containing the default cache control settings.
+        user_key: The falcon req.context attribute that contains the username or
+            userid that will be used if private cache is enabled.
+        host: The memcache host.
+        port: The memcache port.
+        compressor: A Compressor used to compress large cache values.
+        key_hash: The hash used for cache keys (blake2b, sha1, xxhash) or a callable.
+        value_serializer: The Serializer used to serialize cache values (default: json).
+        pool_size (int, kwargs): The maximum pool size for the client.
+        pool_minsize (int, kwargs): The minimum pool size for the client.
+    """
+
+    def __init__(
+        self,
+        cache_control: dict | None = None,
+        user_key: str | None = None,
+        host: str | None = None,
+        port: int | None = None,
+        compressor: Compressor | None = None,
+        key_hash: str | Callable = 'blake2b',
+        value_serializer: Serializer | None = None,
+        **kwargs,
+    ):
+        """Initialize class properties."""
+        super().__init__(cache_control, user_key, compressor, key_hash, value_serializer)
+        self._client_args = (host, port, kwargs)
+
+    def _create_client(self) -> object:
+        """Return a new aiomcache client."""
+        try:
+            # third-party
+            import aiomcache  # pylint: disable=import-outside-toplevel
+        except ImportError:  # pragma: no cover
+            print(
+                'AsyncMemcacheProvider requires aiomcache to be installed '
+                'try "pip install falcon-provider-cache[memcache]".'
+            )
+            raise
+
+        host, port, kwargs = self._client_args
+        return aiomcache.Client(host or 'localhost', port or 11211, **kwargs)
+
+    @property
+    def memcache_client(self) -> object:
+        """Return the memcache client (created on first use and after a fork)."""
+        return self._get_client()
+
+    @memcache_client.setter
+    def memcache_client(self, client: object):
+        """Set the memcache client."""
+        self._set_client(client)
+
+    def connect(self):
+        """Create the memcache client.
+
+        Async clients connect on the event loop of the first request, so only the client is
+        created.
+        """
+        self._get_client()
+
+    async def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a distributed regeneration lock using memcache add.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return await self.memcache_client.add(f'{key}.lock'.encode(), b'1', exptime=timeout)
+
+    async def release_lock(self, key: str):
+        """Release the distributed regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+        """
+        await self.memcache_client.delete(f'{key}.lock'.encode())
+
+    async def get_cache(self, key: str) -> bytes | None:
+        """Return cache from memcache
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Any: The cached data.
+        """
+        return self._decompress(await self.memcache_client.get(key.encode()))
+
+    async def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
+        """Write cache to memcache
+
+        Args:
+            key: The cache key.
+            value: The cache value.
+            timeout: The cache timeout value.
+        """
+        timeout = timeout or self.timeout
+        value = self._compress(value)
+        if isinstance(value, str):
+            value = value.encode()
+        await self.memcache_client.set(key.encode(), value, exptime=timeout)
+
+    async def get_many(self, keys: list) -> dict:
+        """Return multiple values using memcache multi_get.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        if not keys:
+            return {}
+        values = await self.memcache_client.multi_get(*[k.encode() for k in keys])
+        return {k: self._decompress(v) for k, v in zip(keys, values) if v is not None}
+
+    async def delete_many(self, keys: list):
+        """Delete multiple values.
+
+        Args:
+            keys: The cache keys.
+        """
+        for key in keys:
+            await self.memcache_client.delete(key.encode())
+
+    async def tag_key(self, key: str, tags: list) -> str:
+        """Return the cache key including the current generation of each tag.
+
+        Args:
+            key: The cache key.
+            tags: The entry tags.
+
+        Returns:
+            str: The cache key.
+        """
+        if not tags:
+            return key
+
+        names = [f'tag:{t}'.encode() for t in tags]
+        generations = list(await self.memcache_client.multi_get(*names))
+        for i, name in enumerate(names):
+            if generations[i] is None:
+                generations[i] = str(time.time_ns()).encode()
+                if not await self.memcache_client.add(name, generations[i]):
+                    # another request added the generation first, use the stored generation
+                    generations[i] = await self.memcache_client.get(name) or generations[i]
+        return self._generation_key(key, generations)
+
+    async def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes.
+
+        A new generation is written for each tag, so existing entries are no longer used and
+        expire with their TTL.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys (always empty for memcache).
+        """
+        generation = str(time.time_ns()).encode()
+        for tag in self.invalidation_tags(tags, paths):
+            await self.memcache_client.set(f'tag:{tag}'.encode(), generation)
+        return []
+
+
+class AsyncRedisCacheProvider(ClientMixin, AsyncCacheProvider):
+    """Async Redis Cache Provider Class.
+
+    Args:
+        cache_control: A dict containing the default cache control settings.
+        user_key: The falcon req.context attribute that contains the username or
+            userid that will be used if private cache is enabled.
+        host: The REDIS host.
+        port: The REDIS port.
+        db: The REDIS db.
+        compressor: A Compressor used to compress large cache values.
+        key_hash: The hash used for cache keys (blake2b, sha1, xxhash) or a callable.
+        value_serializer: The Serializer used to serialize cache values (default: json).
+        max_connections (int, kwargs): The maximum number of connections to REDIS.
+        password (str, kwargs): The REDIS password.
+        socket_timeout (int, kwargs): The REDIS socket timeout.
+    """
+
+    def __init__(
+        self,
+        cache_control: dict | None = None,
+        user_key: str | None = None,
+        host: str | None = None,
+        port: int | None = None,
+        db: int | None = None,
+        compressor: Compressor | None = None,
+        key_hash: str | Callable = 'blake2b',
+        value_serializer: Serializer | None = None,
+        **kwargs,
+    ):
+        """Initialize class properties."""
+        super().__init__(cache_control, user_key, compressor, key_hash, value_serializer)
+        kwargs.setdefault('decode_responses', True)
+        self._client_args = (host, port, db, kwargs)
+        # the EXPIRE NX and GT options require Redis 7.0 (disabled on the first failure)
+        self._expire_options = True
+
+    def _create_client(self) -> object:
+        """Return a new async Redis client."""
+        try:
+            # third-party
+            from redis import asyncio as redis_asyncio  # pylint: disable=import-outside-toplevel
+        except ImportError:  # pragma: no cover
+            print(
+                'AsyncRedisCacheProvider requires redis (redis.asyncio) to be installed '
+                'try "pip install redis" or "pip install falcon-provider-cache[redis]".'
+            )
+            raise
+
+        host, port, db, kwargs = self._client_args
+        return redis_asyncio.Redis(
+            host=host or 'localhost', port=port or 6379, db=db or 0, **kwargs
+        )
+
+    @property
+    def redis_client(self) -> object:
+        """Return the Redis client (created on first use and after a fork)."""
+        return self._get_client()
+
+    @redis_client.setter
+    def redis_client(self, client: object):
+        """Set the Redis client."""
+        self._set_client(client)
+
+    def connect(self):
+        """Create the Redis client.
+
+        Async clients connect on the event loop of the first request, so only the client is
+        created.
+        """
+        self._get_client()
+
+    async def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a distributed regeneration lock using Redis SET NX PX.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return bool(
+            await self.redis_client.set(f'{key}.lock', '1', nx=True, px=int(timeout * 1000))
+        )
+
+    async def release_lock(self, key: str):
+        """Release the distributed regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+        """
+        await self.redis_client.delete(f'{key}.lock')
+
+    async def get_cache(self, key: str) -> bytes | str | None:
+        """Return cache from Redis
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Any: The cached data.
+        """
+        # the cached entries are binary, bypass the client response decoding
+        value = await self.redis_client.execute_command('GET', key, NEVER_DECODE=True)
+        return self._decompress(value)
+
+    async def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
+        """Write cache to Redis
+
+        Args:
+            key: The cache key.
+            value: The cache value.
+            timeout: The cache timeout value in seconds.
+        """
+        timeout = timeout or self.timeout
+        await self.redis_client.setex(name=key, time=timeout, value=self._compress(value))
+
+    async def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout using a pipeline.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        timeout = timeout or self.timeout
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.setex(name=key, time=timeout, value=self._compress(value))
+            await pipe.execute()
+
+    async def get_many(self, keys: list) -> dict:
+        """Return multiple values using Redis MGET.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        if not keys:
+            return {}
+        values = await self.redis_client.execute_command('MGET', *keys, NEVER_DECODE=True)
+        return {k: self._decompress(v) for k, v in zip(keys, values) if v is not None}
+
+    async def get_many_ttl(self, keys: list) -> dict:
+        """Return multiple values and their remaining TTL using a pipeline.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The (value, TTL in seconds or None) keyed on the cache key.
+        """
+        if not keys:
+            return {}
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.execute_command('GET', key, NEVER_DECODE=True)
+                pipe.pttl(key)
+            results = await pipe.execute()
+        return _ttl_values(keys, results, self._decompress)
+
+    async def delete_many(self, keys: list):
+        """Delete multiple values using a single Redis DEL.
+
+        Args:
+            keys: The cache keys.
+        """
+        if keys:
+            await self.redis_client.delete(*keys)
+
+    async def add_tags(self, keys: list, tags: list, timeout: int):
+        """Add the keys to the tag index sets.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+        names = [f'tag:{t}' for t in tags]
+        if self._expire_options:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for name in names:
+                    pipe.sadd(name, *keys)
+                    # keep the index for the longest TTL of its entries
+                    pipe.expire(name, timeout, nx=True)
+                    pipe.expire(name, timeout, gt=True)
+                self._expire_options = _expire_options(await pipe.execute(raise_on_error=False))
+            if self._expire_options:
+                return
+
+        # Redis < 7.0, read the TTL of the indexes and extend the shorter ones
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for name in names:
+                pipe.sadd(name, *keys)
+                pipe.ttl(name)
+            ttls = (await pipe.execute())[1::2]
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for name in _expiring_tags(names, ttls, timeout):
+                pipe.expire(name, timeout)
+            await pipe.execute()
+
+    async def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys.
+        """
+        names = [f'tag:{t}' for t in self.invalidation_tags(tags, paths)]
+        if not names:
+            return []
+
+        keys = [_to_str(k) for k in await self.redis_client.sunion(names)]
+        await self.redis_client.delete(*keys, *names)
+        return keys
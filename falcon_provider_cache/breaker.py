@@ -0,0 +1,79 @@
+"""Cache backend circuit breaker."""
+# standard library
+import threading
+import time
+from collections import deque
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for a cache backend.
+
+    The breaker opens after ``failure_threshold`` failures (errors or operations over the
+    latency budget) within ``window`` seconds. While open the cache is bypassed. After
+    ``reset_timeout`` seconds the breaker is half-open and a single probe request is allowed to
+    use the cache, the breaker closes if the probe succeeds or opens again if it fails.
+
+    Args:
+        failure_threshold: The number of failures within the window that opens the breaker.
+        window: The time (seconds) failures are counted.
+        reset_timeout: The time (seconds) the breaker stays open before a probe is allowed.
+    """
+
+    CLOSED = 'closed'
+    HALF_OPEN = 'half_open'
+    OPEN = 'open'
+
+    def __init__(self, failure_threshold: int = 5, window: float = 10, reset_timeout: float = 5):
+        """Initialize class properties."""
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures: deque[float] = deque()
+        self._lock = threading.Lock()
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Return True if the cache backend should be used.
+
+        Returns:
+            bool: False while the breaker is open or a half-open probe is in flight.
+        """
+        if self.state == self.CLOSED:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            # allow a single probe, another probe is allowed if no result after reset_timeout
+            self.state = self.HALF_OPEN
+            self._opened_at = now
+            return True
+
+    def record_failure(self):
+        """Record a failed (or too slow) backend operation."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.HALF_OPEN:
+                self._open(now)
+                return
+
+            self._failures.append(now)
+            while self._failures and self._failures[0] <= now - self.window:
+                self._failures.popleft()
+            if self.state == self.CLOSED and len(self._failures) >= self.failure_threshold:
+                self._open(now)
+
+    def record_success(self):
+        """Record a successful backend operation."""
+        if self.state == self.HALF_OPEN:
+            with self._lock:
+                self.state = self.CLOSED
+                self._failures.clear()
+
+    def _open(self, now: float):
+        """Open the breaker."""
+        self.state = self.OPEN
+        self._opened_at = now
+        self._failures.clear()
@@ -0,0 +1,257 @@
+"""Request coalescing (single-flight) for cache misses."""
+# standard library
+import asyncio
+import threading
+import time
+
+# third-party
+import falcon
+import falcon.asgi
+
+# first-party
+from falcon_provider_cache.entry import CacheEntry
+
+
+class SingleFlight:
+    """Thread-safe in-process single-flight registry.
+
+    The first caller to acquire a key becomes the leader, all other callers receive the event
+    that will be set when the leader releases the key.
+    """
+
+    def __init__(self):
+        """Initialize class properties."""
+        self._flights: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> threading.Event | None:
+        """Return None if the caller is the leader for key, else the leader's event.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            threading.Event | None: The event to wait on or None for the leader.
+        """
+        with self._lock:
+            event = self._flights.get(key)
+            if event is None:
+                self._flights[key] = threading.Event()
+            return event
+
+    def release(self, key: str):
+        """Release the key and wake all waiters.
+
+        Args:
+            key: The cache key.
+        """
+        with self._lock:
+            event = self._flights.pop(key, None)
+        if event is not None:
+            event.set()
+
+
+class AsyncSingleFlight:
+    """In-process single-flight registry for a single event loop.
+
+    The first caller to acquire a key becomes the leader, all other callers receive the event
+    that will be set when the leader releases the key.
+    """
+
+    def __init__(self):
+        """Initialize class properties."""
+        self._flights: dict[str, asyncio.Event] = {}
+
+    def acquire(self, key: str) -> asyncio.Event | None:
+        """Return None if the caller is the leader for key, else the leader's event.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            asyncio.Event | None: The event to wait on or None for the leader.
+        """
+        event = self._flights.get(key)
+        if event is None:
+            self._flights[key] = asyncio.Event()
+        return event
+
+    def release(self, key: str):
+        """Release the key and wake all waiters.
+
+        Args:
+            key: The cache key.
+        """
+        event = self._flights.pop(key, None)
+        if event is not None:
+            event.set()
+
+
+class CoalesceMixin:
+    """Regeneration locks, request coalescing and stale entry refreshes of the CacheMiddleware.
+
+    The in-process single-flight registries are combined with the distributed lock of the
+    provider, so only one request per key regenerates the response across processes.
+    """
+
+    def _refresh_request(self, req: falcon.Request, asgi: bool = False) -> falcon.Request:
+        """Return a new request used to refresh a stale entry in the background.
+
+        The request that is served the stale entry is finished (and its context may change)
+        while the entry is refreshed, so the refresh uses a new request with the method, path,
+        query string, key and vary headers and user key of the request.
+        """
+        # third-party
+        from falcon import testing  # pylint: disable=import-outside-toplevel
+
+        policy = req.context.cache_policy
+        names = [*policy.key_headers, *policy.vary]
+        options = {
+            'method': req.method,
+            'path': req.path,
+            'query_string': req.query_string,
+            'headers': {n: req.get_header(n) for n in names if req.get_header(n) is not None},
+            'host': req.host,
+            'scheme': req.scheme,
+            'port': req.port,
+            'root_path': req.root_path,
+            'options': req.options,
+        }
+        refresh_req = testing.create_asgi_req(**options) if asgi else testing.create_req(**options)
+        refresh_req.context.cache_policy = policy
+        refresh_req.context.cache_tags = req.context.cache_tags
+        user_key = self.provider.user_key
+        if user_key is not None and hasattr(req.context, user_key):
+            setattr(refresh_req.context, user_key, getattr(req.context, user_key))
+        return refresh_req
+
+    def _acquire_lock(self, cache_key: str, timeout: int, resource: object) -> bool:
+        """Return True if the distributed lock was acquired (or the cache is not available)."""
+        try:
+            return self._call('acquire_lock', cache_key, timeout)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'acquire_lock', f'Failed acquiring cache lock ({e}).')
+        return True
+
+    def _release_lock(self, cache_key: str, resource: object):
+        """Release the in-process and distributed locks for the cache key."""
+        try:
+            self._call('release_lock', cache_key)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'release_lock', f'Failed releasing cache lock ({e}).')
+        finally:
+            self._flights.release(cache_key)
+
+    def _coalesce(self, req: falcon.Request, cache_key: str, resource: object) -> CacheEntry | None:
+        """Wait for a concurrent request to populate the cache or become the leader."""
+        policy = req.context.cache_policy
+        event = self._flights.acquire(cache_key)
+        if event is not None:
+            # another request in this process is regenerating the response
+            event.wait(policy.lock_wait)
+            entry = self._get_cache(cache_key, resource)
+            return entry if entry is not None and entry.fresh else None
+
+        if self._acquire_lock(cache_key, policy.lock_timeout, resource):
+            req.context.cache_lock = cache_key  # released in process_response
+            return None
+
+        # another process is regenerating the response, poll the cache
+        try:
+            deadline = time.monotonic() + policy.lock_wait
+            while time.monotonic() < deadline:
+                time.sleep(self.lock_poll_interval)
+                entry = self._get_cache(cache_key, resource)
+                if entry is not None and entry.fresh:
+                    return entry
+            return None
+        finally:
+            self._flights.release(cache_key)
+
+    def _refresh(self, req: falcon.Request, resource: object, params: dict, cache_key: str):
+        """Call the resource responder and write a fresh entry (stale-while-revalidate)."""
+        policy = req.context.cache_policy
+        if not self._acquire_lock(cache_key, policy.lock_timeout, resource):
+            # another process is refreshing the entry
+            self._flights.release(cache_key)
+            return
+
+        try:
+            resp = falcon.Response()
+            self._responder(req, resource)(req, resp, **params)
+            body = resp.render_body()
+            if body is not None and resp.stream is None:
+                self._write(req, resp, cache_key, body, resource)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'refresh', f'Failed refreshing cache ({e}).')
+        finally:
+            self._release_lock(cache_key, resource)
+
+    async def _acquire_lock_async(self, cache_key: str, timeout: int, resource: object) -> bool:
+        """Return True if the distributed lock was acquired (or the cache is not available)."""
+        try:
+            return await self._call_async('acquire_lock', cache_key, timeout)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'acquire_lock', f'Failed acquiring cache lock ({e}).')
+        return True
+
+    async def _release_lock_async(self, cache_key: str, resource: object):
+        """Release the in-process and distributed locks for the cache key."""
+        try:
+            await self._call_async('release_lock', cache_key)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'release_lock', f'Failed releasing cache lock ({e}).')
+        finally:
+            self._flights_async.release(cache_key)
+
+    async def _coalesce_async(
+        self, req: falcon.Request, cache_key: str, resource: object
+    ) -> CacheEntry | None:
+        """Wait for a concurrent request to populate the cache or become the leader."""
+        policy = req.context.cache_policy
+        event = self._flights_async.acquire(cache_key)
+        if event is not None:
+            # another request in this process is regenerating the response
+            try:
+                await asyncio.wait_for(event.wait(), policy.lock_wait)
+            except asyncio.TimeoutError:
+                pass
+            entry = await self._get_cache_async(cache_key, resource)
+            return entry if entry is not None and entry.fresh else None
+
+        if await self._acquire_lock_async(cache_key, policy.lock_timeout, resource):
+            req.context.cache_lock = cache_key  # released in process_response_async
+            return None
+
+        # another process is regenerating the response, poll the cache
+        try:
+            deadline = time.monotonic() + policy.lock_wait
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.lock_poll_interval)
+                entry = await self._get_cache_async(cache_key, resource)
+                if entry is not None and entry.fresh:
+                    return entry
+            return None
+        finally:
+            self._flights_async.release(cache_key)
+
+    async def _refresh_async(
+        self, req: falcon.Request, resource: object, params: dict, cache_key: str
+    ):
+        """Call the resource responder and write a fresh entry (stale-while-revalidate)."""
+        policy = req.context.cache_policy
+        if not await self._acquire_lock_async(cache_key, policy.lock_timeout, resource):
+            # another process is refreshing the entry
+            self._flights_async.release(cache_key)
+            return
+
+        try:
+            resp = falcon.asgi.Response()
+            await self._responder(req, resource)(req, resp, **params)
+            body = await resp.render_body()
+            if body is not None and resp.stream is None:
+                await self._write_async(req, resp, cache_key, body, resource)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'refresh', f'Failed refreshing cache ({e}).')
+        finally:
+            await self._release_lock_async(cache_key, resource)
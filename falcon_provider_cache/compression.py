@@ -0,0 +1,143 @@
+"""Cache value compression."""
+# standard library
+import zlib
+
+# compressed values: magic, codec id, compressed data
+_MAGIC = b'\xfcZ'
+
+
+class _ZlibCodec:
+    """Zlib codec (standard library)."""
+
+    codec_id = 1
+
+    def __init__(self, level: int | None = None):
+        """Initialize class properties."""
+        self.level = -1 if level is None else level
+
+    def compress(self, data: bytes) -> bytes:
+        """Return compressed data."""
+        return zlib.compress(data, self.level)
+
+    @staticmethod
+    def decompress(data: bytes) -> bytes:
+        """Return decompressed data."""
+        return zlib.decompress(data)
+
+
+class _ZstdCodec:
+    """Zstandard codec (requires zstandard)."""
+
+    codec_id = 2
+
+    def __init__(self, level: int | None = None):
+        """Initialize class properties."""
+        # third-party
+        import zstandard  # pylint: disable=import-outside-toplevel
+
+        self._compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        """Return compressed data."""
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Return decompressed data."""
+        return self._decompressor.decompress(data)
+
+
+class _Lz4Codec:
+    """LZ4 frame codec (requires lz4)."""
+
+    codec_id = 3
+
+    def __init__(self, level: int | None = None):
+        """Initialize class properties."""
+        # third-party
+        import lz4.frame  # pylint: disable=import-outside-toplevel
+
+        self._lz4 = lz4.frame
+        self.level = 0 if level is None else level
+
+    def compress(self, data: bytes) -> bytes:
+        """Return compressed data."""
+        return self._lz4.compress(data, compression_level=self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Return decompressed data."""
+        return self._lz4.decompress(data)
+
+
+class Compressor:
+    """Compress cache values larger than a size threshold.
+
+    Compressed values are tagged with a short prefix that identifies the codec, so compressed
+    and uncompressed values (and values compressed with different codecs) can coexist in the
+    cache. Values smaller than the threshold, or that do not get smaller when compressed, are
+    stored as is.
+
+    Args:
+        algorithm: The compression algorithm (zlib, zstd or lz4). The zstd and lz4 algorithms
+            require the zstandard and lz4 packages.
+        threshold: The minimum size (bytes) of a value to compress.
+        level: The compression level (codec specific).
+    """
+
+    codecs = {'lz4': _Lz4Codec, 'zlib': _ZlibCodec, 'zstd': _ZstdCodec}
+
+    def __init__(self, algorithm: str = 'zlib', threshold: int = 1024, level: int | None = None):
+        """Initialize class properties."""
+        try:
+            self.codec = self.codecs[algorithm](level)
+        except ImportError:  # pragma: no cover
+            print(
+                f'The {algorithm} compression algorithm requires an additional package '
+                'try "pip install falcon-provider-cache[compression]".'
+            )
+            raise
+        self.threshold = threshold
+        self._decoders = {self.codec.codec_id: self.codec}
+
+    def _decoder(self, codec_id: int) -> object:
+        """Return the codec used to decompress a value."""
+        decoder = self._decoders.get(codec_id)
+        if decoder is None:
+            for codec in self.codecs.values():
+                if codec.codec_id == codec_id:
+                    decoder = self._decoders.setdefault(codec_id, codec())
+                    break
+            else:
+                raise ValueError(f'Unknown compression codec ({codec_id}).')
+        return decoder
+
+    def compress(self, value: bytes | str) -> bytes | str:
+        """Return the compressed (tagged) value if larger than the threshold.
+
+        Args:
+            value: The cache value.
+
+        Returns:
+            bytes | str: The compressed value or the original value.
+        """
+        if len(value) < self.threshold:
+            return value
+
+        data = value.encode() if isinstance(value, str) else value
+        compressed = self.codec.compress(data)
+        if len(compressed) + 3 >= len(data):
+            return value
+        return b''.join((_MAGIC, bytes((self.codec.codec_id,)), compressed))
+
+    def decompress(self, value: bytes | str | None) -> bytes | str | None:
+        """Return the decompressed value if the value is compressed.
+
+        Args:
+            value: The cache value.
+
+        Returns:
+            bytes | str | None: The decompressed value or the original value.
+        """
+        if not isinstance(value, bytes) or value[:2] != _MAGIC:
+            return value
+        return self._decoder(value[2]).decompress(value[3:])
@@ -0,0 +1,130 @@
+"""Cache entry envelope."""
+# standard library
+import struct
+import time
+
+# envelope header: magic, version, status, created (epoch), expires (epoch), headers length,
+# body chunks
+_HEADER = struct.Struct('!2sBHddII')
+_HEADER_V2 = struct.Struct('!2sBHddI')
+_MAGIC = b'\xfcC'
+_VERSION = 3
+
+
+class CacheEntry:
+    """A cached response stored by the providers.
+
+    The entry is stored as a compact binary envelope containing the response status, the
+    selected response headers, the rendered body, the time the entry was created and the time
+    it expires (the soft expiry). The provider TTL can be longer than the soft expiry so stale
+    entries remain available for stale-while-revalidate and stale-if-error.
+
+    Large streamed responses are stored in chunks, the entry (manifest) then holds the stream id
+    as the body and the number of chunks (see falcon_provider_cache.streaming).
+
+    Args:
+        body: The rendered response body (or the stream id of a chunked body).
+        created: The time (epoch) the entry was created.
+        expires: The time (epoch) the entry becomes stale.
+        status: The response status code.
+        headers: The response headers as (name, value) pairs.
+        chunks: The number of body chunks (0 if the body is stored in the entry).
+    """
+
+    __slots__ = ('body', 'chunks', 'created', 'expires', 'headers', 'status')
+
+    def __init__(
+        self,
+        body: bytes,
+        created: float,
+        expires: float,
+        status: int = 200,
+        headers: tuple = (),
+        chunks: int = 0,
+    ):
+        """Initialize class properties."""
+        self.body = body
+        self.chunks = chunks
+        self.created = created
+        self.expires = expires
+        self.headers = headers
+        self.status = status
+
+    @classmethod
+    def create(
+        cls, body: bytes, timeout: int, status: int = 200, headers: tuple = (), chunks: int = 0
+    ) -> 'CacheEntry':
+        """Return a new entry that is fresh for timeout seconds.
+
+        Args:
+            body: The rendered response body (or the stream id of a chunked body).
+            timeout: The time (seconds) the entry is fresh.
+            status: The response status code.
+            headers: The response headers as (name, value) pairs.
+            chunks: The number of body chunks (0 if the body is stored in the entry).
+
+        Returns:
+            CacheEntry: The new entry.
+        """
+        now = time.time()
+        return cls(body, now, now + timeout, status, headers, chunks)
+
+    @property
+    def fresh(self) -> bool:
+        """Return True if the entry has not reached its soft expiry."""
+        return time.time() < self.expires
+
+    @property
+    def stale_for(self) -> float:
+        """Return the time (seconds) since the entry became stale (negative if fresh)."""
+        return time.time() - self.expires
+
+    def dumps(self) -> bytes:
+        """Return the entry serialized as an envelope.
+
+        Returns:
+            bytes: The serialized entry.
+        """
+        headers = '\r\n'.join(f'{k}:{v}' for k, v in self.headers).encode('latin-1')
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, self.status, self.created, self.expires, len(headers), self.chunks
+        )
+        return b''.join((header, headers, self.body))
+
+    @classmethod
+    def loads(cls, data: bytes | str) -> 'CacheEntry | None':
+        """Return an entry from serialized data.
+
+        Data that is not an envelope (e.g. a plain text body written by a previous version) is
+        returned as a fresh entry so the backend TTL still applies. Version 2 envelopes (without
+        chunks) are still read, envelopes with an unknown version are ignored (None).
+
+        Args:
+            data: The serialized entry.
+
+        Returns:
+            CacheEntry | None: The entry.
+        """
+        if isinstance(data, str):
+            return cls(data.encode(), 0, float('inf'))
+        if data[:2] != _MAGIC:
+            return cls(bytes(data), 0, float('inf'))
+
+        version = data[2]
+        if version == _VERSION:
+            header = _HEADER
+            _, _, status, created, expires, headers_length, chunks = header.unpack_from(data)
+        elif version == 2:
+            header, chunks = _HEADER_V2, 0
+            _, _, status, created, expires, headers_length = header.unpack_from(data)
+        else:
+            return None
+
+        offset = header.size + headers_length
+        headers = ()
+        if headers_length:
+            headers = tuple(
+                tuple(h.split(':', 1))
+                for h in bytes(data[header.size : offset]).decode('latin-1').split('\r\n')
+            )
+        return cls(bytes(data[offset:]), created, expires, status, headers, chunks)
@@ -0,0 +1,225 @@
+"""Fragment caching for resource helper functions."""
+# standard library
+import copy
+import functools
+import inspect
+from collections.abc import Callable
+
+# first-party
+from falcon_provider_cache.metrics import CacheMetrics
+
+
+class _BaseCachedFunction:
+    """Base class for cached functions (the cache keys and the descriptor protocol).
+
+    Args:
+        func: The function to cache.
+        provider: The cache provider.
+        timeout: The cache timeout value in seconds (default: the provider timeout).
+        key: A callable that takes the function arguments and returns the key suffix (default: a
+            hash of the arguments).
+        prefix: The cache key prefix (default: fragment:<module>.<qualified name>).
+        metrics: The metrics instance used to record cache backend errors.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        provider: object,
+        timeout: int | None = None,
+        key: Callable | None = None,
+        prefix: str | None = None,
+        metrics: CacheMetrics | None = None,
+    ):
+        """Initialize class properties."""
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.provider = provider
+        self.timeout = timeout
+        self.key_func = key
+        self.prefix = prefix or f'fragment:{func.__module__}.{func.__qualname__}'
+        self.metrics = metrics or CacheMetrics()
+
+    def key(self, *args, **kwargs) -> str:
+        """Return the cache key for the function arguments.
+
+        Returns:
+            str: The cache key.
+        """
+        if self.key_func is not None:
+            return f'{self.prefix}:{self.key_func(*args, **kwargs)}'
+        arguments = repr((args, sorted(kwargs.items()))).encode()
+        return f'{self.prefix}:{self.provider.key_hash(arguments)}'
+
+    def __get__(self, instance: object, owner: type | None = None) -> object:
+        """Return the cached function bound to the instance (decorated methods).
+
+        The instance is not part of the cache key, so the results are shared by all instances.
+        """
+        if instance is None:
+            return self
+        bound = copy.copy(self)
+        bound.func = self.func.__get__(instance, owner)
+        return bound
+
+    def _loads(self, keys: list, values: dict) -> dict:
+        """Return the deserialized cached values, values that can not be loaded are misses."""
+        loaded = {}
+        for key in keys:
+            if key in values:
+                try:
+                    loaded[key] = self.provider.deserialize(values[key])
+                except Exception:  # pylint: disable=broad-except
+                    self.metrics.record_error('deserialize')
+        return loaded
+
+
+class CachedFunction(_BaseCachedFunction):
+    """A function whose results are cached using a cache provider.
+
+    Use the ``cached`` decorator to create cached functions, see _BaseCachedFunction for the
+    arguments.
+    """
+
+    def __call__(self, *args, **kwargs) -> object:
+        """Return the cached result or call the function and cache the result."""
+        key = self.key(*args, **kwargs)
+        return self._results([key], {key: (args, kwargs)})[key]
+
+    def many(self, items: list) -> list:
+        """Return the results for multiple single argument calls using one cache round trip.
+
+        The cached results are read with a single provider get_many call and the missing results
+        are computed and written with a single provider set_many call.
+
+        .. code:: python
+
+            cards = user_card.many([user.id for user in users])
+
+        Args:
+            items: The argument of each call.
+
+        Returns:
+            list: The results in the order of the items.
+        """
+        calls = {self.key(item): ((item,), {}) for item in items}
+        results = self._results(list(calls), calls)
+        return [results[self.key(item)] for item in items]
+
+    def _results(self, keys: list, calls: dict) -> dict:
+        """Return the results keyed on the cache key, calling the function for misses."""
+        try:
+            values = self._loads(keys, self.provider.get_many(keys))
+        except Exception:  # pylint: disable=broad-except
+            # cache is best effort, call the function if the cache is not available
+            self.metrics.record_error('get_many')
+            values = {}
+
+        missing = {k: self.func(*calls[k][0], **calls[k][1]) for k in keys if k not in values}
+        if missing:
+            try:
+                mapping = {k: self.provider.serialize(v) for k, v in missing.items()}
+                self.provider.set_many(mapping, self.timeout)
+            except Exception:  # pylint: disable=broad-except
+                self.metrics.record_error('set_many')
+            values.update(missing)
+        return values
+
+    def invalidate(self, *args, **kwargs):
+        """Delete the cached result for the function arguments."""
+        self.provider.delete_many([self.key(*args, **kwargs)])
+
+
+class AsyncCachedFunction(_BaseCachedFunction):
+    """A coroutine function whose results are cached using an async cache provider.
+
+    Use the ``cached`` decorator to create cached functions, see _BaseCachedFunction for the
+    arguments.
+    """
+
+    async def __call__(self, *args, **kwargs) -> object:
+        """Return the cached result or call the function and cache the result."""
+        key = self.key(*args, **kwargs)
+        return (await self._results([key], {key: (args, kwargs)}))[key]
+
+    async def many(self, items: list) -> list:
+        """Return the results for multiple single argument calls using one cache round trip.
+
+        Args:
+            items: The argument of each call.
+
+        Returns:
+            list: The results in the order of the items.
+        """
+        calls = {self.key(item): ((item,), {}) for item in items}
+        results = await self._results(list(calls), calls)
+        return [results[self.key(item)] for item in items]
+
+    async def _results(self, keys: list, calls: dict) -> dict:
+        """Return the results keyed on the cache key, calling the function for misses."""
+        try:
+            values = self._loads(keys, await self.provider.get_many(keys))
+        except Exception:  # pylint: disable=broad-except
+            # cache is best effort, call the function if the cache is not available
+            self.metrics.record_error('get_many')
+            values = {}
+
+        missing = {}
+        for key in keys:
+            if key not in values:
+                missing[key] = await self.func(*calls[key][0], **calls[key][1])
+        if missing:
+            try:
+                mapping = {k: self.provider.serialize(v) for k, v in missing.items()}
+                await self.provider.set_many(mapping, self.timeout)
+            except Exception:  # pylint: disable=broad-except
+                self.metrics.record_error('set_many')
+            values.update(missing)
+        return values
+
+    async def invalidate(self, *args, **kwargs):
+        """Delete the cached result for the function arguments."""
+        await self.provider.delete_many([self.key(*args, **kwargs)])
+
+
+def cached(
+    provider: object,
+    timeout: int | None = None,
+    key: Callable | None = None,
+    prefix: str | None = None,
+    metrics: CacheMetrics | None = None,
+) -> Callable:
+    """Cache the results of a resource helper function.
+
+    Results are serialized with the provider value serializer. Coroutine functions must use an
+    async provider. The ``many`` method of the cached function reads and writes the results of
+    multiple calls in a single round trip. Methods can be decorated, the instance is not part of
+    the cache key.
+
+    .. code:: python
+
+        @cached(cache_provider, timeout=300, key=lambda user_id: user_id)
+        def user_card(user_id):
+            return render_user_card(user_id)
+
+        card = user_card(42)
+        cards = user_card.many([1, 2, 3])
+        user_card.invalidate(42)
+
+    Args:
+        provider: The cache provider.
+        timeout: The cache timeout value in seconds (default: the provider timeout).
+        key: A callable that takes the function arguments and returns the key suffix (default: a
+            hash of the arguments).
+        prefix: The cache key prefix (default: fragment:<module>.<qualified name>).
+        metrics: The metrics instance used to record cache backend errors.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable) -> CachedFunction | AsyncCachedFunction:
+        cls = AsyncCachedFunction if inspect.iscoroutinefunction(func) else CachedFunction
+        return cls(func, provider, timeout, key, prefix, metrics)
+
+    return decorator
@@ -0,0 +1,102 @@
+"""Cache key hash functions."""
+# standard library
+import hashlib
+from collections.abc import Callable
+
+
+def blake2b_hash(data: bytes) -> str:
+    """Return the 128-bit BLAKE2b hex digest of data."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def sha1_hash(data: bytes) -> str:
+    """Return the SHA1 hex digest of data (the key hash of previous versions)."""
+    return hashlib.sha1(data).hexdigest()  # nosec
+
+
+KEY_HASHES = {'blake2b': blake2b_hash, 'sha1': sha1_hash}
+
+
+def key_hasher(key_hash: str | Callable) -> Callable:
+    """Return the function used to hash cache keys.
+
+    Args:
+        key_hash: The hash name (blake2b, sha1 or xxhash) or a callable that takes the key
+            bytes and returns a string. The xxhash hash requires the xxhash package.
+
+    Returns:
+        Callable: The hash function.
+    """
+    if callable(key_hash):
+        return key_hash
+
+    if key_hash == 'xxhash':
+        try:
+            # third-party
+            import xxhash  # pylint: disable=import-outside-toplevel
+        except ImportError:  # pragma: no cover
+            print(
+                'The xxhash key hash requires the xxhash package '
+                'try "pip install falcon-provider-cache[xxhash]".'
+            )
+            raise
+        return xxhash.xxh3_128_hexdigest
+
+    try:
+        return KEY_HASHES[key_hash]
+    except KeyError as e:
+        raise ValueError(f'Unknown key hash ({key_hash}).') from e
+
+
+def _quality(param: str) -> float | None:
+    """Return the q-value of a header item parameter or None if not a q parameter."""
+    name, _, value = param.partition('=')
+    if name.strip().lower() != 'q':
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _negotiation_item(item: str) -> tuple[float, str] | None:
+    """Return the (negative q-value, token) of a content negotiation header item.
+
+    Items that are empty or not acceptable (q=0) return None.
+    """
+    token, *params = (p.strip() for p in item.split(';'))
+    quality = 1.0
+    media_params = []
+    for param in params:
+        q = _quality(param)
+        if q is None:
+            media_params.append(param.replace(' ', ''))
+        else:
+            quality = q
+    if not token or quality <= 0:
+        return None
+    return -quality, ';'.join([token, *media_params])
+
+
+def normalize_header(name: str, value: str | None) -> str | None:
+    """Return a normalized request header value for use in the cache key.
+
+    For content negotiation headers (Accept, Accept-Charset, Accept-Encoding and
+    Accept-Language) the items are lower cased, items with q=0 are removed and the items are
+    sorted by q-value and then by name, so equivalent headers share a cache entry (e.g.
+    "gzip, br" and "br;q=1.0, gzip"). Other header values have whitespace collapsed.
+
+    Args:
+        name: The lower case header name.
+        value: The header value.
+
+    Returns:
+        str | None: The normalized header value.
+    """
+    if value is None:
+        return None
+    if not name.startswith('accept'):
+        return ' '.join(value.split())
+
+    items = sorted(filter(None, map(_negotiation_item, value.lower().split(','))))
+    return ','.join(token if q == -1 else f'{token};q={-q:g}' for q, token in items)
@@ -0,0 +1,401 @@
+"""Host local cache providers (no cache server required)."""
+# standard library
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+
+# first-party
+from falcon_provider_cache.compression import Compressor
+from falcon_provider_cache.lru import LRUCache
+from falcon_provider_cache.serializers import Serializer
+from falcon_provider_cache.utils import CacheProvider
+
+# the maximum number of SQL variables per statement (SQLite < 3.32 limit)
+_SQL_VARIABLES = 999
+
+
+def _chunks(items: list, size: int = _SQL_VARIABLES):
+    """Yield the items in chunks of at most size items and the SQL placeholders for a chunk."""
+    for i in range(0, len(items), size):
+        chunk = items[i : i + size]
+        yield chunk, ','.join('?' * len(chunk))
+
+
+class MemoryCacheProvider(CacheProvider):
+    """Thread-safe in-process cache provider.
+
+    Entries are stored in an LRU cache with a per entry TTL, bounded by the number of entries
+    and the total size of the values. The cache is not shared between processes, use the
+    SQLiteCacheProvider to share a cache between the workers on a host.
+
+    Args:
+        cache_control: A dict containing the default cache control settings.
+        user_key: The falcon req.context attribute that contains the username or
+            userid that will be used if private cache is enabled.
+        max_entries: The maximum number of entries.
+        max_bytes: The maximum total size of the values in bytes.
+        compressor: A Compressor used to compress large cache values.
+        key_hash: The hash used for cache keys (blake2b, sha1, xxhash) or a callable.
+        value_serializer: The Serializer used to serialize cache values (default: json).
+    """
+
+    def __init__(
+        self,
+        cache_control: dict | None = None,
+        user_key: str | None = None,
+        max_entries: int = 4096,
+        max_bytes: int | None = 64 * 1024 * 1024,
+        compressor: Compressor | None = None,
+        key_hash: str | Callable = 'blake2b',
+        value_serializer: Serializer | None = None,
+    ):
+        """Initialize class properties."""
+        super().__init__(cache_control, user_key, compressor, key_hash, value_serializer)
+        self.cache = LRUCache(max_entries, max_bytes)
+        self._locks: dict[str, float] = {}
+        self._tags: dict[str, set[str]] = {}
+        # the number of keys in the tag indexes and the count that triggers a sweep
+        self._tagged = 0
+        self._sweep_at = 2 * max_entries
+        self._lock = threading.Lock()
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._locks.get(key, 0) > now:
+                return False
+            self._locks[key] = now + timeout
+            return True
+
+    def release_lock(self, key: str):
+        """Release the regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+        """
+        with self._lock:
+            self._locks.pop(key, None)
+
+    def get_cache(self, key: str) -> bytes | str | None:
+        """Return cache from memory.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Any: The cached data.
+        """
+        return self._decompress(self.cache.get(key))
+
+    def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
+        """Write cache to memory.
+
+        Args:
+            key: The cache key.
+            value: The cache value.
+            timeout: The cache timeout value in seconds.
+        """
+        self.cache.set(key, self._compress(value), timeout or self.timeout)
+
+    def get_many(self, keys: list) -> dict:
+        """Return multiple values.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        values = {}
+        for key in keys:
+            value = self.cache.get(key)
+            if value is not None:
+                values[key] = self._decompress(value)
+        return values
+
+    def delete_many(self, keys: list):
+        """Delete multiple values.
+
+        Args:
+            keys: The cache keys.
+        """
+        for key in keys:
+            self.cache.delete(key)
+
+    def _sweep_tags(self):
+        """Drop the keys no longer in the cache from the tag indexes (lock held by the caller).
+
+        The indexes are swept each time the number of keys they hold doubles, so the indexes
+        are bounded by the cache entries and a sweep is amortized over the added keys.
+        """
+        tags = {}
+        for tag, tag_keys in self._tags.items():
+            tag_keys = {k for k in tag_keys if k in self.cache}
+            if tag_keys:
+                tags[tag] = tag_keys
+        self._tags = tags
+        self._tagged = sum(len(k) for k in tags.values())
+        self._sweep_at = 2 * max(self._tagged, self.cache.max_entries)
+
+    def add_tags(self, keys: list, tags: list, timeout: int):  # pylint: disable=unused-argument
+        """Add the keys to the tag indexes.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+        with self._lock:
+            for tag in tags:
+                tag_keys = self._tags.setdefault(tag, set())
+                count = len(tag_keys)
+                tag_keys.update(keys)
+                self._tagged += len(tag_keys) - count
+            if self._tagged > self._sweep_at:
+                self._sweep_tags()
+
+    def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys.
+        """
+        keys = set()
+        with self._lock:
+            for tag in self.invalidation_tags(tags, paths):
+                tag_keys = self._tags.pop(tag, ())
+                self._tagged -= len(tag_keys)
+                keys.update(tag_keys)
+        self.delete_many(list(keys))
+        return list(keys)
+
+
+class SQLiteCacheProvider(CacheProvider):
+    """Cache provider backed by a SQLite database file shared by all processes on a host.
+
+    The database uses write-ahead logging so readers do not block the writer. Each thread (and
+    process) uses its own connection, so the provider can be created before the workers are
+    forked. Expired entries are purged periodically while writing. Use a path on a memory
+    backed file system (e.g. /dev/shm) to avoid disk I/O.
+
+    Args:
+        path: The database file path.
+        cache_control: A dict containing the default cache control settings.
+        user_key: The falcon req.context attribute that contains the username or
+            userid that will be used if private cache is enabled.
+        busy_timeout: The time (seconds) to wait for a database lock held by another process.
+        purge_interval: The number of writes between purges of the expired entries.
+        compressor: A Compressor used to compress large cache values.
+        key_hash: The hash used for cache keys (blake2b, sha1, xxhash) or a callable.
+        value_serializer: The Serializer used to serialize cache values (default: json).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        cache_control: dict | None = None,
+        user_key: str | None = None,
+        busy_timeout: float = 5,
+        purge_interval: int = 1000,
+        compressor: Compressor | None = None,
+        key_hash: str | Callable = 'blake2b',
+        value_serializer: Serializer | None = None,
+    ):
+        """Initialize class properties."""
+        super().__init__(cache_control, user_key, compressor, key_hash, value_serializer)
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.purge_interval = purge_interval
+        self._local = threading.local()
+        self._writes = 0
+        self._create()
+
+    def _create(self):
+        """Create the database tables."""
+        connection = self.connection
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS cache '
+            '(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL) WITHOUT ROWID'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS cache_tags (tag TEXT NOT NULL, key TEXT NOT NULL, '
+            'expires REAL NOT NULL, PRIMARY KEY (tag, key)) WITHOUT ROWID'
+        )
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Return the database connection of the current thread and process."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _purge(self, writes: int):
+        """Delete the expired entries every purge_interval writes."""
+        self._writes += writes
+        if self._writes >= self.purge_interval:
+            self._writes = 0
+            now = time.time()
+            self.connection.execute('DELETE FROM cache WHERE expires <= ?', (now,))
+            self.connection.execute('DELETE FROM cache_tags WHERE expires <= ?', (now,))
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a regeneration lock shared by all processes using a single upsert.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        now = time.time()
+        cursor = self.connection.execute(
+            'INSERT INTO cache (key, value, expires) VALUES (?, ?, ?) '
+            'ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires = excluded.expires '
+            'WHERE cache.expires <= ?',
+            (f'{key}.lock', b'1', now + timeout, now),
+        )
+        return cursor.rowcount == 1
+
+    def release_lock(self, key: str):
+        """Release the regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+        """
+        self.connection.execute('DELETE FROM cache WHERE key = ?', (f'{key}.lock',))
+
+    def get_cache(self, key: str) -> bytes | str | None:
+        """Return cache from the database.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Any: The cached data.
+        """
+        row = self.connection.execute(
+            'SELECT value FROM cache WHERE key = ? AND expires > ?', (key, time.time())
+        ).fetchone()
+        return None if row is None else self._decompress(row[0])
+
+    def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
+        """Write cache to the database.
+
+        Args:
+            key: The cache key.
+            value: The cache value.
+            timeout: The cache timeout value in seconds.
+        """
+        self.set_many({key: value}, timeout)
+
+    def get_many(self, keys: list) -> dict:
+        """Return multiple values.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        values, now = {}, time.time()
+        for chunk, placeholders in _chunks(keys, _SQL_VARIABLES - 1):
+            rows = self.connection.execute(
+                f'SELECT key, value FROM cache WHERE key IN ({placeholders}) '  # nosec
+                'AND expires > ?',
+                (*chunk, now),
+            )
+            values.update((k, self._decompress(v)) for k, v in rows)
+        return values
+
+    def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout in a single transaction.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        expires = time.time() + (timeout or self.timeout)
+        rows = []
+        for key, value in mapping.items():
+            value = self._compress(value)
+            rows.append((key, value.encode() if isinstance(value, str) else value, expires))
+        with self.connection as connection:
+            connection.execute('BEGIN')
+            connection.executemany('INSERT OR REPLACE INTO cache VALUES (?, ?, ?)', rows)
+        self._purge(len(rows))
+
+    def delete_many(self, keys: list):
+        """Delete multiple values.
+
+        Args:
+            keys: The cache keys.
+        """
+        for chunk, placeholders in _chunks(keys):
+            self.connection.execute(
+                f'DELETE FROM cache WHERE key IN ({placeholders})', chunk  # nosec
+            )
+
+    def add_tags(self, keys: list, tags: list, timeout: int):
+        """Add the keys to the tag index.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+        expires = time.time() + timeout
+        with self.connection as connection:
+            connection.execute('BEGIN')
+            connection.executemany(
+                'INSERT OR REPLACE INTO cache_tags VALUES (?, ?, ?)',
+                [(tag, key, expires) for tag in tags for key in keys],
+            )
+
+    def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys.
+        """
+        tags = self.invalidation_tags(tags, paths)
+        keys = set()
+        with self.connection as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            for chunk, placeholders in _chunks(tags):
+                rows = connection.execute(
+                    f'SELECT key FROM cache_tags WHERE tag IN ({placeholders})', chunk  # nosec
+                )
+                keys.update(row[0] for row in rows)
+                connection.execute(
+                    f'DELETE FROM cache_tags WHERE tag IN ({placeholders})', chunk  # nosec
+                )
+            for chunk, placeholders in _chunks(list(keys)):
+                connection.execute(
+                    f'DELETE FROM cache WHERE key IN ({placeholders})', chunk  # nosec
+                )
+        return list(keys)
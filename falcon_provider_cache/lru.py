@@ -0,0 +1,129 @@
+"""In-process LRU/TTL cache store."""
+# standard library
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUEntry:
+    """A single LRU cache entry.
+
+    Args:
+        value: The cached value.
+        expires: The monotonic time the entry expires.
+        size: The size of the value in bytes.
+    """
+
+    __slots__ = ('expires', 'size', 'value')
+
+    def __init__(self, value: object, expires: float, size: int):
+        """Initialize class properties."""
+        self.expires = expires
+        self.size = size
+        self.value = value
+
+
+class LRUCache:
+    """Thread-safe LRU cache with per entry TTL, bounded by entries and bytes.
+
+    Args:
+        max_entries: The maximum number of entries to store.
+        max_bytes: The maximum total size of the stored values in bytes (None for no limit).
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int | None = None):
+        """Initialize class properties."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, LRUEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries (including expired entries not yet evicted)."""
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if the key has an entry that has not expired (the LRU order is kept)."""
+        entry = self._data.get(key)
+        return entry is not None and entry.expires > time.monotonic()
+
+    @staticmethod
+    def sizeof(value: object) -> int:
+        """Return the approximate size of a value in bytes."""
+        if isinstance(value, bytes | bytearray | memoryview):
+            return len(value)
+        if isinstance(value, str):
+            return len(value.encode())
+        return sys.getsizeof(value)
+
+    def _evict(self):
+        """Evict least recently used entries until the cache is within its limits."""
+        while self._data and (
+            len(self._data) > self.max_entries
+            or (self.max_bytes is not None and self.size > self.max_bytes)
+        ):
+            _, entry = self._data.popitem(last=False)
+            self.size -= entry.size
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def delete(self, key: str):
+        """Remove an entry.
+
+        Args:
+            key: The cache key.
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self.size -= entry.size
+
+    def get(self, key: str) -> object | None:
+        """Return the value for key or None if missing or expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Any: The cached value.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= time.monotonic():
+                del self._data[key]
+                self.size -= entry.size
+                return None
+            self._data.move_to_end(key)
+            return entry.value
+
+    def set(self, key: str, value: object, timeout: float):
+        """Store a value.
+
+        Values larger than max_bytes are not stored.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+            timeout: The TTL of the entry in seconds.
+        """
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return
+
+        entry = LRUEntry(value, time.monotonic() + timeout, size)
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.size -= previous.size
+            self._data[key] = entry
+            self.size += size
+            self._evict()
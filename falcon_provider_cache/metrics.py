@@ -0,0 +1,152 @@
+"""Cache middleware metrics."""
+
+
+class CacheMetrics:
+    """No-op cache metrics base class.
+
+    Subclass and override the methods to export the cache metrics to a metrics backend. When no
+    metrics instance is provided to the middleware, no timing or size measurements are taken.
+    """
+
+    def record_result(self, route: str, result: str):
+        """Record the cache result for a request.
+
+        Args:
+            route: The route template of the request (e.g. /users/{user_id}).
+            result: The cache result (hit, miss, stale, bypass or error).
+        """
+
+    def record_error(self, operation: str):
+        """Record a cache backend error.
+
+        Args:
+            operation: The backend operation (e.g. get, set, lock, invalidate).
+        """
+
+    def observe_latency(self, operation: str, seconds: float):
+        """Record the latency of a cache backend operation.
+
+        Args:
+            operation: The backend operation (get or set).
+            seconds: The duration of the operation in seconds.
+        """
+
+    def observe_size(self, operation: str, size: int):
+        """Record the size of a payload read from or written to the cache backend.
+
+        Args:
+            operation: The backend operation (get or set).
+            size: The payload size in bytes.
+        """
+
+
+class PrometheusMetrics(CacheMetrics):
+    """Cache metrics exported using prometheus_client (requires prometheus-client).
+
+    Args:
+        namespace: The metric namespace.
+        registry: The prometheus registry (default: the global registry).
+    """
+
+    latency_buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+    size_buckets = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+    def __init__(self, namespace: str = 'falcon_cache', registry: object | None = None):
+        """Initialize class properties."""
+        try:
+            # third-party
+            import prometheus_client  # pylint: disable=import-outside-toplevel
+        except ImportError:  # pragma: no cover
+            print(
+                'PrometheusMetrics requires prometheus-client to be installed '
+                'try "pip install falcon-provider-cache[metrics]".'
+            )
+            raise
+
+        options = {'namespace': namespace, 'registry': registry or prometheus_client.REGISTRY}
+        self.results = prometheus_client.Counter(
+            'requests', 'Cache results per route.', ['route', 'result'], **options
+        )
+        self.errors = prometheus_client.Counter(
+            'errors', 'Cache backend errors.', ['operation'], **options
+        )
+        self.latency = prometheus_client.Histogram(
+            'backend_latency_seconds',
+            'Cache backend operation latency.',
+            ['operation'],
+            buckets=self.latency_buckets,
+            **options,
+        )
+        self.size = prometheus_client.Histogram(
+            'payload_bytes',
+            'Cache payload size.',
+            ['operation'],
+            buckets=self.size_buckets,
+            **options,
+        )
+
+    def record_result(self, route: str, result: str):
+        """Record the cache result for a request."""
+        self.results.labels(route, result).inc()
+
+    def record_error(self, operation: str):
+        """Record a cache backend error."""
+        self.errors.labels(operation).inc()
+
+    def observe_latency(self, operation: str, seconds: float):
+        """Record the latency of a cache backend operation."""
+        self.latency.labels(operation).observe(seconds)
+
+    def observe_size(self, operation: str, size: int):
+        """Record the size of a payload read from or written to the cache backend."""
+        self.size.labels(operation).observe(size)
+
+
+class OpenTelemetryMetrics(CacheMetrics):
+    """Cache metrics exported using OpenTelemetry (requires opentelemetry-api).
+
+    Args:
+        meter: The OpenTelemetry meter (default: a meter from the global meter provider).
+    """
+
+    def __init__(self, meter: object | None = None):
+        """Initialize class properties."""
+        try:
+            # third-party
+            from opentelemetry import metrics  # pylint: disable=import-outside-toplevel
+        except ImportError:  # pragma: no cover
+            print(
+                'OpenTelemetryMetrics requires opentelemetry-api to be installed '
+                'try "pip install falcon-provider-cache[metrics]".'
+            )
+            raise
+
+        meter = meter or metrics.get_meter('falcon_provider_cache')
+        self.results = meter.create_counter(
+            'cache.requests', unit='{request}', description='Cache results per route.'
+        )
+        self.errors = meter.create_counter(
+            'cache.errors', unit='{error}', description='Cache backend errors.'
+        )
+        self.latency = meter.create_histogram(
+            'cache.backend.duration', unit='s', description='Cache backend operation latency.'
+        )
+        self.size = meter.create_histogram(
+            'cache.payload.size', unit='By', description='Cache payload size.'
+        )
+
+    def record_result(self, route: str, result: str):
+        """Record the cache result for a request."""
+        self.results.add(1, {'route': route, 'result': result})
+
+    def record_error(self, operation: str):
+        """Record a cache backend error."""
+        self.errors.add(1, {'operation': operation})
+
+    def observe_latency(self, operation: str, seconds: float):
+        """Record the latency of a cache backend operation."""
+        self.latency.record(seconds, {'operation': operation})
+
+    def observe_size(self, operation: str, size: int):
+        """Record the size of a payload read from or written to the cache backend."""
+        self.size.record(size, {'operation': operation})
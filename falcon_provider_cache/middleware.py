@@ -1,18 +1,172 @@
 """Falcon cache provider middleware module."""
+# standard library
+import asyncio
+import dataclasses
+import datetime
+import hashlib
+import inspect
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 # third-party
 import falcon
+import falcon.asgi
+from falcon.util import sync_to_async
+
+# first-party
+from falcon_provider_cache.adaptive import FrequencySketch, adaptive_timeout
+from falcon_provider_cache.breaker import CircuitBreaker
+from falcon_provider_cache.coalesce import AsyncSingleFlight, CoalesceMixin, SingleFlight
+from falcon_provider_cache.entry import CacheEntry
+from falcon_provider_cache.metrics import CacheMetrics
+from falcon_provider_cache.streaming import StreamCacheMixin
+from falcon_provider_cache.warming import WarmingLog, warm_ahead
+from falcon_provider_cache.writer import AsyncWriteBehind, WriteBehind
+
+UNSAFE_METHODS = frozenset({'DELETE', 'PATCH', 'POST', 'PUT'})
+
+# the adaptive TTL state was not read with the entry
+_UNREAD = object()
 
 
-class CacheMiddleware:
+class CacheMiddleware(CoalesceMixin, StreamCacheMixin):
     """Cache middleware module.
 
+    The resolved cache policy for the resource is stored in ``req.context.cache_policy`` so
+    that no provider state is modified while handling a request.
+
+    The middleware supports both WSGI (``falcon.App``) and ASGI (``falcon.asgi.App``)
+    applications. For ASGI applications an async provider (e.g. AsyncRedisCacheProvider)
+    should be used so that cache lookups do not block the event loop, sync providers are
+    run in the default executor.
+
+    When the ``lock`` cache control is enabled concurrent misses for the same key are
+    coalesced. Within the process only the first request (the leader) runs the resource
+    responder while the other requests wait up to ``lock_wait`` seconds for the leader to
+    populate the cache. Across processes the leader also acquires a distributed lock from the
+    provider (e.g. Redis SET NX PX), leaders that do not get the lock poll the cache instead.
+
+    When ``stale_while_revalidate`` is set, stale entries are served immediately while the
+    resource responder is called in a background thread (WSGI) or task (ASGI) to refresh the
+    entry. When ``stale_if_error`` is set, stale entries are served if the resource responder
+    fails or returns a 5xx status.
+
+    The full response is cached: the status, the headers listed in the ``headers`` cache
+    control and the rendered body (``text``, ``data`` or ``media``). Cached responses are
+    served as raw bytes using ``resp.data``, so media is never serialized on a hit. Streamed
+    responses (``resp.stream``) are cached when the ``stream_max_size`` cache control is set,
+    the stream is written to the cache in ``stream_chunk_size`` chunks as it is sent and the
+    entry (manifest) is written once the stream completes. Hits are streamed chunk by chunk.
+    Caching is aborted without affecting the response when the stream exceeds the max size,
+    fails or the client disconnects.
+
+    When the ``etag`` cache control is enabled, cached responses get an ETag (content hash)
+    and Last-Modified header, and conditional requests (If-None-Match/If-Modified-Since) are
+    answered with a 304 Not Modified using a small metadata entry instead of the full entry.
+
+    When the ``cache_headers`` cache control is enabled, the Cache-Control (public/private,
+    max-age, s-maxage, stale-while-revalidate, stale-if-error), Expires and Age (on hits)
+    headers are set so downstream caches (browsers, CDNs, proxies) can cache the response. With
+    ``trust_request_cache_control`` enabled, request no-cache and no-store directives bypass
+    the cache.
+
+    When the ``vary`` cache control is set, the normalized request headers are part of the cache
+    key and the headers are added to the Vary response header.
+
+    When a ``metrics`` instance is provided, the cache result of each request is recorded per
+    route template along with the backend errors, latency and payload sizes.
+
+    When ``write_behind`` is enabled cache misses are written by a bounded background queue so
+    the cache write is not part of the response latency. Writes are dropped when the queue is
+    full. Responses regenerated while holding the ``lock`` are still written before the lock is
+    released so waiting requests find the entry.
+
+    When a ``circuit_breaker`` is provided, backend errors and operations over the
+    ``latency_budget`` are recorded and the cache is bypassed while the breaker is open.
+
+    When the ``tags`` or ``invalidate`` cache controls are set, cached entries are tagged and
+    successful unsafe requests (POST, PUT, PATCH, DELETE) invalidate the entries with the same
+    tags. With ``invalidate`` enabled entries are tagged with their path and parent paths, so
+    an unsafe request invalidates the entries for its path and all child paths.
+
+    When a ``warming_log`` is provided, cacheable requests are counted so the CacheWarmer can
+    replay the most requested entries. Requests replayed by the CacheWarmer regenerate entries
+    that expire within its refresh ahead time.
+
+    When the ``admit_after`` cache control is set, misses are counted in a frequency sketch
+    and the response is only written once the key was requested ``admit_after`` times, so
+    one-off requests do not evict hot entries. Warming requests are always written. When the
+    ``max_timeout`` cache control is set, the content hash and TTL of each entry are stored and
+    the TTL is doubled (up to max_timeout) when the entry is regenerated with the same content.
+
     Args:
         provider (CacheProvider): An instance of cache provider (memcache or Redis).
+        lock_poll_interval: The interval (seconds) used to poll the cache while another
+            process holds the regeneration lock.
+        refresh_workers: The maximum number of threads used to refresh stale entries.
+        metrics: A CacheMetrics instance (e.g. PrometheusMetrics) used to record the cache
+            results per route, backend errors, latency and payload sizes.
+        write_behind: If True cache writes are queued and written in batches by a background
+            thread (WSGI) or task (ASGI) instead of before the response is returned.
+        write_queue_size: The maximum number of queued writes, writes are dropped when full.
+        write_batch_size: The maximum number of queued writes written per batch.
+        circuit_breaker: A CircuitBreaker used to bypass the cache while the backend fails.
+        latency_budget: The maximum time (seconds) of a cache operation. Async operations are
+            cancelled when over budget, sync operations over budget count as breaker failures.
+        trust_request_cache_control: If True (or a callable that takes the request and returns
+            True for trusted clients) the request Cache-Control no-cache (skip the cache read)
+            and no-store (skip the cache read and write) directives are honored.
+        warming_log: A WarmingLog used to count the cacheable requests for cache warming.
+        stream_chunk_size: The size (bytes) of the chunks of cached streamed responses.
+        frequency_sketch: The FrequencySketch used to count misses for the admit_after cache
+            control (default: a sketch with 4096 counters per row).
     """
 
-    def __init__(self, provider: object):
+    def __init__(
+        self,
+        provider: object,
+        lock_poll_interval: float = 0.05,
+        refresh_workers: int = 4,
+        metrics: CacheMetrics | None = None,
+        write_behind: bool = False,
+        write_queue_size: int = 1024,
+        write_batch_size: int = 64,
+        circuit_breaker: CircuitBreaker | None = None,
+        latency_budget: float | None = None,
+        trust_request_cache_control: bool | Callable = False,
+        warming_log: WarmingLog | None = None,
+        stream_chunk_size: int = 1024 * 1024,
+        frequency_sketch: FrequencySketch | None = None,
+    ):
         """Initialize class properties."""
         self.provider = provider
+        self.frequency_sketch = frequency_sketch or FrequencySketch()
+        self.stream_chunk_size = stream_chunk_size
+        self.warming_log = warming_log
+        self.circuit_breaker = circuit_breaker
+        self.latency_budget = latency_budget
+        self.trust_request_cache_control = trust_request_cache_control
+        # latency and size measurements are only taken if a metrics instance is provided
+        self.metrics = metrics or CacheMetrics()
+        self._instrumented = metrics is not None
+        self.lock_poll_interval = lock_poll_interval
+        self._provider_async = inspect.iscoroutinefunction(provider.get_cache)
+        self._flights = SingleFlight()
+        self._flights_async = AsyncSingleFlight()
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=refresh_workers, thread_name_prefix='cache-refresh'
+        )
+        self._refresh_tasks: set[asyncio.Task] = set()
+        self._writer = self._writer_async = None
+        if write_behind:
+            options = {
+                'max_size': write_queue_size,
+                'batch_size': write_batch_size,
+                'metrics': self.metrics,
+            }
+            self._writer = WriteBehind(provider, **options)
+            self._writer_async = AsyncWriteBehind(provider, **options)
 
     def _testing(self, req):
         """Update req context with values for testing."""
@@ -20,57 +174,792 @@ class CacheMiddleware:
             # inject a test user_key for pytest monkeypatch
             req.context.user_key = self.user_key  # pylint: disable=no-member
 
+    def _log_error(self, resource: object, operation: str, message: str):
+        """Record a cache backend error and write it to the resource logger if available."""
+        self.metrics.record_error(operation)
+        if hasattr(resource, 'log'):
+            resource.log.error(f'[cache-provider] {message}')
+
+    def _request_directive(self, req: falcon.Request) -> str | None:
+        """Return the no-store or no-cache directive of a trusted request (if any)."""
+        cache_control = req.get_header('Cache-Control')
+        trusted = self.trust_request_cache_control
+        if not cache_control or not (trusted(req) if callable(trusted) else trusted):
+            return None
+
+        directives = {d.split('=', 1)[0].strip().lower() for d in cache_control.split(',')}
+        for directive in ('no-store', 'no-cache'):
+            if directive in directives:
+                return directive
+        return None
+
+    def _prepare(self, req: falcon.Request, resource: object, params: dict) -> str | None:
+        """Resolve the cache policy and tags, return the cache key if the request is cacheable."""
+        # for pytest testing
+        self._testing(req)
+
+        # resolve the (immutable) cache policy for the current resource and method
+        policy = self.provider.cache_policy(resource, req.method)
+        req.context.cache_policy = policy
+        req.context.cache_tags = self._tags(req, params, policy) if policy.tagged else ()
+
+        if policy.cacheable and self._available():
+            req.context.cache_directive = self._request_directive(req)
+            if req.context.cache_directive != 'no-store':
+                if self.warming_log is not None and warm_ahead(req) is None:
+                    self.warming_log.record(req, policy)
+                return self.provider.cache_key(req, resource, policy)
+        return None
+
+    def _tags(self, req: falcon.Request, params: dict, policy: object) -> tuple:
+        """Return the tags for the request.
+
+        Safe requests are tagged with their path and parent paths, unsafe requests only with
+        their path so that they invalidate the entries for the path and its child paths. Tags
+        with placeholders missing from the route params (e.g. a resource mounted on /users and
+        /users/{user_id}) are omitted.
+        """
+        if callable(policy.tags):
+            tags = list(policy.tags(req, params))
+        else:
+            tags = []
+            for tag in policy.tags:
+                try:
+                    tags.append(tag.format_map(params))
+                except (IndexError, KeyError):
+                    continue
+
+        if policy.invalidate:
+            path_tags = self.provider.path_tags(req.path)
+            tags.extend(path_tags[-1:] if req.method in UNSAFE_METHODS else path_tags)
+        return tuple(tags)
+
+    def _invalidates(self, req: falcon.Request, resp: falcon.Response, req_succeeded: bool) -> bool:
+        """Return True if the request should invalidate the entries for its tags."""
+        return (
+            req_succeeded
+            and req.method in UNSAFE_METHODS
+            and bool(req.context.get('cache_tags'))
+            and falcon.http_status_to_code(resp.status) < 400
+            and self._available()
+        )
+
+    @staticmethod
+    def _expiring(req: falcon.Request, entry: CacheEntry | None) -> bool:
+        """Return True if the entry expires within the refresh ahead time of a warming request."""
+        refresh_ahead = warm_ahead(req)
+        return entry is not None and refresh_ahead is not None and entry.stale_for >= -refresh_ahead
+
+    @staticmethod
+    def _check_stale(req: falcon.Request, resp: falcon.Response, entry: CacheEntry) -> bool:
+        """Return True if the stale entry should be served while it is refreshed."""
+        policy = req.context.cache_policy
+        stale_for = entry.stale_for
+        if stale_for < policy.stale_while_revalidate:
+            return True
+        if stale_for < policy.stale_if_error:
+            # keep the entry to serve in process_response if the responder fails
+            resp.context['cache_stale_entry'] = entry
+        return False
+
+    def _serve_cached(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+        entry: CacheEntry | None,
+        not_modified: bool,
+    ):
+        """Short-circuit the response with the cached entry.
+
+        The 304 decision is made once, when the entry is read, and stored in
+        ``req.context.cache_not_modified``. A metadata entry (no body) may expire before the
+        response is processed and is only ever replayed as a 304.
+        """
+        if entry is None:
+            return
+        req.context.cache_not_modified = not_modified or (
+            entry.fresh and req.context.cache_policy.etag and self._not_modified(req, entry)
+        )
+        resp.context['cache_entry'] = entry
+        resp.context['response_cached'] = True
+        resp.complete = True  # signal short-circuit for response processing
+
+    @staticmethod
+    def _conditional(req: falcon.Request) -> bool:
+        """Return True if the request is a conditional request."""
+        return bool(req.get_header('If-None-Match') or req.get_header('If-Modified-Since'))
+
+    @staticmethod
+    def _not_modified(req: falcon.Request, entry: CacheEntry) -> bool:
+        """Return True if the conditional request validators match the cached entry."""
+        headers = dict(entry.headers)
+        if req.if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since (weak comparison)
+            etag = headers.get('etag')
+            if etag is None:
+                return False
+            etag = falcon.ETag.loads(etag)
+            return any(t == '*' or str(t) == str(etag) for t in req.if_none_match)
+
+        last_modified = headers.get('last-modified')
+        if_modified_since = req.if_modified_since
+        if last_modified is None or if_modified_since is None:
+            return False
+        return falcon.http_date_to_dt(last_modified) <= if_modified_since
+
+    @staticmethod
+    def _set_vary(resp: falcon.Response, policy: object):
+        """Add the vary cache control headers to the Vary response header."""
+        if not policy.vary:
+            return
+        vary = [v.strip() for v in (resp.get_header('Vary') or '').split(',') if v.strip()]
+        existing = {v.lower() for v in vary}
+        vary.extend(
+            '-'.join(p.capitalize() for p in name.split('-'))
+            for name in policy.vary
+            if name not in existing
+        )
+        resp.set_header('Vary', ', '.join(vary))
+
+    @staticmethod
+    def _cache_control(policy: object, max_age: int) -> list[str]:
+        """Return the Cache-Control directives for the policy."""
+        directives = ['private' if policy.private else 'public', f'max-age={max_age}']
+        if policy.s_maxage is not None:
+            directives.append(f's-maxage={policy.s_maxage}')
+        if policy.stale_while_revalidate:
+            directives.append(f'stale-while-revalidate={policy.stale_while_revalidate}')
+        if policy.stale_if_error:
+            directives.append(f'stale-if-error={policy.stale_if_error}')
+        return directives
+
+    def _set_cache_headers(
+        self, resp: falcon.Response, policy: object, entry: CacheEntry | None = None
+    ):
+        """Set the Cache-Control, Expires and Age (cached entry) headers for the policy."""
+        if not policy.cache_headers or resp.get_header('Cache-Control') is not None:
+            return
+
+        status = falcon.http_status_to_code(resp.status)
+        if status >= 400:
+            max_age = policy.status_timeout(status) or 0
+        else:
+            max_age = policy.timeout if policy.max_age is None else policy.max_age
+        resp.cache_control = self._cache_control(policy, max_age)
+
+        created = time.time() if entry is None or not entry.created else entry.created
+        resp.expires = datetime.datetime.fromtimestamp(created + max_age, datetime.timezone.utc)
+        if entry is not None and entry.created:
+            resp.set_header('Age', str(max(0, int(time.time() - entry.created))))
+
+    def _validated(self, entry: CacheEntry | None, req: falcon.Request) -> CacheEntry | None:
+        """Return the metadata entry if it is fresh and matches the conditional request.
+
+        The returned entry has no body and must be served as a 304.
+        """
+        if entry is not None and entry.fresh and self._not_modified(req, entry):
+            return entry
+        return None
+
+    def _replay(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+        entry: CacheEntry,
+        resource: object,
+        not_modified: bool = False,
+    ):
+        """Write the cached entry (status, headers and raw body) or a 304 to the response."""
+        for name, value in entry.headers:
+            resp.set_header(name, value)
+        resp.set_header('X-Cache', 'HIT' if entry.fresh else 'STALE')
+        self._set_vary(resp, req.context.cache_policy)
+        self._set_cache_headers(resp, req.context.cache_policy, entry)
+        resp.text = None
+
+        if not_modified:
+            resp.status = falcon.HTTP_304
+            resp.data = None
+        else:
+            resp.status = entry.status
+            resp.data = None if entry.chunks else entry.body
+            resp.stream = self._chunk_stream(req, resp, entry, resource) if entry.chunks else None
+
+    @staticmethod
+    def _stored_headers(resp: falcon.Response, policy: object) -> tuple:
+        """Return the response headers stored with the cached response."""
+        headers = []
+        for name in sorted(policy.headers):
+            value = resp.get_header(name)
+            if value is not None:
+                headers.append((name, value))
+        return tuple(headers)
+
+    @staticmethod
+    def _entry_timeout(resp: falcon.Response, policy: object) -> int:
+        """Return the backend TTL of the entry for the response (including the stale time)."""
+        status = falcon.http_status_to_code(resp.status)
+        # error responses (negative caching) use the status TTL and are never served stale
+        if status >= 400:
+            return policy.status_timeout(status)
+        return policy.timeout + policy.stale_timeout
+
+    @staticmethod
+    def _add_validators(resp: falcon.Response, body: bytes):
+        """Add an ETag (content hash) and Last-Modified header to the response if not set."""
+        if resp.etag is None:
+            resp.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        if resp.last_modified is None:
+            resp.last_modified = datetime.datetime.now(datetime.timezone.utc)
+
+    def _cache_entries(
+        self,
+        cache_key: str,
+        resp: falcon.Response,
+        body: bytes,
+        policy: object,
+        chunks: int | None = None,
+    ) -> list[tuple[str, bytes, int]]:
+        """Return the (key, value, timeout) entries to write for the rendered response.
+
+        When the etag cache control is enabled, an ETag (content hash) and Last-Modified header
+        are added to the response if not already set, and a small metadata entry holding the
+        validators is written so conditional requests can be answered without the body.
+        Streamed responses (chunks is not None) were sent before the body was known, so only
+        the validators set by the resource are stored.
+        """
+        status = falcon.http_status_to_code(resp.status)
+        validators = policy.etag and status < 400
+        if validators and chunks is None:
+            self._add_validators(resp, body)
+
+        headers = self._stored_headers(resp, policy)
+        timeout = self._entry_timeout(resp, policy)
+        entry = CacheEntry.create(body, policy.status_timeout(status), status, headers, chunks or 0)
+        entries = [(cache_key, entry.dumps(), timeout)]
+        validators = validators and tuple(h for h in headers if h[0] in ('etag', 'last-modified'))
+        if validators:
+            meta = CacheEntry(b'', entry.created, entry.expires, entry.status, validators)
+            entries.append((f'{cache_key}.meta', meta.dumps(), timeout))
+        return entries
+
+    @staticmethod
+    def _status_timeout(resp: falcon.Response, policy: object) -> int | None:
+        """Return the TTL for the response status or None if the response is not cached."""
+        if not policy.cacheable:
+            return None
+        return policy.status_timeout(falcon.http_status_to_code(resp.status))
+
+    def _writable(self, req: falcon.Request, resp: falcon.Response, policy: object) -> bool:
+        """Return True if the response should be written to the cache.
+
+        Streamed responses require stream_max_size and keys are admitted once they were
+        requested admit_after times (warming requests are always admitted).
+        """
+        if req.context.get('cache_key') is None or (
+            resp.stream is not None and not policy.stream_max_size
+        ):
+            return False
+        if policy.admit_after <= 1 or warm_ahead(req) is not None:
+            return True
+        return self.frequency_sketch.increment(req.context.cache_key) >= policy.admit_after
+
+    @staticmethod
+    def _adaptive(resp: falcon.Response, policy: object) -> bool:
+        """Return True if the entry for the response uses an adaptive TTL."""
+        return policy.adaptive and falcon.http_status_to_code(resp.status) < 400
+
+    @staticmethod
+    def _adapted(
+        policy: object, cache_key: str, body: bytes, previous: bytes | str | None
+    ) -> tuple[object, list]:
+        """Return the policy with the adaptive TTL and the TTL state entry to write."""
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        timeout, state = adaptive_timeout(previous, digest, policy.timeout, policy.max_timeout)
+        # the state outlives the entry so the TTL keeps growing across regenerations
+        entry = (f'{cache_key}.ttl', state, 2 * policy.max_timeout)
+        return dataclasses.replace(policy, timeout=timeout), [entry]
+
+    def _serve_stale(
+        self, req: falcon.Request, resp: falcon.Response, resource: object, req_succeeded: bool
+    ) -> bool:
+        """Return True if the stale entry is served instead of the error (stale-if-error)."""
+        stale_entry = resp.context.get('cache_stale_entry')
+        if stale_entry is not None and (
+            not req_succeeded or falcon.http_status_to_code(resp.status) >= 500
+        ):
+            self._replay(req, resp, stale_entry, resource)
+            return True
+        return False
+
+    def _pending_write(
+        self, req: falcon.Request, resp: falcon.Response, resource: object, req_succeeded: bool
+    ) -> str | None:
+        """Update the response and return the cache key if the response should be cached."""
+        policy = req.context.get('cache_policy')
+        if policy is None or not policy.enabled:
+            return None
+
+        if self._serve_stale(req, resp, resource, req_succeeded):
+            return None
+
+        # error responses (e.g. a raised HTTPNotFound) are cached when listed in status_timeouts
+        status_timeout = self._status_timeout(resp, policy)
+        if not req_succeeded and status_timeout is None:
+            return None
+
+        resp.set_header('X-Cache', 'MISS')  # set x-cache header to default of no cache
+        if not policy.cacheable:
+            return None
+        self._set_vary(resp, policy)
+
+        if resp.context.get('cache_entry') is not None:
+            # set body to cached data and stop response
+            not_modified = req.context.get('cache_not_modified', False)
+            self._replay(req, resp, resp.context.get('cache_entry'), resource, not_modified)
+        elif status_timeout is not None:
+            if self._writable(req, resp, policy):
+                return req.context.get('cache_key')
+            # downstream caches may cache the response even if it is not written to the cache
+            self._set_cache_headers(resp, policy)
+        return None
+
+    def _observe(self, operation: str, start: float, value: bytes | str | None):
+        """Record the latency and payload size of a backend operation."""
+        self.metrics.observe_latency(operation, time.perf_counter() - start)
+        if value is not None:
+            self.metrics.observe_size(operation, len(value))
+
+    def _ttl_state(
+        self, req: falcon.Request, cache_key: str, values: dict, start: float
+    ) -> CacheEntry | None:
+        """Store the adaptive TTL state read with the entry and return the entry."""
+        cache_data = values.get(cache_key)
+        if self._instrumented:
+            self._observe('get', start, cache_data)
+        req.context.cache_ttl_state = values.get(f'{cache_key}.ttl')
+        return None if cache_data is None else CacheEntry.loads(cache_data)
+
+    def _record_result(self, req: falcon.Request, resp: falcon.Response):
+        """Record the cache result (hit, miss, stale, bypass or error) for the request route."""
+        policy = req.context.get('cache_policy')
+        if policy is None or not policy.enabled:
+            return
+
+        x_cache = resp.get_header('X-Cache')
+        if not policy.cacheable or req.context.get('cache_key') is None:
+            result = 'bypass'
+        elif x_cache is not None:
+            result = x_cache.lower()
+        else:
+            # the request failed and no stale entry was served
+            result = 'error'
+        self.metrics.record_result(req.uri_template or req.path, result)
+
+    @staticmethod
+    def _responder(req: falcon.Request, resource: object) -> object | None:
+        """Return the resource responder for the request method."""
+        return getattr(resource, f'on_{req.method.lower()}', None)
+
+    def _available(self) -> bool:
+        """Return True if the cache backend should be used (the circuit breaker is not open)."""
+        return self.circuit_breaker is None or self.circuit_breaker.allow()
+
+    def _call(self, method: str, *args) -> object:
+        """Call a provider method recording the outcome with the circuit breaker."""
+        if self.circuit_breaker is None:
+            return getattr(self.provider, method)(*args)
+
+        start = time.perf_counter()
+        try:
+            result = getattr(self.provider, method)(*args)
+        except Exception:
+            self.circuit_breaker.record_failure()
+            raise
+        self._record_outcome(start)
+        return result
+
+    def _record_outcome(self, start: float):
+        """Record a completed operation, operations over the latency budget are failures."""
+        if self.latency_budget is not None and time.perf_counter() - start > self.latency_budget:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def _get_value(self, cache_key: str, resource: object) -> bytes | str | None:
+        """Return the cached value or None if not cached or the cache is not available."""
+        start = time.perf_counter() if self._instrumented else 0
+        try:
+            cache_data = self._call('get_cache', cache_key)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            # cache is best effort, process normally if cache not available
+            self._log_error(resource, 'get', f'Failed reading from cache ({e}).')
+            return None
+        if self._instrumented:
+            self._observe('get', start, cache_data)
+        return cache_data
+
+    def _get_cache(self, cache_key: str, resource: object) -> CacheEntry | None:
+        """Return the cached entry or None if not cached or the cache is not available."""
+        cache_data = self._get_value(cache_key, resource)
+        return None if cache_data is None else CacheEntry.loads(cache_data)
+
+    def _read_entry(
+        self, req: falcon.Request, cache_key: str, resource: object
+    ) -> CacheEntry | None:
+        """Return the cached entry, reading the adaptive TTL state in the same round trip."""
+        if not req.context.cache_policy.adaptive:
+            return self._get_cache(cache_key, resource)
+
+        start = time.perf_counter() if self._instrumented else 0
+        try:
+            values = self._call('get_many', [cache_key, f'{cache_key}.ttl'])
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            # cache is best effort, process normally if cache not available
+            self._log_error(resource, 'get', f'Failed reading from cache ({e}).')
+            values = {}
+        return self._ttl_state(req, cache_key, values, start)
+
+    def _set_cache(self, cache_key: str, value: bytes, timeout: int, resource: object) -> bool:
+        """Write the entry to cache, return False if the write failed."""
+        start = time.perf_counter() if self._instrumented else 0
+        try:
+            self._call('set_cache', cache_key, value, timeout)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            # cache is best effort, process normally if cache not available
+            self._log_error(resource, 'set', f'Failed writing to cache ({e}).')
+            return False
+        if self._instrumented:
+            self._observe('set', start, value)
+        return True
+
+    def _delete(self, keys: list, resource: object):
+        """Delete the cache keys."""
+        try:
+            self._call('delete_many', keys)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'delete', f'Failed deleting from cache ({e}).')
+
+    def _tag_key(self, cache_key: str, req: falcon.Request, resource: object) -> str | None:
+        """Return the cache key for the request tags or None if the cache is not available."""
+        try:
+            return self._call('tag_key', cache_key, req.context.cache_tags)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'tag_key', f'Failed reading cache tags ({e}).')
+        return None
+
+    def _add_tags(self, keys: list, tags: tuple, timeout: int, resource: object):
+        """Add the written keys to the tag indexes."""
+        try:
+            self._call('add_tags', keys, tags, timeout)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'add_tags', f'Failed writing cache tags ({e}).')
+
+    def _invalidate(self, tags: tuple, resource: object):
+        """Invalidate the entries for the tags."""
+        try:
+            self._call('invalidate', list(tags))
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'invalidate', f'Failed invalidating cache ({e}).')
+
+    def _write(
+        self, req: falcon.Request, resp: falcon.Response, cache_key: str, body: bytes, resource
+    ):
+        """Write the cache entries (and tags) for the rendered response."""
+        policy, adaptive = req.context.cache_policy, []
+        if self._adaptive(resp, policy):
+            # the TTL state is read with the entry, unless the lookup was skipped (no-cache)
+            previous = req.context.get('cache_ttl_state', _UNREAD)
+            if previous is _UNREAD:
+                previous = self._get_value(f'{cache_key}.ttl', resource)
+            policy, adaptive = self._adapted(policy, cache_key, body, previous)
+        entries = self._cache_entries(cache_key, resp, body, policy)
+        self._set_cache_headers(resp, policy)
+        self._write_entries(req, entries + adaptive, resource)
+
+    def _write_entries(self, req: falcon.Request, entries: list, resource: object):
+        """Write the cache entries and add the keys to the request tags."""
+        if self._writer is not None and req.context.get('cache_lock') is None:
+            self._writer.put(entries, req.context.get('cache_tags'))
+            return
+
+        for entry in entries:
+            self._set_cache(*entry, resource)
+        if req.context.get('cache_tags'):
+            self._add_tags([e[0] for e in entries], req.context.cache_tags, entries[0][2], resource)
+
+    def _lookup(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+        resource: object,
+        params: dict,
+        cache_key: str,
+    ) -> CacheEntry | None:
+        """Return the cached entry to serve handling stale entries and coalescing."""
+        entry = self._read_entry(req, cache_key, resource)
+        if self._expiring(req, entry):
+            entry = None  # regenerate the entry
+        if entry is not None and not entry.fresh:
+            if not self._check_stale(req, resp, entry):
+                entry = None
+            elif self._responder(req, resource) is not None and (
+                self._flights.acquire(cache_key) is None
+            ):
+                refresh_req = self._refresh_request(req)
+                self._refresh_executor.submit(
+                    self._refresh, refresh_req, resource, params, cache_key
+                )
+
+        if entry is None and req.context.cache_policy.lock:
+            entry = self._coalesce(req, cache_key, resource)
+        return entry
+
     def process_resource(
         self, req: falcon.Request, resp: falcon.Response, resource: object, params: dict
-    ):  # pylint: disable=unused-argument
+    ):
         """Process the request after routing and provide caching service."""
-        # for pytest testing
-        self._testing(req)
+        if self._provider_async:
+            # the backend methods of async providers return coroutines only an ASGI app awaits
+            raise TypeError(f'{type(self.provider).__name__} requires a falcon.asgi.App.')
+        cache_key = self._prepare(req, resource, params)
+        if cache_key is not None and req.context.cache_tags:
+            cache_key = self._tag_key(cache_key, req, resource)
+        req.context.cache_key = cache_key
+        if cache_key is None or req.context.get('cache_directive') == 'no-cache':
+            return
 
-        # update the cache control for the current resource
-        cache_control = {}
-        if hasattr(resource, 'cache_control') and isinstance(resource.cache_control, dict):
-            cache_control = resource.cache_control
-
-        # update cache control
-        self.provider.cache_control(cache_control)
-
-        if self.provider.enabled:
-            cache_key = self.provider.cache_key(req, resource)
-            try:
-                cache_data = self.provider.get_cache(cache_key)
-            except Exception as e:  # pragma: no cover; pylint: disable=broad-except
-                # cache is best effort, process normally if cache not available
-                cache_data = None
-                if hasattr(resource, 'log'):
-                    resource.log.error(f'[cache-provider] Failed reading from cache ({e}).')
-
-            if cache_data is not None:
-                resp.context.setdefault('cache_data', cache_data)
-                resp.context['response_cached'] = True
-                resp.complete = True  # signal short-circuit for response processing
+        meta = None
+        if req.context.cache_policy.etag and self._conditional(req):
+            # answer conditional requests from the metadata entry
+            meta = self._validated(self._get_cache(f'{cache_key}.meta', resource), req)
+
+        if meta is not None:
+            self._serve_cached(req, resp, meta, True)
+        else:
+            entry = self._lookup(req, resp, resource, params, cache_key)
+            self._serve_cached(req, resp, entry, False)
 
     def process_response(
         self, req: falcon.Request, resp: falcon.Response, resource: object, req_succeeded: bool
     ):
         """Set or delete cache for provided resources."""
-        if not self.provider.enabled:
+        teed = False
+        try:
+            if self._invalidates(req, resp, req_succeeded):
+                self._invalidate(req.context.cache_tags, resource)
+            cache_key = self._pending_write(req, resp, resource, req_succeeded)
+            if cache_key is not None and resp.stream is not None:
+                # the tee releases the lock once the stream is cached
+                resp.stream = self._tee(req, resp, cache_key, resource)
+                teed = True
+            elif cache_key is not None and (body := resp.render_body()) is not None:
+                self._write(req, resp, cache_key, body, resource)
+        finally:
+            lock_key = req.context.get('cache_lock')
+            if lock_key is not None and not teed:
+                req.context.cache_lock = None
+                self._release_lock(lock_key, resource)
+            if self._instrumented:
+                self._record_result(req, resp)
+
+    async def _call_async(self, method: str, *args) -> object:
+        """Call a provider method from the event loop within the latency budget."""
+        if self._provider_async:
+            call = getattr(self.provider, method)(*args)
+        else:
+            call = sync_to_async(getattr(self.provider, method), *args)
+        if self.latency_budget is not None:
+            call = asyncio.wait_for(call, self.latency_budget)
+        if self.circuit_breaker is None:
+            return await call
+
+        start = time.perf_counter()
+        try:
+            result = await call
+        except Exception:
+            self.circuit_breaker.record_failure()
+            raise
+        self._record_outcome(start)
+        return result
+
+    async def _get_value_async(self, cache_key: str, resource: object) -> bytes | str | None:
+        """Return the cached value or None if not cached or the cache is not available."""
+        start = time.perf_counter() if self._instrumented else 0
+        try:
+            cache_data = await self._call_async('get_cache', cache_key)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            # cache is best effort, process normally if cache not available
+            self._log_error(resource, 'get', f'Failed reading from cache ({e}).')
+            return None
+        if self._instrumented:
+            self._observe('get', start, cache_data)
+        return cache_data
+
+    async def _get_cache_async(self, cache_key: str, resource: object) -> CacheEntry | None:
+        """Return the cached entry or None if not cached or the cache is not available."""
+        cache_data = await self._get_value_async(cache_key, resource)
+        return None if cache_data is None else CacheEntry.loads(cache_data)
+
+    async def _read_entry_async(
+        self, req: falcon.Request, cache_key: str, resource: object
+    ) -> CacheEntry | None:
+        """Return the cached entry, reading the adaptive TTL state in the same round trip."""
+        if not req.context.cache_policy.adaptive:
+            return await self._get_cache_async(cache_key, resource)
+
+        start = time.perf_counter() if self._instrumented else 0
+        try:
+            values = await self._call_async('get_many', [cache_key, f'{cache_key}.ttl'])
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            # cache is best effort, process normally if cache not available
+            self._log_error(resource, 'get', f'Failed reading from cache ({e}).')
+            values = {}
+        return self._ttl_state(req, cache_key, values, start)
+
+    async def _set_cache_async(
+        self, cache_key: str, value: bytes, timeout: int, resource: object
+    ) -> bool:
+        """Write the entry to cache, return False if the write failed."""
+        start = time.perf_counter() if self._instrumented else 0
+        try:
+            await self._call_async('set_cache', cache_key, value, timeout)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            # cache is best effort, process normally if cache not available
+            self._log_error(resource, 'set', f'Failed writing to cache ({e}).')
+            return False
+        if self._instrumented:
+            self._observe('set', start, value)
+        return True
+
+    async def _delete_async(self, keys: list, resource: object):
+        """Delete the cache keys."""
+        try:
+            await self._call_async('delete_many', keys)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'delete', f'Failed deleting from cache ({e}).')
+
+    async def _tag_key_async(
+        self, cache_key: str, req: falcon.Request, resource: object
+    ) -> str | None:
+        """Return the cache key for the request tags or None if the cache is not available."""
+        try:
+            return await self._call_async('tag_key', cache_key, req.context.cache_tags)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'tag_key', f'Failed reading cache tags ({e}).')
+        return None
+
+    async def _add_tags_async(self, keys: list, tags: tuple, timeout: int, resource: object):
+        """Add the written keys to the tag indexes."""
+        try:
+            await self._call_async('add_tags', keys, tags, timeout)
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'add_tags', f'Failed writing cache tags ({e}).')
+
+    async def _invalidate_async(self, tags: tuple, resource: object):
+        """Invalidate the entries for the tags."""
+        try:
+            await self._call_async('invalidate', list(tags))
+        except Exception as e:  # pragma: no cover; pylint: disable=broad-except
+            self._log_error(resource, 'invalidate', f'Failed invalidating cache ({e}).')
+
+    async def _write_async(
+        self, req: falcon.Request, resp: falcon.Response, cache_key: str, body: bytes, resource
+    ):
+        """Write the cache entries (and tags) for the rendered response."""
+        policy, adaptive = req.context.cache_policy, []
+        if self._adaptive(resp, policy):
+            # the TTL state is read with the entry, unless the lookup was skipped (no-cache)
+            previous = req.context.get('cache_ttl_state', _UNREAD)
+            if previous is _UNREAD:
+                previous = await self._get_value_async(f'{cache_key}.ttl', resource)
+            policy, adaptive = self._adapted(policy, cache_key, body, previous)
+        entries = self._cache_entries(cache_key, resp, body, policy)
+        self._set_cache_headers(resp, policy)
+        await self._write_entries_async(req, entries + adaptive, resource)
+
+    async def _write_entries_async(self, req: falcon.Request, entries: list, resource: object):
+        """Write the cache entries and add the keys to the request tags."""
+        if self._writer_async is not None and req.context.get('cache_lock') is None:
+            self._writer_async.put(entries, req.context.get('cache_tags'))
+            return
+
+        for entry in entries:
+            await self._set_cache_async(*entry, resource)
+        if req.context.get('cache_tags'):
+            keys = [e[0] for e in entries]
+            await self._add_tags_async(keys, req.context.cache_tags, entries[0][2], resource)
+
+    async def _lookup_async(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+        resource: object,
+        params: dict,
+        cache_key: str,
+    ) -> CacheEntry | None:
+        """Return the cached entry to serve handling stale entries and coalescing."""
+        entry = await self._read_entry_async(req, cache_key, resource)
+        if self._expiring(req, entry):
+            entry = None  # regenerate the entry
+        if entry is not None and not entry.fresh:
+            if not self._check_stale(req, resp, entry):
+                entry = None
+            elif self._responder(req, resource) is not None and (
+                self._flights_async.acquire(cache_key) is None
+            ):
+                refresh_req = self._refresh_request(req, asgi=True)
+                task = asyncio.create_task(
+                    self._refresh_async(refresh_req, resource, params, cache_key)
+                )
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+
+        if entry is None and req.context.cache_policy.lock:
+            entry = await self._coalesce_async(req, cache_key, resource)
+        return entry
+
+    async def process_resource_async(
+        self, req: falcon.Request, resp: falcon.Response, resource: object, params: dict
+    ):
+        """Process the request after routing and provide caching service (ASGI)."""
+        cache_key = self._prepare(req, resource, params)
+        if cache_key is not None and req.context.cache_tags:
+            cache_key = await self._tag_key_async(cache_key, req, resource)
+        req.context.cache_key = cache_key
+        if cache_key is None or req.context.get('cache_directive') == 'no-cache':
             return
 
-        if req_succeeded and self.provider.enabled:
-            resp.set_header('X-Cache', 'MISS')  # set x-cache header to default of no cache
-            cache_key: str = self.provider.cache_key(req, resource)
-
-            if req.method in self.provider.methods:
-                if resp.context.get('cache_data') is not None:
-                    # set body to cached data and stop response
-                    resp.set_header('X-Cache', 'HIT')  # update x-cache header for HIT (from cache)
-                    resp.text = resp.context.get('cache_data')
-                elif resp.text is not None:
-                    # cache data
-                    try:
-                        self.provider.set_cache(cache_key, resp.text)
-                    except Exception as e:  # pragma: no cover; pylint: disable=broad-except
-                        # cache is best effort, process normally if cache not available
-                        if hasattr(resource, 'log'):
-                            resource.log.error(f'[cache-provider] Failed writing to cache ({e}).')
+        meta = None
+        if req.context.cache_policy.etag and self._conditional(req):
+            # answer conditional requests from the metadata entry
+            meta = self._validated(await self._get_cache_async(f'{cache_key}.meta', resource), req)
+
+        if meta is not None:
+            self._serve_cached(req, resp, meta, True)
+        else:
+            entry = await self._lookup_async(req, resp, resource, params, cache_key)
+            self._serve_cached(req, resp, entry, False)
+
+    async def process_response_async(
+        self, req: falcon.Request, resp: falcon.Response, resource: object, req_succeeded: bool
+    ):
+        """Set or delete cache for provided resources (ASGI)."""
+        teed = False
+        try:
+            if self._invalidates(req, resp, req_succeeded):
+                await self._invalidate_async(req.context.cache_tags, resource)
+            cache_key = self._pending_write(req, resp, resource, req_succeeded)
+            if cache_key is not None and resp.stream is not None:
+                # the tee releases the lock once the stream is cached
+                resp.stream = self._tee_async(req, resp, cache_key, resource)
+                teed = True
+            elif cache_key is not None and (body := await resp.render_body()) is not None:
+                await self._write_async(req, resp, cache_key, body, resource)
+        finally:
+            lock_key = req.context.get('cache_lock')
+            if lock_key is not None and not teed:
+                req.context.cache_lock = None
+                await self._release_lock_async(lock_key, resource)
+            if self._instrumented:
+                self._record_result(req, resp)
@@ -0,0 +1,111 @@
+"""Resolved per-resource cache policy."""
+# standard library
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+
+# the response headers stored with cached responses by default
+DEFAULT_HEADERS = (
+    'content-disposition',
+    'content-encoding',
+    'content-language',
+    'content-type',
+    'etag',
+    'last-modified',
+)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Resolved cache control for a single resource and HTTP method.
+
+    Policies are immutable and shared across requests, so the middleware never has to mutate
+    provider state while handling a request.
+    """
+
+    method: str = 'GET'
+    admit_after: int = 0
+    cache_headers: bool = False
+    enabled: bool = False
+    etag: bool = False
+    headers: frozenset = frozenset(DEFAULT_HEADERS)
+    invalidate: bool = False
+    key_headers: tuple = ()
+    key_params: tuple | None = None
+    lock: bool = False
+    lock_timeout: int = 10
+    lock_wait: float = 1.0
+    max_age: int | None = None
+    max_timeout: int | None = None
+    methods: frozenset = frozenset({'GET'})
+    private: bool = False
+    s_maxage: int | None = None
+    stale_if_error: int = 0
+    stale_while_revalidate: int = 0
+    status_timeouts: tuple = ()
+    stream_max_size: int = 0
+    tags: tuple | Callable = ()
+    timeout: int = 60
+    use_query: bool = False
+    vary: tuple = ()
+
+    @property
+    def cacheable(self) -> bool:
+        """Return True if responses for the policy method should be read from/written to cache."""
+        return self.enabled and self.method in self.methods
+
+    @property
+    def tagged(self) -> bool:
+        """Return True if entries for the policy are tagged."""
+        return bool(self.tags) or self.invalidate
+
+    @property
+    def adaptive(self) -> bool:
+        """Return True if entries for the policy use an adaptive TTL (max_timeout)."""
+        return self.max_timeout is not None and self.max_timeout > self.timeout
+
+    @property
+    def stale_timeout(self) -> int:
+        """Return the time (seconds) a stale entry is kept after it expires."""
+        return max(self.stale_if_error, self.stale_while_revalidate)
+
+    def status_timeout(self, status: int) -> int | None:
+        """Return the TTL for a response status or None if the status is not cached.
+
+        Args:
+            status: The response status code.
+
+        Returns:
+            int | None: The TTL (seconds), the timeout for statuses below 400.
+        """
+        if status < 400:
+            return self.timeout
+        for code, timeout in self.status_timeouts:
+            if code == status:
+                return timeout
+        return None
+
+    @classmethod
+    def from_dict(cls, cache_control: dict, method: str) -> 'CachePolicy':
+        """Return a policy built from a fully merged cache control dict.
+
+        Args:
+            cache_control: The merged cache control settings.
+            method: The HTTP method the policy applies to.
+
+        Returns:
+            CachePolicy: The resolved policy.
+        """
+        settings = {f.name: cache_control[f.name] for f in fields(cls) if f.name in cache_control}
+        settings['methods'] = frozenset(m.upper() for m in settings.get('methods', ['GET']))
+        settings['headers'] = frozenset(h.lower() for h in settings.get('headers', DEFAULT_HEADERS))
+        settings['key_headers'] = tuple(sorted(h.lower() for h in settings.get('key_headers', ())))
+        settings['vary'] = tuple(sorted(h.lower() for h in settings.get('vary', ())))
+        if settings.get('key_params') is not None:
+            settings['key_params'] = tuple(sorted(settings['key_params']))
+        settings['status_timeouts'] = tuple(
+            sorted((int(k), v) for k, v in settings.get('status_timeouts', {}).items())
+        )
+        if not callable(settings.get('tags', ())):
+            settings['tags'] = tuple(settings['tags'])
+        settings['method'] = method
+        return cls(**settings)
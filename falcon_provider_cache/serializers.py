@@ -0,0 +1,220 @@
+"""Cache value serialization."""
+# standard library
+import io
+import json
+import pickle  # nosec
+
+# serialized values: magic, format id, serialized data
+_MAGIC = b'\xfcS'
+
+# the classes the pickle format loads by default ("module.name")
+PICKLE_ALLOWLIST = frozenset(
+    {
+        'builtins.bool',
+        'builtins.bytearray',
+        'builtins.bytes',
+        'builtins.complex',
+        'builtins.dict',
+        'builtins.float',
+        'builtins.frozenset',
+        'builtins.int',
+        'builtins.list',
+        'builtins.set',
+        'builtins.str',
+        'builtins.tuple',
+        'collections.OrderedDict',
+        'datetime.date',
+        'datetime.datetime',
+        'datetime.time',
+        'datetime.timedelta',
+        'datetime.timezone',
+        'decimal.Decimal',
+        'uuid.UUID',
+    }
+)
+
+
+class _RawCodec:
+    """Raw codec for bytes and str values."""
+
+    codec_id = 0
+
+    @staticmethod
+    def dumps(value: bytes | str) -> bytes:
+        """Return the serialized value."""
+        if isinstance(value, str):
+            return value.encode()
+        if not isinstance(value, bytes | bytearray | memoryview):
+            raise TypeError(f'The raw format does not support {type(value).__name__} values.')
+        return bytes(value)
+
+    @staticmethod
+    def loads(data: bytes) -> bytes:
+        """Return the deserialized value."""
+        return data
+
+
+class _JsonCodec:
+    """JSON codec (standard library)."""
+
+    codec_id = 1
+
+    @staticmethod
+    def dumps(value: object) -> bytes:
+        """Return the serialized value."""
+        return json.dumps(value, separators=(',', ':')).encode()
+
+    @staticmethod
+    def loads(data: bytes) -> object:
+        """Return the deserialized value."""
+        return json.loads(data)
+
+
+class _OrjsonCodec:
+    """JSON codec (requires orjson)."""
+
+    codec_id = 2
+
+    def __init__(self):
+        """Initialize class properties."""
+        # third-party
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self._orjson = orjson
+
+    def dumps(self, value: object) -> bytes:
+        """Return the serialized value."""
+        return self._orjson.dumps(value)
+
+    def loads(self, data: bytes) -> object:
+        """Return the deserialized value."""
+        return self._orjson.loads(data)
+
+
+class _MsgpackCodec:
+    """MessagePack codec (requires msgpack)."""
+
+    codec_id = 3
+
+    def __init__(self):
+        """Initialize class properties."""
+        # third-party
+        import msgpack  # pylint: disable=import-outside-toplevel
+
+        self._msgpack = msgpack
+
+    def dumps(self, value: object) -> bytes:
+        """Return the serialized value."""
+        return self._msgpack.packb(value)
+
+    def loads(self, data: bytes) -> object:
+        """Return the deserialized value."""
+        return self._msgpack.unpackb(data)
+
+
+class _AllowlistUnpickler(pickle.Unpickler):
+    """Unpickler that only loads allowed classes."""
+
+    def __init__(self, data: bytes, allowlist: frozenset):
+        """Initialize class properties."""
+        super().__init__(io.BytesIO(data))
+        self.allowlist = allowlist
+
+    def find_class(self, module: str, name: str) -> object:
+        """Return the class if allowed."""
+        if f'{module}.{name}' not in self.allowlist:
+            raise pickle.UnpicklingError(f'The class {module}.{name} is not allowed.')
+        return super().find_class(module, name)
+
+
+class _PickleCodec:
+    """Pickle codec that only loads allowed classes."""
+
+    codec_id = 4
+
+    def __init__(self, allowlist: frozenset = PICKLE_ALLOWLIST):
+        """Initialize class properties."""
+        self.allowlist = allowlist
+
+    @staticmethod
+    def dumps(value: object) -> bytes:
+        """Return the serialized value."""
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> object:
+        """Return the deserialized value."""
+        return _AllowlistUnpickler(data, self.allowlist).load()
+
+
+class Serializer:
+    """Serialize cache values.
+
+    Serialized values are tagged with a short prefix that identifies the format, so values are
+    always deserialized with the format they were written with and the format can be changed
+    without flushing the cache. Values that are not tagged (e.g. cached responses written by
+    the middleware) are returned as is.
+
+    Args:
+        name: The serialization format (raw, json, orjson, msgpack or pickle). The orjson and
+            msgpack formats require the orjson and msgpack packages.
+        allowlist: The classes ("module.name") the pickle format loads, other classes raise an
+            UnpicklingError (default: builtin, datetime, decimal and uuid types). Pickled values
+            are only loaded when the pickle format is configured.
+    """
+
+    codecs = {
+        'json': _JsonCodec,
+        'msgpack': _MsgpackCodec,
+        'orjson': _OrjsonCodec,
+        'pickle': _PickleCodec,
+        'raw': _RawCodec,
+    }
+
+    def __init__(self, name: str = 'json', allowlist: set | frozenset | None = None):
+        """Initialize class properties."""
+        try:
+            if name == 'pickle':
+                self.codec = _PickleCodec(frozenset(allowlist or PICKLE_ALLOWLIST))
+            else:
+                self.codec = self.codecs[name]()
+        except ImportError:  # pragma: no cover
+            print(f'The {name} serialization format requires an additional package.')
+            raise
+        self._decoders = {self.codec.codec_id: self.codec}
+
+    def _decoder(self, codec_id: int) -> object:
+        """Return the codec used to deserialize a value."""
+        decoder = self._decoders.get(codec_id)
+        if decoder is None:
+            for codec in self.codecs.values():
+                # pickled values are only loaded with a configured allowlist
+                if codec.codec_id == codec_id and codec is not _PickleCodec:
+                    decoder = self._decoders.setdefault(codec_id, codec())
+                    break
+            else:
+                raise ValueError(f'Unknown or disallowed serialization format ({codec_id}).')
+        return decoder
+
+    def dumps(self, value: object) -> bytes:
+        """Return the serialized (tagged) value.
+
+        Args:
+            value: The value to serialize.
+
+        Returns:
+            bytes: The serialized value.
+        """
+        return b''.join((_MAGIC, bytes((self.codec.codec_id,)), self.codec.dumps(value)))
+
+    def loads(self, value: bytes | str | None) -> object:
+        """Return the deserialized value if the value is serialized.
+
+        Args:
+            value: The cache value.
+
+        Returns:
+            object: The deserialized value or the original value.
+        """
+        if not isinstance(value, bytes) or value[:2] != _MAGIC:
+            return value
+        return self._decoder(value[2]).loads(value[3:])
@@ -0,0 +1,507 @@
+"""Consistent hashing multi-node cache provider."""
+# standard library
+import bisect
+import hashlib
+import logging
+import threading
+import time
+
+# first-party
+from falcon_provider_cache.async_utils import AsyncCacheProvider
+from falcon_provider_cache.metrics import CacheMetrics
+from falcon_provider_cache.utils import BaseCacheProvider, CacheProvider
+
+logger = logging.getLogger(__name__)
+
+
+def _ring_hash(value: str) -> int:
+    """Return the position of a value on the hash ring."""
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), 'big')
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes.
+
+    Each node is placed on the ring ``vnodes`` times so keys are evenly distributed and adding
+    or removing a node only remaps about 1/N of the keys.
+
+    Args:
+        nodes: The node names.
+        vnodes: The number of virtual nodes per node.
+    """
+
+    def __init__(self, nodes: list[str], vnodes: int = 160):
+        """Initialize class properties."""
+        points = sorted((_ring_hash(f'{node}#{i}'), node) for node in nodes for i in range(vnodes))
+        self._hashes = [p[0] for p in points]
+        self._nodes = [p[1] for p in points]
+        self.node_count = len(set(nodes))
+
+    def nodes_for(self, key: str):
+        """Yield the distinct nodes for a key in ring order (the first is the owner).
+
+        Args:
+            key: The cache key.
+
+        Yields:
+            str: The node name.
+        """
+        seen = set()
+        start = bisect.bisect(self._hashes, _ring_hash(key))
+        for i in range(len(self._nodes)):
+            node = self._nodes[(start + i) % len(self._nodes)]
+            if node not in seen:
+                seen.add(node)
+                yield node
+                if len(seen) == self.node_count:
+                    return
+
+
+class _ShardedMixin:
+    """The hash ring and node health of the sync and async sharded providers."""
+
+    def __init__(
+        self,
+        nodes: dict[str, BaseCacheProvider],
+        replicas: dict[str, BaseCacheProvider] | None = None,
+        vnodes: int = 160,
+        eject_after: int = 3,
+        eject_timeout: float = 30,
+        metrics: CacheMetrics | None = None,
+    ):
+        """Initialize class properties."""
+        provider = next(iter(nodes.values()))
+        super().__init__(
+            provider.cache_control(),
+            provider.user_key,
+            key_hash=provider.key_hash,
+            value_serializer=provider.serializer,
+        )
+        self.nodes = nodes
+        self.replicas = replicas or {}
+        self.ring = HashRing(list(nodes), vnodes)
+        self.eject_after = eject_after
+        self.eject_timeout = eject_timeout
+        self.metrics = metrics or CacheMetrics()
+        self._failures: dict[str, int] = {}
+        self._ejected: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _healthy(self, node: str) -> bool:
+        """Return True if the node is not ejected."""
+        ejected_until = self._ejected.get(node)
+        if ejected_until is None:
+            return True
+        if time.monotonic() >= ejected_until:
+            with self._lock:
+                self._ejected.pop(node, None)
+            return True
+        return False
+
+    def node_for(self, key: str) -> str:
+        """Return the name of the healthy node that owns the key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            str: The node name (the owner if all nodes are ejected).
+        """
+        owner = None
+        for node in self.ring.nodes_for(key):
+            owner = owner or node
+            if self._healthy(node):
+                return node
+        return owner
+
+    def _record(self, node: str, failed: bool):
+        """Record the result of a node operation, ejecting the node after repeated failures."""
+        if not failed:
+            if self._failures.get(node):
+                self._failures[node] = 0
+            return
+
+        with self._lock:
+            self._failures[node] = self._failures.get(node, 0) + 1
+            if self._failures[node] >= self.eject_after:
+                self._failures[node] = 0
+                self._ejected[node] = time.monotonic() + self.eject_timeout
+
+    def _group(self, keys: list) -> dict[str, list]:
+        """Return the keys grouped by node."""
+        groups: dict[str, list] = {}
+        for key in keys:
+            groups.setdefault(self.node_for(key), []).append(key)
+        return groups
+
+    def connect(self):
+        """Create the clients of the nodes and replicas and open a connection to each."""
+        for provider in [*self.nodes.values(), *self.replicas.values()]:
+            provider.connect()
+
+    def _replica(self, node: str) -> BaseCacheProvider | None:
+        """Return the replica of the node if it has one that is not ejected."""
+        replica = self.replicas.get(node)
+        if replica is None or not self._healthy(f'{node}:replica'):
+            return None
+        return replica
+
+    def _replica_failed(self, node: str, method: str, error: Exception):
+        """Record a failed replica read, ejecting the replica after repeated failures."""
+        self._record(f'{node}:replica', True)
+        self.metrics.record_error('replica')
+        logger.warning(
+            '[cache-provider] replica of %s failed on %s, reading from the node: %s',
+            node,
+            method,
+            error,
+        )
+
+
+class ShardedCacheProvider(_ShardedMixin, CacheProvider):
+    """Cache provider that distributes keys across multiple nodes using consistent hashing.
+
+    Each node is a cache provider (e.g. RedisCacheProvider or MemcacheProvider). Nodes that
+    fail ``eject_after`` consecutive operations are ejected for ``eject_timeout`` seconds and
+    their keys are served by the next node on the ring. Reads can optionally be sent to a
+    replica of the node (e.g. a Redis replica), falling back to the node if the replica fails.
+    Replica failures are logged and recorded as ``replica`` errors and replicas are ejected like
+    nodes.
+
+    .. code:: python
+
+        cache_provider = ShardedCacheProvider(
+            {
+                'cache-1': RedisCacheProvider(host='cache-1'),
+                'cache-2': RedisCacheProvider(host='cache-2'),
+            },
+            replicas={'cache-1': RedisCacheProvider(host='cache-1-replica')},
+        )
+
+    Args:
+        nodes: The node providers keyed on a stable node name (the name is hashed on the ring).
+        replicas: The replica providers used for reads keyed on the node name.
+        vnodes: The number of virtual nodes per node.
+        eject_after: The number of consecutive failures before a node is ejected.
+        eject_timeout: The time (seconds) a failed node is ejected.
+        metrics: The metrics instance used to record replica errors.
+    """
+
+    def _call(self, node: str, method: str, *args) -> object:
+        """Call a node provider method recording failures."""
+        try:
+            result = getattr(self.nodes[node], method)(*args)
+        except Exception:
+            self._record(node, True)
+            raise
+        self._record(node, False)
+        return result
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a distributed regeneration lock on the node that owns the key.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return self._call(self.node_for(key), 'acquire_lock', key, timeout)
+
+    def release_lock(self, key: str):
+        """Release the distributed regeneration lock on the node that owns the key.
+
+        Args:
+            key: The cache key.
+        """
+        self._call(self.node_for(key), 'release_lock', key)
+
+    def _read(self, node: str, method: str, *args) -> object:
+        """Read from the replica of the node (if any) falling back to the node."""
+        replica = self._replica(node)
+        if replica is not None:
+            try:
+                result = getattr(replica, method)(*args)
+            except Exception as e:  # pylint: disable=broad-except
+                self._replica_failed(node, method, e)
+            else:
+                self._record(f'{node}:replica', False)
+                return result
+        return self._call(node, method, *args)
+
+    def get_cache(self, key: str) -> bytes | str | None:
+        """Read cache from the replica (if any) or the node that owns the key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            bytes | str | None: The cached value.
+        """
+        return self._read(self.node_for(key), 'get_cache', key)
+
+    def get_many(self, keys: list) -> dict:
+        """Return multiple values, batched per node.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        values = {}
+        for node, node_keys in self._group(keys).items():
+            values.update(self._read(node, 'get_many', node_keys))
+        return values
+
+    def get_many_ttl(self, keys: list) -> dict:
+        """Return multiple values and their remaining TTL, batched per node.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The (value, TTL in seconds or None) keyed on the cache key.
+        """
+        values = {}
+        for node, node_keys in self._group(keys).items():
+            values.update(self._read(node, 'get_many_ttl', node_keys))
+        return values
+
+    def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
+        """Write cache to the node that owns the key.
+
+        Args:
+            key: The cache key.
+            value: The cache value.
+            timeout: The cache timeout value in seconds.
+        """
+        self._call(self.node_for(key), 'set_cache', key, value, timeout or self.timeout)
+
+    def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout, batched per node.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        for node, keys in self._group(list(mapping)).items():
+            self._call(node, 'set_many', {k: mapping[k] for k in keys}, timeout or self.timeout)
+
+    def delete_many(self, keys: list):
+        """Delete multiple values, batched per node.
+
+        Args:
+            keys: The cache keys.
+        """
+        for node, node_keys in self._group(keys).items():
+            self._call(node, 'delete_many', node_keys)
+
+    def tag_key(self, key: str, tags: list) -> str:
+        """Return the cache key for an entry with the provided tags.
+
+        Args:
+            key: The cache key.
+            tags: The entry tags.
+
+        Returns:
+            str: The cache key.
+        """
+        return self._call(self.node_for(key), 'tag_key', key, tags)
+
+    def add_tags(self, keys: list, tags: list, timeout: int):
+        """Add the keys to the tag indexes of the nodes that own the keys.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+        for node, node_keys in self._group(keys).items():
+            self._call(node, 'add_tags', node_keys, tags, timeout)
+
+    def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes on all nodes.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys.
+        """
+        keys, error = [], None
+        for node in self.nodes:
+            # ejected nodes are included, their entries would be served when they recover
+            try:
+                keys.extend(self._call(node, 'invalidate', tags, paths))
+            except Exception as e:  # pylint: disable=broad-except
+                error = e
+        if error is not None:
+            raise error
+        return keys
+
+
+class AsyncShardedCacheProvider(_ShardedMixin, AsyncCacheProvider):
+    """Consistent hashing multi-node cache provider for async providers.
+
+    See ShardedCacheProvider, the nodes and replicas must be async providers (e.g.
+    AsyncRedisCacheProvider).
+    """
+
+    async def _call(self, node: str, method: str, *args) -> object:
+        """Call a node provider method recording failures."""
+        try:
+            result = await getattr(self.nodes[node], method)(*args)
+        except Exception:
+            self._record(node, True)
+            raise
+        self._record(node, False)
+        return result
+
+    async def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a distributed regeneration lock on the node that owns the key.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return await self._call(self.node_for(key), 'acquire_lock', key, timeout)
+
+    async def release_lock(self, key: str):
+        """Release the distributed regeneration lock on the node that owns the key.
+
+        Args:
+            key: The cache key.
+        """
+        await self._call(self.node_for(key), 'release_lock', key)
+
+    async def _read(self, node: str, method: str, *args) -> object:
+        """Read from the replica of the node (if any) falling back to the node."""
+        replica = self._replica(node)
+        if replica is not None:
+            try:
+                result = await getattr(replica, method)(*args)
+            except Exception as e:  # pylint: disable=broad-except
+                self._replica_failed(node, method, e)
+            else:
+                self._record(f'{node}:replica', False)
+                return result
+        return await self._call(node, method, *args)
+
+    async def get_cache(self, key: str) -> bytes | str | None:
+        """Read cache from the replica (if any) or the node that owns the key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            bytes | str | None: The cached value.
+        """
+        return await self._read(self.node_for(key), 'get_cache', key)
+
+    async def get_many(self, keys: list) -> dict:
+        """Return multiple values, batched per node.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        values = {}
+        for node, node_keys in self._group(keys).items():
+            values.update(await self._read(node, 'get_many', node_keys))
+        return values
+
+    async def get_many_ttl(self, keys: list) -> dict:
+        """Return multiple values and their remaining TTL, batched per node.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The (value, TTL in seconds or None) keyed on the cache key.
+        """
+        values = {}
+        for node, node_keys in self._group(keys).items():
+            values.update(await self._read(node, 'get_many_ttl', node_keys))
+        return values
+
+    async def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
+        """Write cache to the node that owns the key.
+
+        Args:
+            key: The cache key.
+            value: The cache value.
+            timeout: The cache timeout value in seconds.
+        """
+        await self._call(self.node_for(key), 'set_cache', key, value, timeout or self.timeout)
+
+    async def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout, batched per node.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        for node, keys in self._group(list(mapping)).items():
+            mapping_ = {k: mapping[k] for k in keys}
+            await self._call(node, 'set_many', mapping_, timeout or self.timeout)
+
+    async def delete_many(self, keys: list):
+        """Delete multiple values, batched per node.
+
+        Args:
+            keys: The cache keys.
+        """
+        for node, node_keys in self._group(keys).items():
+            await self._call(node, 'delete_many', node_keys)
+
+    async def tag_key(self, key: str, tags: list) -> str:
+        """Return the cache key for an entry with the provided tags.
+
+        Args:
+            key: The cache key.
+            tags: The entry tags.
+
+        Returns:
+            str: The cache key.
+        """
+        return await self._call(self.node_for(key), 'tag_key', key, tags)
+
+    async def add_tags(self, keys: list, tags: list, timeout: int):
+        """Add the keys to the tag indexes of the nodes that own the keys.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+        for node, node_keys in self._group(keys).items():
+            await self._call(node, 'add_tags', node_keys, tags, timeout)
+
+    async def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes on all nodes.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys.
+        """
+        keys, error = [], None
+        for node in self.nodes:
+            # ejected nodes are included, their entries would be served when they recover
+            try:
+                keys.extend(await self._call(node, 'invalidate', tags, paths))
+            except Exception as e:  # pylint: disable=broad-except
+                error = e
+        if error is not None:
+            raise error
+        return keys
@@ -0,0 +1,352 @@
+"""Streamed response caching."""
+# standard library
+import inspect
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterator
+from functools import partial
+
+# third-party
+import falcon
+import falcon.asgi
+
+# first-party
+from falcon_provider_cache.entry import CacheEntry
+
+
+def chunk_keys(cache_key: str, stream_id: bytes, chunks: int) -> list[str]:
+    """Return the cache keys of the body chunks of a streamed response.
+
+    Args:
+        cache_key: The cache key of the entry (manifest).
+        stream_id: The stream id stored as the body of the entry.
+        chunks: The number of chunks.
+
+    Returns:
+        list[str]: The chunk keys.
+    """
+    prefix = f'{cache_key}.chunk.{stream_id.decode()}'
+    return [f'{prefix}.{i}' for i in range(chunks)]
+
+
+class ChunkBuffer:
+    """Split the blocks of a streamed response into fixed size chunks.
+
+    Each regeneration of a stream uses a new stream id in the chunk keys, so readers of a
+    previous entry never read the chunks of the stream being written. Bodies smaller than a
+    chunk are not chunked and are stored in the entry.
+
+    Args:
+        cache_key: The cache key of the entry (manifest).
+        chunk_size: The size (bytes) of a chunk.
+        max_size: The maximum size (bytes) of the stream, larger streams are not cached.
+    """
+
+    def __init__(self, cache_key: str, chunk_size: int, max_size: int):
+        """Initialize class properties."""
+        self.cache_key = cache_key
+        self.chunk_size = chunk_size
+        self.max_size = max_size
+        self.stream_id = uuid.uuid4().hex.encode()
+        self.aborted = False
+        self.keys: list[str] = []
+        self.size = 0
+        self.started = time.monotonic()
+        self._buffer = bytearray()
+
+    def _chunk(self, value: bytes) -> tuple[str, bytes]:
+        """Return the (key, value) of the next chunk."""
+        key = f'{self.cache_key}.chunk.{self.stream_id.decode()}.{len(self.keys)}'
+        self.keys.append(key)
+        return key, value
+
+    def abort(self):
+        """Stop caching the stream (e.g. the stream exceeded the max size)."""
+        self.aborted = True
+        self._buffer.clear()
+
+    def add(self, block: bytes | str) -> list[tuple[str, bytes]]:
+        """Add a block of the stream and return the full chunks to write.
+
+        Args:
+            block: The block sent to the client.
+
+        Returns:
+            list[tuple[str, bytes]]: The chunk keys and values.
+        """
+        if self.aborted:
+            return []
+        if isinstance(block, str):
+            block = block.encode()
+        self.size += len(block)
+        if self.size > self.max_size:
+            self.abort()
+            return []
+
+        self._buffer += block
+        chunks = []
+        while len(self._buffer) >= self.chunk_size:
+            chunks.append(self._chunk(bytes(self._buffer[: self.chunk_size])))
+            del self._buffer[: self.chunk_size]
+        return chunks
+
+    def finish(self) -> tuple[bytes, list[tuple[str, bytes]]]:
+        """Return the body of the entry and the last chunk to write.
+
+        Returns:
+            tuple[bytes, list[tuple[str, bytes]]]: The entry body (the whole body if the stream
+                was not chunked or the stream id) and the chunk keys and values.
+        """
+        remainder = bytes(self._buffer)
+        self._buffer.clear()
+        if not self.keys:
+            return remainder, []
+        return self.stream_id, [self._chunk(remainder)] if remainder else []
+
+    @property
+    def elapsed(self) -> int:
+        """Return the time (seconds) since the stream started."""
+        return int(time.monotonic() - self.started)
+
+
+def _blocks(stream: object, size: int) -> Iterator:
+    """Yield the blocks of a file-like object or an iterable closing file-like objects."""
+    if not hasattr(stream, 'read'):
+        yield from stream
+        return
+    try:
+        while True:
+            block = stream.read(size)
+            if not block:
+                break
+            yield block
+    finally:
+        if hasattr(stream, 'close'):
+            stream.close()
+
+
+async def _blocks_async(stream: object, size: int) -> AsyncIterator:
+    """Yield the blocks of an async file-like object or async iterable."""
+    if not hasattr(stream, 'read'):
+        async for block in stream:
+            yield block
+        return
+    try:
+        while True:
+            block = await stream.read(size)
+            if not block:
+                break
+            yield block
+    finally:
+        if hasattr(stream, 'close'):
+            result = stream.close()
+            if inspect.isawaitable(result):
+                await result
+
+
+def tee(
+    stream: object,
+    buffer: ChunkBuffer,
+    write: Callable,
+    complete: Callable,
+    discard: Callable,
+    release: Callable | None = None,
+) -> Iterator[bytes]:
+    """Yield the blocks of a stream while writing the chunks to the cache.
+
+    Args:
+        stream: The response stream (a file-like object or an iterable).
+        buffer: The chunk buffer for the stream.
+        write: Called with the chunk key and value, returns False if the write failed.
+        complete: Called with the buffer when the stream was sent and cached.
+        discard: Called with the written chunk keys when caching was aborted.
+        release: Called once the stream was cached or caching was aborted (e.g. to release the
+            regeneration lock).
+
+    Yields:
+        bytes: The blocks of the stream.
+    """
+    completed = False
+    try:
+        for block in _blocks(stream, buffer.chunk_size):
+            yield block
+            for key, value in buffer.add(block):
+                if not write(key, value):
+                    buffer.abort()
+        completed = not buffer.aborted
+    finally:
+        try:
+            # the client disconnected, the stream failed or the stream is too large
+            if completed:
+                complete(buffer)
+            elif buffer.keys:
+                discard(buffer.keys)
+        finally:
+            if release is not None:
+                release()
+
+
+async def tee_async(
+    stream: object,
+    buffer: ChunkBuffer,
+    write: Callable,
+    complete: Callable,
+    discard: Callable,
+    release: Callable | None = None,
+) -> AsyncIterator[bytes]:
+    """Yield the blocks of an async stream while writing the chunks to the cache.
+
+    Args:
+        stream: The response stream (an async file-like object or an async iterable).
+        buffer: The chunk buffer for the stream.
+        write: Coroutine called with the chunk key and value, returns False if the write failed.
+        complete: Coroutine called with the buffer when the stream was sent and cached.
+        discard: Coroutine called with the written chunk keys when caching was aborted.
+        release: Coroutine called once the stream was cached or caching was aborted.
+
+    Yields:
+        bytes: The blocks of the stream.
+    """
+    completed = False
+    try:
+        async for block in _blocks_async(stream, buffer.chunk_size):
+            yield block
+            for key, value in buffer.add(block):
+                if not await write(key, value):
+                    buffer.abort()
+        completed = not buffer.aborted
+    finally:
+        try:
+            if completed:
+                await complete(buffer)
+            elif buffer.keys:
+                await discard(buffer.keys)
+        finally:
+            if release is not None:
+                await release()
+
+
+class StreamCacheMixin:
+    """Streamed response caching of the CacheMiddleware.
+
+    The methods use the cache read and write methods of the middleware, which write and read
+    the chunks with the same error handling as any other cache entry.
+    """
+
+    def _chunk_stream(
+        self, req: falcon.Request, resp: falcon.Response, entry: CacheEntry, resource: object
+    ) -> Iterator[bytes] | AsyncIterator[bytes]:
+        """Return the stream reading the body chunks of a chunked entry."""
+        keys = chunk_keys(req.context.cache_key, entry.body, entry.chunks)
+        if isinstance(resp, falcon.asgi.Response):
+            return self._read_chunks_async(req.context.cache_key, keys, resource)
+        return self._read_chunks(req.context.cache_key, keys, resource)
+
+    def _tee(
+        self, req: falcon.Request, resp: falcon.Response, cache_key: str, resource: object
+    ) -> Iterator[bytes]:
+        """Return the response stream writing the streamed body to the cache as it is sent."""
+        policy = req.context.cache_policy
+        self._set_cache_headers(resp, policy)
+        buffer = ChunkBuffer(cache_key, self.stream_chunk_size, policy.stream_max_size)
+        return tee(
+            resp.stream,
+            buffer,
+            partial(self._set_cache, timeout=self._entry_timeout(resp, policy), resource=resource),
+            partial(self._complete_stream, req, resp, resource=resource),
+            partial(self._delete, resource=resource),
+            partial(self._release_stream, req, resource),
+        )
+
+    def _stream_entries(
+        self, req: falcon.Request, resp: falcon.Response, buffer: ChunkBuffer
+    ) -> tuple[list, list]:
+        """Return the last chunks and the entries to write for a completed stream."""
+        body, chunks = buffer.finish()
+        policy = req.context.cache_policy
+        entries = self._cache_entries(buffer.cache_key, resp, body, policy, len(buffer.keys))
+        if buffer.keys:
+            # the entry must not outlive the first chunk
+            entries = [(k, v, t - buffer.elapsed) for k, v, t in entries]
+        if entries[0][2] <= 0:
+            buffer.abort()
+        return chunks, entries
+
+    def _complete_stream(
+        self, req: falcon.Request, resp: falcon.Response, buffer: ChunkBuffer, resource: object
+    ):
+        """Write the last chunk and the entry (manifest) of a streamed response."""
+        chunks, entries = self._stream_entries(req, resp, buffer)
+        for key, value in chunks:
+            if buffer.aborted or not self._set_cache(key, value, entries[0][2], resource):
+                buffer.abort()
+        if buffer.aborted:
+            self._delete(buffer.keys, resource)
+        else:
+            self._write_entries(req, entries, resource)
+
+    def _release_stream(self, req: falcon.Request, resource: object):
+        """Release the regeneration lock once the stream is cached (or caching was aborted)."""
+        lock_key = req.context.get('cache_lock')
+        if lock_key is not None:
+            req.context.cache_lock = None
+            self._release_lock(lock_key, resource)
+
+    def _read_chunks(self, cache_key: str, keys: list, resource: object) -> Iterator[bytes]:
+        """Yield the body chunks of an entry, a missing chunk deletes the entry and fails."""
+        for key in keys:
+            value = self._get_value(key, resource)
+            if value is None:
+                self._delete([cache_key], resource)
+                raise RuntimeError(f'The cached response chunk {key} is missing.')
+            yield value.encode() if isinstance(value, str) else bytes(value)
+
+    def _tee_async(
+        self, req: falcon.Request, resp: falcon.Response, cache_key: str, resource: object
+    ) -> AsyncIterator[bytes]:
+        """Return the response stream writing the streamed body to the cache as it is sent."""
+        policy = req.context.cache_policy
+        self._set_cache_headers(resp, policy)
+        buffer = ChunkBuffer(cache_key, self.stream_chunk_size, policy.stream_max_size)
+        timeout = self._entry_timeout(resp, policy)
+        return tee_async(
+            resp.stream,
+            buffer,
+            partial(self._set_cache_async, timeout=timeout, resource=resource),
+            partial(self._complete_stream_async, req, resp, resource=resource),
+            partial(self._delete_async, resource=resource),
+            partial(self._release_stream_async, req, resource),
+        )
+
+    async def _complete_stream_async(
+        self, req: falcon.Request, resp: falcon.Response, buffer: ChunkBuffer, resource: object
+    ):
+        """Write the last chunk and the entry (manifest) of a streamed response."""
+        chunks, entries = self._stream_entries(req, resp, buffer)
+        for key, value in chunks:
+            if buffer.aborted or not await self._set_cache_async(
+                key, value, entries[0][2], resource
+            ):
+                buffer.abort()
+        if buffer.aborted:
+            await self._delete_async(buffer.keys, resource)
+        else:
+            await self._write_entries_async(req, entries, resource)
+
+    async def _release_stream_async(self, req: falcon.Request, resource: object):
+        """Release the regeneration lock once the stream is cached (or caching was aborted)."""
+        lock_key = req.context.get('cache_lock')
+        if lock_key is not None:
+            req.context.cache_lock = None
+            await self._release_lock_async(lock_key, resource)
+
+    async def _read_chunks_async(
+        self, cache_key: str, keys: list, resource: object
+    ) -> AsyncIterator[bytes]:
+        """Yield the body chunks of an entry, a missing chunk deletes the entry and fails."""
+        for key in keys:
+            value = await self._get_value_async(key, resource)
+            if value is None:
+                await self._delete_async([cache_key], resource)
+                raise RuntimeError(f'The cached response chunk {key} is missing.')
+            yield value.encode() if isinstance(value, str) else bytes(value)
@@ -0,0 +1,326 @@
+"""Two tier cache providers with an in-process LRU (L1) tier."""
+# first-party
+from falcon_provider_cache.async_utils import AsyncCacheProvider
+from falcon_provider_cache.lru import LRUCache
+from falcon_provider_cache.utils import CacheProvider
+
+
+class _TieredMixin:
+    """The L1 tier and the remote provider of the sync and async tiered providers."""
+
+    def __init__(
+        self,
+        provider: CacheProvider | AsyncCacheProvider,
+        max_entries: int = 1024,
+        max_bytes: int | None = 16 * 1024 * 1024,
+        timeout: int = 5,
+    ):
+        """Initialize class properties."""
+        super().__init__(
+            provider.cache_control(),
+            provider.user_key,
+            key_hash=provider.key_hash,
+            value_serializer=provider.serializer,
+        )
+        self.provider = provider
+        self.l1 = LRUCache(max_entries, max_bytes)
+        self.l1_timeout = timeout
+
+    def connect(self):
+        """Create the client of the remote provider and open a connection."""
+        self.provider.connect()
+
+    def _set_l1(self, remote: dict) -> dict:
+        """Add the values read from the remote provider to the L1 tier and return the values.
+
+        The L1 TTL is capped at the remaining TTL of the remote entry, or at the cache timeout
+        when the remote provider does not return the TTL.
+        """
+        values = {}
+        for key, (value, ttl) in remote.items():
+            self.l1.set(key, value, min(self.l1_timeout, self.timeout if ttl is None else ttl))
+            values[key] = value
+        return values
+
+    def _get_l1(self, keys: list) -> tuple[dict, list]:
+        """Return the values found in the L1 tier and the missing keys."""
+        values, missing = {}, []
+        for key in keys:
+            value = self.l1.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                values[key] = value
+        return values, missing
+
+
+class TieredCacheProvider(_TieredMixin, CacheProvider):
+    """Two tier cache provider with an in-process LRU (L1) in front of another provider.
+
+    The L1 tier is consulted before the wrapped (remote) provider. Entries written through the
+    tiered provider use the lower of the L1 timeout and the cache timeout. Entries read from the
+    remote provider use the lower of the L1 timeout and the remaining TTL of the remote entry
+    (the cache timeout if the remote provider does not return the TTL). The L1 timeout therefore
+    defines the maximum staleness of the L1 tier and should be kept short.
+
+    .. code:: python
+
+        cache_provider = TieredCacheProvider(
+            RedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT), max_entries=512, timeout=5
+        )
+
+    Args:
+        provider: The remote cache provider (e.g. RedisCacheProvider or MemcacheProvider).
+        max_entries: The maximum number of entries in the L1 tier.
+        max_bytes: The maximum total size of the L1 tier values in bytes.
+        timeout: The maximum TTL of L1 entries in seconds.
+    """
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a distributed regeneration lock using the remote provider.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return self.provider.acquire_lock(key, timeout)
+
+    def release_lock(self, key: str):
+        """Release the distributed regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+        """
+        self.provider.release_lock(key)
+
+    def get_cache(self, key: str) -> bytes | str | None:
+        """Return cache from the L1 tier falling back to the remote provider.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Any: The cached data.
+        """
+        value = self.l1.get(key)
+        if value is None:
+            value = self._set_l1(self.provider.get_many_ttl([key])).get(key)
+        return value
+
+    def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
+        """Write cache to the remote provider and the L1 tier.
+
+        Args:
+            key: The cache key.
+            value: The cache value.
+            timeout: The cache timeout value in seconds.
+        """
+        timeout = timeout or self.timeout
+        self.provider.set_cache(key, value, timeout)
+        self.l1.set(key, value, min(self.l1_timeout, timeout))
+
+    def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout to the remote provider and the L1 tier.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        timeout = timeout or self.timeout
+        self.provider.set_many(mapping, timeout)
+        for key, value in mapping.items():
+            self.l1.set(key, value, min(self.l1_timeout, timeout))
+
+    def get_many(self, keys: list) -> dict:
+        """Return multiple values from the L1 tier falling back to the remote provider.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        values, missing = self._get_l1(keys)
+        if missing:
+            values.update(self._set_l1(self.provider.get_many_ttl(missing)))
+        return values
+
+    def delete_many(self, keys: list):
+        """Delete multiple values from both tiers.
+
+        Args:
+            keys: The cache keys.
+        """
+        self.provider.delete_many(keys)
+        for key in keys:
+            self.l1.delete(key)
+
+    def tag_key(self, key: str, tags: list) -> str:
+        """Return the cache key for an entry with the provided tags.
+
+        Args:
+            key: The cache key.
+            tags: The entry tags.
+
+        Returns:
+            str: The cache key.
+        """
+        return self.provider.tag_key(key, tags)
+
+    def add_tags(self, keys: list, tags: list, timeout: int):
+        """Add the keys to the remote provider tag indexes.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+        self.provider.add_tags(keys, tags, timeout)
+
+    def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes in both tiers.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys.
+        """
+        keys = self.provider.invalidate(tags, paths)
+        for key in keys:
+            self.l1.delete(key)
+        return keys
+
+
+class AsyncTieredCacheProvider(_TieredMixin, AsyncCacheProvider):
+    """Two tier cache provider with an in-process LRU (L1) in front of an async provider.
+
+    Args:
+        provider: The async remote cache provider (e.g. AsyncRedisCacheProvider).
+        max_entries: The maximum number of entries in the L1 tier.
+        max_bytes: The maximum total size of the L1 tier values in bytes.
+        timeout: The maximum TTL of L1 entries in seconds.
+    """
+
+    async def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a distributed regeneration lock using the remote provider.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return await self.provider.acquire_lock(key, timeout)
+
+    async def release_lock(self, key: str):
+        """Release the distributed regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+        """
+        await self.provider.release_lock(key)
+
+    async def get_cache(self, key: str) -> bytes | str | None:
+        """Return cache from the L1 tier falling back to the remote provider.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Any: The cached data.
+        """
+        value = self.l1.get(key)
+        if value is None:
+            value = self._set_l1(await self.provider.get_many_ttl([key])).get(key)
+        return value
+
+    async def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
+        """Write cache to the remote provider and the L1 tier.
+
+        Args:
+            key: The cache key.
+            value: The cache value.
+            timeout: The cache timeout value in seconds.
+        """
+        timeout = timeout or self.timeout
+        await self.provider.set_cache(key, value, timeout)
+        self.l1.set(key, value, min(self.l1_timeout, timeout))
+
+    async def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout to the remote provider and the L1 tier.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        timeout = timeout or self.timeout
+        await self.provider.set_many(mapping, timeout)
+        for key, value in mapping.items():
+            self.l1.set(key, value, min(self.l1_timeout, timeout))
+
+    async def get_many(self, keys: list) -> dict:
+        """Return multiple values from the L1 tier falling back to the remote provider.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        values, missing = self._get_l1(keys)
+        if missing:
+            values.update(self._set_l1(await self.provider.get_many_ttl(missing)))
+        return values
+
+    async def delete_many(self, keys: list):
+        """Delete multiple values from both tiers.
+
+        Args:
+            keys: The cache keys.
+        """
+        await self.provider.delete_many(keys)
+        for key in keys:
+            self.l1.delete(key)
+
+    async def tag_key(self, key: str, tags: list) -> str:
+        """Return the cache key for an entry with the provided tags.
+
+        Args:
+            key: The cache key.
+            tags: The entry tags.
+
+        Returns:
+            str: The cache key.
+        """
+        return await self.provider.tag_key(key, tags)
+
+    async def add_tags(self, keys: list, tags: list, timeout: int):
+        """Add the keys to the remote provider tag indexes.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+        await self.provider.add_tags(keys, tags, timeout)
+
+    async def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes in both tiers.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys.
+        """
+        keys = await self.provider.invalidate(tags, paths)
+        for key in keys:
+            self.l1.delete(key)
+        return keys
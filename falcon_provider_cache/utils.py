@@ -1,31 +1,145 @@
 """Cache utility."""
 # standard library
-import hashlib
+import abc
+import copy
+import os
+import threading
+import time
+from collections.abc import Callable
 
 # third-party
 import falcon
 
+# first-party
+from falcon_provider_cache.compression import Compressor
+from falcon_provider_cache.keys import key_hasher, normalize_header
+from falcon_provider_cache.policy import DEFAULT_HEADERS, CachePolicy
+from falcon_provider_cache.serializers import Serializer
 
-class CacheProvider:
-    """Base Cache Provider Class.
+# the key read by connect to open the backend connection
+CONNECT_KEY = 'falcon-provider-cache:connect'
+
+
+def _to_str(value: bytes | str | int) -> str:
+    """Return the value as a string."""
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _expire_options(results: list) -> bool:
+    """Return False if the server rejected the EXPIRE NX and GT options (Redis < 7.0).
+
+    The results are the replies of a tag pipeline (SADD, EXPIRE NX, EXPIRE GT per tag), other
+    errors are raised.
+    """
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors and isinstance(results[1], Exception):
+        return False
+    if errors:
+        raise errors[0]
+    return True
+
+
+def _expiring_tags(names: list, ttls: list, timeout: int) -> list:
+    """Return the tag indexes without a TTL (-1) or with a TTL shorter than the timeout."""
+    return [name for name, ttl in zip(names, ttls) if ttl < timeout]
+
+
+def _ttl_values(keys: list, results: list, decompress: Callable) -> dict:
+    """Return the (value, TTL) of the cached keys from the replies of a GET and PTTL pipeline.
+
+    The TTL of values without an expiry (PTTL -1) is None.
+    """
+    return {
+        key: (decompress(value), pttl / 1000 if pttl >= 0 else None)
+        for key, value, pttl in zip(keys, results[::2], results[1::2])
+        if value is not None
+    }
+
+
+class BaseCacheProvider:
+    """Base class of the sync and async cache providers.
+
+    The cache control settings, cache policies, cache keys and value serialization are shared
+    by all providers, the backend operations are implemented by the CacheProvider (sync) and
+    AsyncCacheProvider (async) subclasses.
 
     Args:
         cache_control: A default cache control object.
         user_key: The falcon req.context attribute that contains the username
             or user_id that will be used if private cache is enabled.
+        compressor: A Compressor used to compress large cache values.
+        key_hash: The hash used for cache keys (blake2b, sha1, xxhash) or a callable that takes
+            the key bytes and returns a string.
+        value_serializer: The Serializer used to serialize cache values (default: json).
     """
 
-    def __init__(self, cache_control: dict | None = None, user_key: str | None = None):
+    def __init__(
+        self,
+        cache_control: dict | None = None,
+        user_key: str | None = None,
+        compressor: Compressor | None = None,
+        key_hash: str | Callable = 'blake2b',
+        value_serializer: Serializer | None = None,
+    ):
         """Initialize class properties
 
         **cache_control**
 
+        admit_after (int): The number of recent requests (misses) for a key before its response is
+            written to the cache, so one-off requests (e.g. unique query strings) do not evict
+            hot entries. Requests are counted per process with a frequency sketch (0 writes
+            every miss).
+        cache_headers (bool): If True the Cache-Control, Expires and Age (on hits) response
+            headers are set for cached responses.
+        enabled (bool): If True caching is enabled for the resource.
+        etag (bool): If True an ETag and Last-Modified header are added to cached responses and
+            conditional requests are answered with 304 Not Modified from cache.
+        headers (list): The response headers stored with the cached response.
+        key_headers (list): The request headers (e.g. Accept-Language) used to generate the
+            caches unique key.
+        key_params (list): The query parameters used to generate the caches unique key when
+            use_query is enabled (default: all query parameters).
+        invalidate (bool): If True entries are tagged with their path (and parent paths) and
+            successful unsafe requests (e.g. POST, PUT, DELETE) invalidate the entries for the
+            request path and its child paths.
+        lock (bool): If True concurrent cache misses for the same key are coalesced so only one
+            request regenerates the response.
+        lock_timeout (int): The maximum time (seconds) a distributed regeneration lock is held.
+        lock_wait (float): The maximum time (seconds) a request waits for another request to
+            regenerate the response before processing the request itself.
+        max_age (int): The Cache-Control max-age sent with cache_headers (default: timeout).
+        max_timeout (int): Enables adaptive TTLs. The TTL of an entry that is regenerated with
+            the same content (content hash) is doubled up to max_timeout and reset to the
+            timeout when the content changes.
         methods (list): A list of method where caching should be used.
         private (bool): If the caching should be private (applied per user). Requires user_key
             to be set to a valid value.
+        s_maxage (int): The Cache-Control s-maxage for shared caches sent with cache_headers.
+        stale_if_error (int): The time (seconds) after expiry a stale entry is served if the
+            resource responder fails.
+        stale_while_revalidate (int): The time (seconds) after expiry a stale entry is served
+            while the entry is refreshed in the background.
+        status_timeouts (dict): The TTL of error responses keyed on the status code (e.g.
+            {404: 30, 410: 300}), error responses (4xx and 5xx) with other statuses are not
+            cached. Responses with a status below 400 use the timeout.
+        stream_max_size (int): The maximum size (bytes) of a cached streamed response
+            (resp.stream). Streams are written to the cache in chunks as they are sent and
+            caching is aborted when the stream exceeds the size. Streamed responses are not cached
+            when 0.
+        tags (list|callable): The tags for cached entries, either a list of strings formatted
+            with the route params (e.g. 'user:{user_id}') or a callable that takes the request
+            and route params and returns a list of tags. Successful unsafe requests invalidate
+            the entries with the same tags.
         timeout (int): The TTL of the cache.
         use_query (limit): If True the request query parameters will be used to generate the
             caches unique key.
+        vary (list): The request headers (e.g. Accept-Encoding) that select the response
+            representation. The normalized header values are used in the cache key and the
+            headers are sent in the Vary response header.
+
+        Settings can also be provided per HTTP method by using the method name as the key. Method
+        settings are applied over the resource settings and the method is implicitly added to
+        **methods**.
 
         .. code:: python
 
@@ -50,97 +164,403 @@ class CacheProvider:
                     }
                 }
         """
-        # TODO: ^^^^^^^^^^^^ change format ??????????????
         self._global_cache_control = {
+            'admit_after': 0,
+            'cache_headers': False,
             'enabled': False,
+            'etag': False,
+            'headers': list(DEFAULT_HEADERS),
+            'invalidate': False,
+            'key_headers': [],
+            'key_params': None,
+            'lock': False,
+            'lock_timeout': 10,
+            'lock_wait': 1.0,
+            'max_age': None,
+            'max_timeout': None,
             'methods': ['GET'],
             'private': False,
+            's_maxage': None,
             # 'return_errors': True,
+            'stale_if_error': 0,
+            'stale_while_revalidate': 0,
+            'status_timeouts': {},
+            'stream_max_size': 0,
+            'tags': [],
             'timeout': 60,
             'use_query': False,
+            'vary': [],
         }
         if cache_control is not None:
             # update global cache control with user provided settings
             self._global_cache_control.update(cache_control)
-        self._cache_control = dict(self._global_cache_control)
         self.user_key = user_key  # the req.context attribute to make cache unique per user
+        self.compressor = compressor
+        self.key_hash = key_hasher(key_hash)
+        self.serializer = value_serializer or Serializer()
+
+        # resolved policies keyed on (resource id, method) -> (cache_control snapshot, policy)
+        self._policies: dict[tuple[int, str], tuple[dict | None, CachePolicy]] = {}
 
     def cache_control(self, cache_control: dict | None = None) -> dict:
         """Return cache control settings.
 
+        The global settings are never modified, a new dict is returned on each call.
+
         Args:
             cache_control: The cache control settings.
 
         Returns:
             dict: Updated cache control settings.
         """
+        return {**self._global_cache_control, **(cache_control or {})}
+
+    def _compress(self, value: bytes | str) -> bytes | str:
+        """Return the value compressed with the compressor (if any)."""
+        if self.compressor is None:
+            return value
+        return self.compressor.compress(value)
+
+    def _decompress(self, value: bytes | str | None) -> bytes | str | None:
+        """Return the value decompressed with the compressor (if any)."""
+        if self.compressor is None:
+            return value
+        return self.compressor.decompress(value)
+
+    def serialize(self, value: object) -> bytes:
+        """Return the value serialized with the value serializer.
+
+        Args:
+            value: The value to serialize.
+
+        Returns:
+            bytes: The serialized value.
+        """
+        return self.serializer.dumps(value)
+
+    def deserialize(self, value: bytes | str | None) -> object:
+        """Return the value deserialized with the value serializer.
+
+        Values written with a different format are deserialized with the format they were
+        written with, values that are not serialized are returned as is.
+
+        Args:
+            value: The cache value.
+
+        Returns:
+            object: The deserialized value.
+        """
+        return self.serializer.loads(value)
+
+    @staticmethod
+    def path_tags(path: str) -> list[str]:
+        """Return the tags for a request path and each of its parent paths.
+
+        Args:
+            path: The request path (e.g. /users/42/posts).
+
+        Returns:
+            list: The path tags (e.g. path:/users, path:/users/42, path:/users/42/posts).
+        """
+        parts = path.strip('/').split('/')
+        return [f'path:/{"/".join(parts[:i])}' for i in range(1, len(parts) + 1)]
+
+    def invalidation_tags(self, tags: list | None = None, paths: list | None = None) -> list[str]:
+        """Return the tags to invalidate for the provided tags and path prefixes.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The tags to invalidate.
+        """
+        return [*(tags or []), *(self.path_tags(p)[-1] for p in paths or [])]
+
+    def cache_policy(self, resource: object, method: str) -> CachePolicy:
+        """Return the resolved cache policy for the provided resource and method.
+
+        Policies are resolved once and reused. The cached policy is validated against the
+        resource's current cache_control (a cheap equality check) so runtime changes to the
+        resource settings are still honored.
+
+        Args:
+            resource: The resource object.
+            method: The HTTP method of the request.
+
+        Returns:
+            CachePolicy: The resolved policy.
+        """
+        cache_control = getattr(resource, 'cache_control', None)
+        if not isinstance(cache_control, dict):
+            cache_control = None
+
+        policy_key = (id(resource), method)
+        cached = self._policies.get(policy_key)
+        if cached is not None and cached[0] == cache_control:
+            return cached[1]
+
+        policy = self._resolve_policy(cache_control, method)
+        # a plain dict assignment is atomic, racing threads resolve an identical policy
+        self._policies[policy_key] = (copy.deepcopy(cache_control), policy)
+        return policy
+
+    def _resolve_policy(self, cache_control: dict | None, method: str) -> CachePolicy:
+        """Return a new policy for the resource cache_control and method."""
         cache_control = cache_control or {}
-        self._cache_control = dict(self._global_cache_control)
-        self._cache_control.update(cache_control)
-        return self._cache_control
+
+        # resource level settings, per method settings are provided as nested dicts keyed on the
+        # (upper case) method name
+        settings = self.cache_control(
+            {k: v for k, v in cache_control.items() if not (isinstance(v, dict) and k.isupper())}
+        )
+        method_settings = cache_control.get(method)
+        if isinstance(method_settings, dict):
+            settings.update(method_settings)
+            settings['methods'] = [*settings.get('methods', []), method]
+        return CachePolicy.from_dict(settings, method)
 
     def cache_key(
-        self, req: falcon.Request, resource: object  # pylint: disable=unused-argument
+        self,
+        req: falcon.Request,
+        resource: object,  # pylint: disable=unused-argument
+        policy: CachePolicy | None = None,
     ) -> str:
-        """Provide a unique redis cache key.
+        """Provide a unique cache key.
 
-        Starting with falcon 2.0 the path will always have the trailing '/' stripped.
+        Starting with falcon 2.0 the path will always have the trailing '/' stripped. The key is
+        built from the path, the query parameters (all or the key_params whitelist), the
+        key_headers, the normalized vary headers and the user key for private caching.
 
         Args:
             req: The falcon request instance.
             resource: The resource object (provider).
+            policy: The resolved cache policy, defaults to the global settings.
 
         Returns:
             str: The cache key.
         """
-        key = req.path  # using path instead of uri so params is optional
-        if self.use_query:
-            for k, v in sorted(req.params.items()):
-                # build query params
-                if isinstance(v, list):  # pragma: no cover
-                    # from falcon docs:
-                    # where the parameter appears multiple times in the query string, the value
-                    # mapped to that parameter key will be a list of all the values in the order
-                    # seen.
-                    # during testing this did not seem to be the case, possibly and issue
-                    # with the falcon TestClient.
-                    v = ''.join(sorted(v))
-                key += f'{k}{v}'
-
-        if self.private and self.user_key is not None and hasattr(req.context, self.user_key):
+        if policy is None:
+            policy = CachePolicy.from_dict(self._global_cache_control, req.method)
+
+        key = [req.path]  # using path instead of uri so params is optional
+        if policy.use_query:
+            key.extend(self._key_params(req, policy))
+
+        for name in policy.key_headers:
+            key.append((name, req.get_header(name)))
+        for name in policy.vary:
+            key.append((name, normalize_header(name, req.get_header(name))))
+
+        if policy.private and self.user_key is not None and hasattr(req.context, self.user_key):
             # use token data to make key unique per user
             user_key = str(getattr(req.context, self.user_key))
             if user_key:
-                key += user_key
-        return hashlib.sha1(key.encode()).hexdigest()  # nosec
+                key.append(user_key)
+
+        # the repr of the key parts is unambiguous (e.g. a=1&a=23 and a=12&a=3 differ)
+        return self.key_hash(repr(key).encode())
+
+    @staticmethod
+    def _key_params(req: falcon.Request, policy: CachePolicy) -> list[tuple]:
+        """Return the (name, value) query parameters used in the cache key."""
+        params = req.params
+        names = sorted(params) if policy.key_params is None else policy.key_params
+        key_params = []
+        for name in names:
+            value = params.get(name)
+            # multi-value params are sorted so the key does not depend on their order
+            key_params.append((name, sorted(value) if isinstance(value, list) else value))
+        return key_params
+
+    def _generation_key(self, key: str, generations: list) -> str:
+        """Return a cache key that includes the tag generations."""
+        versions = '.'.join(_to_str(g) for g in generations)
+        return self.key_hash(f'{key}.{versions}'.encode())
 
     @property
     def enabled(self) -> bool:
-        """Return cache control enabled value."""
-        return self._cache_control.get('enabled', False)
+        """Return global cache control enabled value."""
+        return self._global_cache_control.get('enabled', False)
 
     @property
     def methods(self) -> list:
-        """Return cache control methods value."""
-        return self._cache_control.get('methods', ['GET'])
+        """Return global cache control methods value."""
+        return self._global_cache_control.get('methods', ['GET'])
 
     @property
     def private(self) -> bool:
-        """Return cache control private value."""
-        return self._cache_control.get('private', False)
+        """Return global cache control private value."""
+        return self._global_cache_control.get('private', False)
 
     @property
     def timeout(self) -> int:
-        """Return cache control timeout value."""
-        return self._cache_control.get('timeout', 60)
+        """Return global cache control timeout value."""
+        return self._global_cache_control.get('timeout', 60)
 
     @property
     def use_query(self) -> bool:
-        """Return cache control use_query value."""
-        return self._cache_control.get('use_query', False)
+        """Return global cache control use_query value."""
+        return self._global_cache_control.get('use_query', False)
 
 
-class MemcacheProvider(CacheProvider):
+class CacheProvider(BaseCacheProvider):
+    """Base Cache Provider Class.
+
+    The base class of the sync providers, see BaseCacheProvider for the arguments.
+    """
+
+    def connect(self):
+        """Create the backend client and open a connection.
+
+        Call from a post fork hook (e.g. gunicorn post_fork) so the first request of each worker
+        does not pay the import and connection cost. Connection errors are raised.
+
+        .. code:: python
+
+            def post_fork(server, worker):
+                cache_provider.connect()
+        """
+        self.get_many([CONNECT_KEY])
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:  # pylint: disable=unused-argument
+        """Acquire a distributed regeneration lock for the cache key.
+
+        The base provider has no shared backend so the lock is always acquired.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return True
+
+    def release_lock(self, key: str):
+        """Release the distributed regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+        """
+
+    def tag_key(self, key: str, tags: list) -> str:  # pylint: disable=unused-argument
+        """Return the cache key for an entry with the provided tags.
+
+        Providers that track tags with index sets return the key unchanged, providers that
+        track tags with generations (memcache) include the tag generations in the key.
+
+        Args:
+            key: The cache key.
+            tags: The entry tags.
+
+        Returns:
+            str: The cache key.
+        """
+        return key
+
+    def add_tags(self, keys: list, tags: list, timeout: int):
+        """Add the keys to the tag indexes.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+
+    def get_many(self, keys: list) -> dict:
+        """Return multiple values, keys that are not cached are not included.
+
+        Providers override this method to read the values in a single round trip.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        values = {}
+        for key in keys:
+            value = self.get_cache(key)  # pylint: disable=no-member
+            if value is not None:
+                values[key] = value
+        return values
+
+    def get_many_ttl(self, keys: list) -> dict:
+        """Return multiple values and their TTL, keys that are not cached are not included.
+
+        Providers that can read the TTL of the values override this method, by default the TTL
+        is None (unknown).
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The (value, TTL in seconds or None) keyed on the cache key.
+        """
+        return {k: (v, None) for k, v in self.get_many(keys).items()}
+
+    def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout.
+
+        Providers override this method to write the values in a single round trip.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        for key, value in mapping.items():
+            self.set_cache(key, value, timeout)  # pylint: disable=no-member
+
+    def delete_many(self, keys: list):
+        """Delete multiple values.
+
+        Providers override this method to delete the values in a single round trip.
+
+        Args:
+            keys: The cache keys.
+        """
+        for key in keys:
+            self.delete_cache(key)  # pylint: disable=no-member
+
+
+class ClientMixin(abc.ABC):
+    """Lazy backend client for the providers using a client library (Redis and Memcache).
+
+    The client libraries are imported and the client is created on first use so importing the
+    app does not open connections. Connections opened before a fork (e.g. gunicorn --preload)
+    would be shared by the workers, so the client is recreated when the process id changes.
+    Providers using the mixin implement _create_client.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize class properties."""
+        super().__init__(*args, **kwargs)
+        self._cache_client: object | None = None
+        self._client_pid: int | None = None
+        self._client_lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _create_client(self) -> object:
+        """Return a new backend client."""
+
+    def _get_client(self) -> object:
+        """Return the backend client, created on first use and after a fork."""
+        pid = os.getpid()
+        if self._client_pid != pid:
+            with self._client_lock:
+                if self._client_pid != pid:
+                    self._cache_client = self._create_client()
+                    self._client_pid = pid
+        return self._cache_client
+
+    def _set_client(self, client: object):
+        """Set the backend client for the current process."""
+        self._cache_client = client
+        self._client_pid = os.getpid()
+
+
+class MemcacheProvider(ClientMixin, CacheProvider):
     """Memcache Provider Class.
 
     Args:
@@ -149,6 +569,9 @@ class MemcacheProvider(CacheProvider):
             userid that will be used if private cache is enabled.
         server: The server settings for memcache, can either be a (host, port) tuple for
             a TCP connection or a string containing the path to a UNIX domain socket.
+        compressor: A Compressor used to compress large cache values.
+        key_hash: The hash used for cache keys (blake2b, sha1, xxhash) or a callable.
+        value_serializer: The Serializer used to serialize cache values (default: json).
         max_pool_size (int, kwargs): The maximum pool size for Pool Client.
         connect_timeout (int, kwargs): Used to set socket timeout values. By default, timeouts
             are disabled.
@@ -167,12 +590,18 @@ class MemcacheProvider(CacheProvider):
         cache_control: dict | None = None,
         user_key: str | None = None,
         server: str | tuple | None = None,
+        compressor: Compressor | None = None,
+        key_hash: str | Callable = 'blake2b',
+        value_serializer: Serializer | None = None,
         **kwargs,
     ):
         """Initialize class properties."""
 
-        super().__init__(cache_control, user_key)
+        super().__init__(cache_control, user_key, compressor, key_hash, value_serializer)
+        self._client_args = (server, kwargs)
 
+    def _create_client(self) -> object:
+        """Return a new memcache client."""
         try:
             # third-party
             from falcon_provider_memcache.utils import (  # pylint: disable=import-outside-toplevel
@@ -185,9 +614,40 @@ class MemcacheProvider(CacheProvider):
             )
             raise
 
-        self.memcache_client = MemcacheClient(server, **kwargs).client
+        server, kwargs = self._client_args
+        return MemcacheClient(server, **kwargs).client
+
+    @property
+    def memcache_client(self) -> object:
+        """Return the memcache client (created on first use and after a fork)."""
+        return self._get_client()
+
+    @memcache_client.setter
+    def memcache_client(self, client: object):
+        """Set the memcache client."""
+        self._set_client(client)
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a distributed regeneration lock using memcache add.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return self.memcache_client.add(f'{key}.lock', '1', expire=timeout, noreply=False)
+
+    def release_lock(self, key: str):
+        """Release the distributed regeneration lock for the cache key.
 
-    def get_cache(self, key: str) -> dict | int | list | str:
+        Args:
+            key: The cache key.
+        """
+        self.memcache_client.delete(f'{key}.lock')
+
+    def get_cache(self, key: str) -> bytes | str | None:
         """Return cache from memcache
 
         Args:
@@ -196,9 +656,9 @@ class MemcacheProvider(CacheProvider):
         Returns:
             Any: The cached data.
         """
-        return self.memcache_client.get(key)
+        return self._decompress(self.memcache_client.get(key))
 
-    def set_cache(self, key: str, value: str, timeout: int | None = None):
+    def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
         """Write cache to Redis
 
         Args:
@@ -207,10 +667,86 @@ class MemcacheProvider(CacheProvider):
             timeout: The cache timeout value.
         """
         timeout = timeout or self.timeout
-        self.memcache_client.set(key=key, value=value, expire=timeout)
+        self.memcache_client.set(key=key, value=self._compress(value), expire=timeout)
+
+    def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout using memcache set_many.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        timeout = timeout or self.timeout
+        self.memcache_client.set_many(
+            {k: self._compress(v) for k, v in mapping.items()}, expire=timeout
+        )
+
+    def get_many(self, keys: list) -> dict:
+        """Return multiple values using memcache get_many.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        if not keys:
+            return {}
+        return {k: self._decompress(v) for k, v in self.memcache_client.get_many(keys).items()}
+
+    def delete_many(self, keys: list):
+        """Delete multiple values using memcache delete_many.
+
+        Args:
+            keys: The cache keys.
+        """
+        if keys:
+            self.memcache_client.delete_many(keys, noreply=False)
+
+    def tag_key(self, key: str, tags: list) -> str:
+        """Return the cache key including the current generation of each tag.
+
+        Args:
+            key: The cache key.
+            tags: The entry tags.
+
+        Returns:
+            str: The cache key.
+        """
+        if not tags:
+            return key
 
+        names = [f'tag:{t}' for t in tags]
+        generations = self.memcache_client.get_many(names)
+        for name in names:
+            if name not in generations:
+                generations[name] = str(time.time_ns())
+                if not self.memcache_client.add(name, generations[name], expire=0, noreply=False):
+                    # another request added the generation first, use the stored generation
+                    generations[name] = self.memcache_client.get(name) or generations[name]
+        return self._generation_key(key, [generations[n] for n in names])
 
-class RedisCacheProvider(CacheProvider):
+    def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes.
+
+        A new generation is written for each tag, so existing entries are no longer used and
+        expire with their TTL.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys (always empty for memcache).
+        """
+        generation = str(time.time_ns())
+        self.memcache_client.set_many(
+            {f'tag:{t}': generation for t in self.invalidation_tags(tags, paths)}, expire=0
+        )
+        return []
+
+
+class RedisCacheProvider(ClientMixin, CacheProvider):
     """Redis Cache Provider Class.
 
     Args:
@@ -221,6 +757,9 @@ class RedisCacheProvider(CacheProvider):
         port: The REDIS port.
         db: The REDIS db.
         blocking_pool: Use BlockingConnectionPool instead of ConnectionPool.
+        compressor: A Compressor used to compress large cache values.
+        key_hash: The hash used for cache keys (blake2b, sha1, xxhash) or a callable.
+        value_serializer: The Serializer used to serialize cache values (default: json).
         errors (str, kwargs): The REDIS errors policy (e.g. strict).
         max_connections (int, kwargs): The maximum number of connections to REDIS.
         password (str, kwargs): The REDIS password.
@@ -236,11 +775,19 @@ class RedisCacheProvider(CacheProvider):
         port: int | None = None,
         db: int | None = None,
         blocking_pool: bool | None = False,
+        compressor: Compressor | None = None,
+        key_hash: str | Callable = 'blake2b',
+        value_serializer: Serializer | None = None,
         **kwargs,
     ):
         """Initialize class properties."""
-        super().__init__(cache_control, user_key)
+        super().__init__(cache_control, user_key, compressor, key_hash, value_serializer)
+        self._client_args = (host, port, db, blocking_pool, kwargs)
+        # the EXPIRE NX and GT options require Redis 7.0 (disabled on the first failure)
+        self._expire_options = True
 
+    def _create_client(self) -> object:
+        """Return a new Redis client."""
         try:
             # third-party
             from falcon_provider_redis.utils import (  # pylint: disable=import-outside-toplevel
@@ -253,9 +800,40 @@ class RedisCacheProvider(CacheProvider):
             )
             raise
 
-        self.redis_client = RedisClient(host, port, db, blocking_pool, **kwargs).client
+        host, port, db, blocking_pool, kwargs = self._client_args
+        return RedisClient(host, port, db, blocking_pool, **kwargs).client
+
+    @property
+    def redis_client(self) -> object:
+        """Return the Redis client (created on first use and after a fork)."""
+        return self._get_client()
+
+    @redis_client.setter
+    def redis_client(self, client: object):
+        """Set the Redis client."""
+        self._set_client(client)
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        """Acquire a distributed regeneration lock using Redis SET NX PX.
+
+        Args:
+            key: The cache key.
+            timeout: The maximum time (seconds) the lock is held.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        return bool(self.redis_client.set(f'{key}.lock', '1', nx=True, px=int(timeout * 1000)))
+
+    def release_lock(self, key: str):
+        """Release the distributed regeneration lock for the cache key.
+
+        Args:
+            key: The cache key.
+        """
+        self.redis_client.delete(f'{key}.lock')
 
-    def get_cache(self, key: str) -> dict | int | list | str:
+    def get_cache(self, key: str) -> bytes | str | None:
         """Return cache from Redis
 
         Args:
@@ -264,9 +842,10 @@ class RedisCacheProvider(CacheProvider):
         Returns:
             Any: The cached data.
         """
-        return self.redis_client.get(key)
+        # the cached entries are binary, bypass the client response decoding
+        return self._decompress(self.redis_client.execute_command('GET', key, NEVER_DECODE=True))
 
-    def set_cache(self, key: str, value: str, timeout: int | None = None):
+    def set_cache(self, key: str, value: bytes | str, timeout: int | None = None):
         """Write cache to Redis
 
         Args:
@@ -275,4 +854,106 @@ class RedisCacheProvider(CacheProvider):
             timeout: The cache timeout value in seconds.
         """
         timeout = timeout or self.timeout
-        self.redis_client.setex(name=key, time=timeout, value=value)
+        self.redis_client.setex(name=key, time=timeout, value=self._compress(value))
+
+    def set_many(self, mapping: dict, timeout: int | None = None):
+        """Write multiple values with the same timeout using a pipeline.
+
+        Args:
+            mapping: The cache keys and values.
+            timeout: The cache timeout value in seconds.
+        """
+        timeout = timeout or self.timeout
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.setex(name=key, time=timeout, value=self._compress(value))
+        pipe.execute()
+
+    def get_many(self, keys: list) -> dict:
+        """Return multiple values using Redis MGET.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The cached values keyed on the cache key.
+        """
+        if not keys:
+            return {}
+        values = self.redis_client.execute_command('MGET', *keys, NEVER_DECODE=True)
+        return {k: self._decompress(v) for k, v in zip(keys, values) if v is not None}
+
+    def get_many_ttl(self, keys: list) -> dict:
+        """Return multiple values and their remaining TTL using a pipeline.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            dict: The (value, TTL in seconds or None) keyed on the cache key.
+        """
+        if not keys:
+            return {}
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.execute_command('GET', key, NEVER_DECODE=True)
+            pipe.pttl(key)
+        return _ttl_values(keys, pipe.execute(), self._decompress)
+
+    def delete_many(self, keys: list):
+        """Delete multiple values using a single Redis DEL.
+
+        Args:
+            keys: The cache keys.
+        """
+        if keys:
+            self.redis_client.delete(*keys)
+
+    def add_tags(self, keys: list, tags: list, timeout: int):
+        """Add the keys to the tag index sets.
+
+        Args:
+            keys: The cache keys.
+            tags: The entry tags.
+            timeout: The cache timeout value in seconds.
+        """
+        names = [f'tag:{t}' for t in tags]
+        if self._expire_options:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for name in names:
+                pipe.sadd(name, *keys)
+                # keep the index for the longest TTL of its entries
+                pipe.expire(name, timeout, nx=True)
+                pipe.expire(name, timeout, gt=True)
+            self._expire_options = _expire_options(pipe.execute(raise_on_error=False))
+            if self._expire_options:
+                return
+
+        # Redis < 7.0, read the TTL of the indexes and extend the shorter ones
+        pipe = self.redis_client.pipeline(transaction=False)
+        for name in names:
+            pipe.sadd(name, *keys)
+            pipe.ttl(name)
+        ttls = pipe.execute()[1::2]
+        pipe = self.redis_client.pipeline(transaction=False)
+        for name in _expiring_tags(names, ttls, timeout):
+            pipe.expire(name, timeout)
+        pipe.execute()
+
+    def invalidate(self, tags: list | None = None, paths: list | None = None) -> list:
+        """Invalidate the entries with the provided tags or path prefixes.
+
+        Args:
+            tags: The tags to invalidate.
+            paths: The path prefixes to invalidate (e.g. /users/42).
+
+        Returns:
+            list: The invalidated cache keys.
+        """
+        names = [f'tag:{t}' for t in self.invalidation_tags(tags, paths)]
+        if not names:
+            return []
+
+        keys = [_to_str(k) for k in self.redis_client.sunion(names)]
+        self.redis_client.delete(*keys, *names)
+        return keys
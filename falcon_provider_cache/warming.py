@@ -0,0 +1,275 @@
+"""Cache warming."""
+# standard library
+import asyncio
+import json
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# third-party
+import falcon
+import falcon.asgi
+
+# the WSGI environ (or ASGI scope) key of warming requests, the value is the refresh ahead time
+WARM_ENV = 'falcon_provider_cache.warm'
+
+
+def warm_ahead(req: falcon.Request) -> float | None:
+    """Return the refresh ahead time (seconds) of a warming request or None.
+
+    Args:
+        req: The request.
+
+    Returns:
+        float | None: The refresh ahead time.
+    """
+    env = req.scope if isinstance(req, falcon.asgi.Request) else req.env
+    return env.get(WARM_ENV)
+
+
+class WarmingLog:
+    """Bounded log of the most requested cacheable requests.
+
+    When provided to the CacheMiddleware, the method, path, query string and the request
+    headers that are part of the cache key (key_headers and vary) of each cacheable request are
+    counted. The top requests are used by the CacheWarmer and can be saved to a file so the
+    cache is warmed with the most requested entries after a deploy.
+
+    Args:
+        max_entries: The maximum number of distinct requests counted, the least requested half
+            is dropped when the log is full.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """Initialize class properties."""
+        self.max_entries = max_entries
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of distinct requests."""
+        return len(self._counts)
+
+    def record(self, req: falcon.Request, policy: object):
+        """Count a cacheable request.
+
+        Args:
+            req: The request.
+            policy: The cache policy of the request.
+        """
+        headers = tuple(
+            (name, req.get_header(name))
+            for name in sorted({*policy.key_headers, *policy.vary})
+            if req.get_header(name) is not None
+        )
+        entry = (req.method, req.path, req.query_string, headers)
+        with self._lock:
+            self._counts[entry] += 1
+            if len(self._counts) > self.max_entries:
+                self._counts = Counter(dict(self._counts.most_common(self.max_entries // 2)))
+
+    def top(self, count: int = 100) -> list[dict]:
+        """Return the specs of the most requested requests.
+
+        Args:
+            count: The number of requests.
+
+        Returns:
+            list[dict]: The request specs.
+        """
+        with self._lock:
+            common = self._counts.most_common(count)
+        return [
+            {'method': m, 'path': p, 'query_string': q, 'headers': dict(h)}
+            for (m, p, q, h), _ in common
+        ]
+
+    def save(self, path: str, count: int = 1000):
+        """Write the specs of the most requested requests to a JSON file.
+
+        Args:
+            path: The file path.
+            count: The number of requests.
+        """
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(self.top(count), fh)
+
+    @staticmethod
+    def load(path: str) -> list[dict]:
+        """Return the request specs from a JSON file written by save.
+
+        Args:
+            path: The file path.
+
+        Returns:
+            list[dict]: The request specs.
+        """
+        with open(path, encoding='utf-8') as fh:
+            return json.load(fh)
+
+
+class CacheWarmer:
+    """Populate the cache by replaying requests against the application in-process.
+
+    Requests are simulated (no network) with a bounded thread pool (WSGI) or concurrently on a
+    single event loop (ASGI), so the cache can be warmed before the worker starts accepting
+    traffic (e.g. in the gunicorn post_fork hook).
+
+    .. code:: python
+
+        warmer = CacheWarmer(
+            app,
+            specs=['/users', {'path': '/search', 'params': {'q': 'falcon'}}],
+            warming_log=warming_log,
+        )
+        warmer.warm()
+        warmer.start(interval=30, refresh_ahead=60)
+
+    Args:
+        app: The falcon application (falcon.App or falcon.asgi.App).
+        specs: The requests to replay, a path (optionally including a query string) or a dict
+            with the path and the optional method, params, query_string and headers.
+        warming_log: A WarmingLog, the top requests are replayed after the specs.
+        top: The number of top requests from the warming log to replay.
+        workers: The maximum number of concurrent requests.
+        headers: The headers added to every request (e.g. an authorization header).
+    """
+
+    def __init__(
+        self,
+        app: falcon.App,
+        specs: list | None = None,
+        warming_log: WarmingLog | None = None,
+        top: int = 100,
+        workers: int = 4,
+        headers: dict | None = None,
+    ):
+        """Initialize class properties."""
+        self.app = app
+        self.specs = [{'path': s} if isinstance(s, str) else s for s in specs or []]
+        self.warming_log = warming_log
+        self.top = top
+        self.workers = workers
+        self.headers = headers or {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _options(self, spec: dict, refresh_ahead: float) -> dict:
+        """Return the simulated request options of a spec."""
+        path, _, query_string = spec['path'].partition('?')
+        return {
+            'method': spec.get('method', 'GET'),
+            'path': path,
+            'query_string': spec.get('query_string') or query_string or None,
+            'params': spec.get('params'),
+            'headers': {**self.headers, **spec.get('headers', {})},
+            'extras': {WARM_ENV: refresh_ahead},
+        }
+
+    @staticmethod
+    def _result(result: object) -> str:
+        """Return the cache result of a simulated request."""
+        if result.status_code >= 500:
+            return 'error'
+        return (result.headers.get('x-cache') or 'bypass').lower()
+
+    def _request(self, spec: dict, refresh_ahead: float) -> str:
+        """Replay a request and return the cache result."""
+        # third-party
+        from falcon import testing  # pylint: disable=import-outside-toplevel
+
+        try:
+            result = testing.simulate_request(self.app, **self._options(spec, refresh_ahead))
+        except Exception:  # pylint: disable=broad-except
+            return 'error'
+        return self._result(result)
+
+    def _specs(self) -> list[dict]:
+        """Return the specs and the top requests of the warming log."""
+        specs = list(self.specs)
+        if self.warming_log is not None:
+            specs.extend(self.warming_log.top(self.top))
+        return specs
+
+    def warm(self, refresh_ahead: float = 0) -> dict[str, int]:
+        """Replay the requests, entries expiring within refresh_ahead seconds are regenerated.
+
+        The requests of an ASGI app are replayed on a new event loop (see warm_async).
+
+        Args:
+            refresh_ahead: The time (seconds) before expiry an entry is regenerated, cached
+                entries that expire later are kept.
+
+        Returns:
+            dict[str, int]: The number of requests per cache result (e.g. hit, miss, error).
+        """
+        if isinstance(self.app, falcon.asgi.App):
+            # a private loop, asyncio.run would close and unset the current event loop
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(self.warm_async(refresh_ahead))
+            finally:
+                loop.close()
+
+        specs = self._specs()
+        with ThreadPoolExecutor(self.workers, thread_name_prefix='cache-warm') as executor:
+            results = executor.map(self._request, specs, [refresh_ahead] * len(specs))
+        return dict(Counter(results))
+
+    async def warm_async(self, refresh_ahead: float = 0) -> dict[str, int]:
+        """Replay the requests against an ASGI app on the running event loop.
+
+        The requests run concurrently (at most workers at a time) on a single event loop. Await
+        this method on the event loop of the app (e.g. in a lifespan startup handler) when the
+        async provider clients are bound to it.
+
+        Args:
+            refresh_ahead: The time (seconds) before expiry an entry is regenerated, cached
+                entries that expire later are kept.
+
+        Returns:
+            dict[str, int]: The number of requests per cache result (e.g. hit, miss, error).
+        """
+        # third-party
+        from falcon import testing  # pylint: disable=import-outside-toplevel
+
+        conductor = testing.ASGIConductor(self.app)
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def request(spec: dict) -> str:
+            async with semaphore:
+                try:
+                    result = await conductor.simulate_request(**self._options(spec, refresh_ahead))
+                except Exception:  # pylint: disable=broad-except
+                    return 'error'
+            return self._result(result)
+
+        results = await asyncio.gather(*(request(s) for s in self._specs()))
+        return dict(Counter(results))
+
+    def _run(self, interval: float, refresh_ahead: float):
+        """Warm the cache every interval seconds until stopped."""
+        while not self._stop.wait(interval):
+            self.warm(refresh_ahead)
+
+    def start(self, interval: float, refresh_ahead: float | None = None):
+        """Warm the cache periodically in a background thread.
+
+        Args:
+            interval: The time (seconds) between warming runs.
+            refresh_ahead: The time (seconds) before expiry an entry is regenerated (default: the
+                interval, so entries are refreshed before they expire).
+        """
+        self._stop.clear()
+        refresh_ahead = interval if refresh_ahead is None else refresh_ahead
+        self._thread = threading.Thread(
+            target=self._run, args=(interval, refresh_ahead), name='cache-warmer', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the periodic warming."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
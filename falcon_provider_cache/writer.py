@@ -0,0 +1,209 @@
+"""Write-behind queues for cache population off the response path."""
+# standard library
+import asyncio
+import inspect
+import queue
+import threading
+import time
+
+# third-party
+from falcon.util import sync_to_async
+
+# first-party
+from falcon_provider_cache.metrics import CacheMetrics
+
+
+def _group(batch: list) -> dict[int, dict]:
+    """Return the batched entries grouped by timeout ({timeout: {key: value}})."""
+    groups: dict[int, dict] = {}
+    for entries, _ in batch:
+        for key, value, timeout in entries:
+            groups.setdefault(timeout, {})[key] = value
+    return groups
+
+
+class WriteBehind:
+    """Bounded write-behind queue drained by a background thread.
+
+    Writes are batched and written using the provider ``set_many`` method (Redis pipeline or
+    memcache set_many). When the queue is full the write is dropped, so a slow cache never slows
+    responses.
+
+    Args:
+        provider: The cache provider.
+        max_size: The maximum number of queued writes.
+        batch_size: The maximum number of queued writes per batch.
+        metrics: The metrics instance used to record dropped and failed writes.
+    """
+
+    def __init__(
+        self,
+        provider: object,
+        max_size: int = 1024,
+        batch_size: int = 64,
+        metrics: CacheMetrics | None = None,
+    ):
+        """Initialize class properties."""
+        self.provider = provider
+        self.batch_size = batch_size
+        self.metrics = metrics or CacheMetrics()
+        self._queue: queue.Queue = queue.Queue(max_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def _start(self):
+        """Start the worker thread if not running (e.g. after a fork)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='cache-write-behind', daemon=True
+                )
+                self._thread.start()
+
+    def put(self, entries: list, tags: tuple = ()) -> bool:
+        """Queue the (key, value, timeout) entries for writing.
+
+        Args:
+            entries: The cache entries to write.
+            tags: The tags for the entries.
+
+        Returns:
+            bool: False if the queue is full and the write was dropped.
+        """
+        self._start()
+        try:
+            self._queue.put_nowait((entries, tags))
+        except queue.Full:
+            self.metrics.record_error('write_dropped')
+            return False
+        return True
+
+    def flush(self):
+        """Block until all queued writes are written."""
+        self._queue.join()
+
+    def _run(self):
+        """Write queued entries in batches."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: list):
+        """Write a batch of entries and tags."""
+        start = time.perf_counter()
+        try:
+            for timeout, mapping in _group(batch).items():
+                self.provider.set_many(mapping, timeout)
+            for entries, tags in batch:
+                if tags:
+                    self.provider.add_tags([e[0] for e in entries], tags, entries[0][2])
+        except Exception:  # pylint: disable=broad-except
+            # cache is best effort, the batch is dropped if the cache is not available
+            self.metrics.record_error('write_behind')
+            return
+        self.metrics.observe_latency('set_many', time.perf_counter() - start)
+
+
+class AsyncWriteBehind:
+    """Bounded write-behind queue drained by a background task (ASGI).
+
+    Args:
+        provider: The cache provider (async or sync).
+        max_size: The maximum number of queued writes.
+        batch_size: The maximum number of queued writes per batch.
+        metrics: The metrics instance used to record dropped and failed writes.
+    """
+
+    def __init__(
+        self,
+        provider: object,
+        max_size: int = 1024,
+        batch_size: int = 64,
+        metrics: CacheMetrics | None = None,
+    ):
+        """Initialize class properties."""
+        self.provider = provider
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.metrics = metrics or CacheMetrics()
+        self._provider_async = inspect.iscoroutinefunction(provider.set_many)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    def _start(self):
+        """Start the worker task if not running on the current event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue(self.max_size)
+            self._task = loop.create_task(self._run(self._queue))
+
+    def put(self, entries: list, tags: tuple = ()) -> bool:
+        """Queue the (key, value, timeout) entries for writing.
+
+        Args:
+            entries: The cache entries to write.
+            tags: The tags for the entries.
+
+        Returns:
+            bool: False if the queue is full and the write was dropped.
+        """
+        self._start()
+        try:
+            self._queue.put_nowait((entries, tags))
+        except asyncio.QueueFull:
+            self.metrics.record_error('write_dropped')
+            return False
+        return True
+
+    async def flush(self):
+        """Wait until all queued writes are written."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _call(self, method: str, *args):
+        """Call a provider method from the event loop."""
+        if self._provider_async:
+            return await getattr(self.provider, method)(*args)
+        return await sync_to_async(getattr(self.provider, method), *args)
+
+    async def _run(self, write_queue: asyncio.Queue):
+        """Write queued entries in batches."""
+        while True:
+            batch = [await write_queue.get()]
+            while len(batch) < self.batch_size and not write_queue.empty():
+                batch.append(write_queue.get_nowait())
+
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    write_queue.task_done()
+
+    async def _write(self, batch: list):
+        """Write a batch of entries and tags."""
+        start = time.perf_counter()
+        try:
+            for timeout, mapping in _group(batch).items():
+                await self._call('set_many', mapping, timeout)
+            for entries, tags in batch:
+                if tags:
+                    await self._call('add_tags', [e[0] for e in entries], tags, entries[0][2])
+        except Exception:  # pylint: disable=broad-except
+            # cache is best effort, the batch is dropped if the cache is not available
+            self.metrics.record_error('write_behind')
+            return
+        self.metrics.observe_latency('set_many', time.perf_counter() - start)
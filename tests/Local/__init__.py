@@ -0,0 +1 @@
+"""Pytest testing suite"""
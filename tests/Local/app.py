@@ -0,0 +1,95 @@
+"""Falcon app used for testing."""
+# standard library
+import os
+import tempfile
+import time
+
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_cache.local import MemoryCacheProvider, SQLiteCacheProvider
+from falcon_provider_cache.middleware import CacheMiddleware
+
+memory_provider = MemoryCacheProvider(max_entries=16)
+sqlite_provider = SQLiteCacheProvider(
+    os.path.join(tempfile.gettempdir(), f'falcon-provider-cache-{os.getpid()}.db'),
+    purge_interval=10,
+)
+
+
+class LocalResource:
+    """Local cache middleware testing resource."""
+
+    cache_control = {
+        'enabled': True,
+        'invalidate': True,
+        'methods': ['GET'],
+        'tags': ['item:{item_id}'],
+        'timeout': 2,
+        'use_query': True,
+    }
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.version = 0
+
+    def on_get(
+        self,
+        req: falcon.Request,  # pylint: disable=unused-argument
+        resp: falcon.Response,
+        item_id: str,
+    ):
+        """Support GET method."""
+        resp.text = f'{item_id}-{self.version}'
+
+    def on_put(
+        self,
+        req: falcon.Request,  # pylint: disable=unused-argument
+        resp: falcon.Response,
+        item_id: str,  # pylint: disable=unused-argument
+    ):
+        """Support PUT method."""
+        self.version += 1
+        resp.status = falcon.HTTP_204
+
+
+class LocalStreamResource:
+    """Local cache middleware testing resource with a slow streamed response."""
+
+    cache_control = {
+        'enabled': True,
+        'lock': True,
+        'lock_wait': 5,
+        'methods': ['GET'],
+        'stream_max_size': 4096,
+        'timeout': 2,
+        'use_query': True,
+    }
+    calls = 0
+
+    def on_get(
+        self,
+        req: falcon.Request,  # pylint: disable=unused-argument
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        LocalStreamResource.calls += 1
+
+        def stream():
+            for i in range(5):
+                time.sleep(0.05)
+                yield str(i).encode() * 100
+
+        resp.content_type = falcon.MEDIA_TEXT
+        resp.stream = stream()
+
+
+local_resource = LocalResource()
+
+app_memory = falcon.App(middleware=[CacheMiddleware(memory_provider)])
+app_memory.add_route('/items/{item_id}', local_resource)
+app_memory.add_route('/stream', LocalStreamResource())
+
+app_sqlite = falcon.App(middleware=[CacheMiddleware(sqlite_provider)])
+app_sqlite.add_route('/items/{item_id}', local_resource)
@@ -0,0 +1,179 @@
+"""Test middleware in-memory provider module."""
+# standard library
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# third-party
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_cache.async_utils import AsyncCacheProvider
+from falcon_provider_cache.local import MemoryCacheProvider
+from falcon_provider_cache.tiered import TieredCacheProvider
+from falcon_provider_cache.utils import CacheProvider
+
+from .app import LocalStreamResource, local_resource, memory_provider
+
+
+def test_memory_get_invalidate(client_memory: object) -> None:
+    """Testing responses are cached and invalidated by unsafe requests.
+
+    Args:
+        client_memory(fixture): The test client.
+    """
+    path = f'/items/{uuid.uuid4().hex}'
+    response: Result = client_memory.simulate_get(path)
+    assert response.headers.get('x-cache') == 'MISS'
+    response = client_memory.simulate_get(path)
+    assert response.headers.get('x-cache') == 'HIT'
+    assert response.text.endswith(f'-{local_resource.version}')
+
+    response = client_memory.simulate_put(path)
+    assert response.status_code == 204
+    response = client_memory.simulate_get(path)
+    assert response.headers.get('x-cache') == 'MISS'
+
+
+def test_memory_provider() -> None:
+    """Testing the provider TTL, entry limit, batch operations and locks."""
+    memory_provider.set_cache('ttl', b'value', 1)
+    assert memory_provider.get_cache('ttl') == b'value'
+    time.sleep(1.1)
+    assert memory_provider.get_cache('ttl') is None
+
+    memory_provider.set_many({f'key-{i}': b'value' for i in range(20)})
+    assert len(memory_provider.cache) == 16
+    assert memory_provider.get_many(['key-0', 'key-19']) == {'key-19': b'value'}
+    memory_provider.delete_many(['key-19'])
+    assert memory_provider.get_cache('key-19') is None
+
+    assert memory_provider.acquire_lock('lock', 10) is True
+    assert memory_provider.acquire_lock('lock', 10) is False
+    memory_provider.release_lock('lock')
+    assert memory_provider.acquire_lock('lock', 10) is True
+    memory_provider.release_lock('lock')
+
+
+def test_memory_tags_bounded() -> None:
+    """Testing the tag indexes only keep the keys of entries in the cache."""
+    provider = MemoryCacheProvider(max_entries=10)
+    for i in range(2000):
+        provider.set_cache(f'bounded-{i}', b'value', 60)
+        provider.add_tags([f'bounded-{i}'], ['path:/items', f'path:/items/{i}'], 60)
+
+    assert len(provider.cache) == 10
+    tags = provider._tags  # pylint: disable=protected-access
+    assert len(tags) <= 4 * provider.cache.max_entries
+    assert tags['path:/items'] >= {f'bounded-{i}' for i in range(1990, 2000)}
+
+    # only the entries in the cache are invalidated
+    assert len(provider.invalidate(tags=['path:/items'])) <= 2 * provider.cache.max_entries
+    assert not provider.get_many([f'bounded-{i}' for i in range(1990, 2000)])
+
+
+def test_memory_stream_coalesce(client_memory: object) -> None:
+    """Testing concurrent GET requests for a streamed response only run the responder once.
+
+    Args:
+        client_memory(fixture): The test client.
+    """
+    LocalStreamResource.calls = 0
+    params = {'key': uuid.uuid4().hex}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        responses: list[Result] = list(
+            executor.map(lambda _: client_memory.simulate_get('/stream', params=params), range(5))
+        )
+
+    # the lock is held until the stream is cached, so the waiters are served the entry
+    assert LocalStreamResource.calls == 1
+    assert all(r.text == ''.join(str(i) * 100 for i in range(5)) for r in responses)
+    assert sorted(r.headers.get('x-cache') for r in responses) == ['HIT'] * 4 + ['MISS']
+
+
+class DictCacheProvider(CacheProvider):
+    """Custom provider implementing only the single key methods."""
+
+    def __init__(self, cache_control: dict | None = None):
+        """Initialize class properties."""
+        super().__init__(cache_control)
+        self.values = {}
+
+    def get_cache(self, key: str) -> bytes | str | None:
+        """Read cache."""
+        return self.values.get(key)
+
+    def set_cache(
+        self,
+        key: str,
+        value: bytes | str,
+        timeout: int | None = None,  # pylint: disable=unused-argument
+    ):
+        """Write cache."""
+        self.values[key] = value
+
+    def delete_cache(self, key: str):
+        """Delete cache."""
+        self.values.pop(key, None)
+
+
+class AsyncDictCacheProvider(AsyncCacheProvider):
+    """Custom async provider implementing only the single key methods."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        super().__init__()
+        self.values = {}
+
+    async def get_cache(self, key: str) -> bytes | str | None:
+        """Read cache."""
+        return self.values.get(key)
+
+    async def set_cache(
+        self,
+        key: str,
+        value: bytes | str,
+        timeout: int | None = None,  # pylint: disable=unused-argument
+    ):
+        """Write cache."""
+        self.values[key] = value
+
+    async def delete_cache(self, key: str):
+        """Delete cache."""
+        self.values.pop(key, None)
+
+
+def test_custom_provider_batch() -> None:
+    """Testing the batch methods of a provider only implementing the single key methods."""
+    provider = DictCacheProvider()
+    provider.set_many({'a': b'1', 'b': b'2'}, 10)
+    assert provider.get_many(['a', 'b', 'c']) == {'a': b'1', 'b': b'2'}
+    provider.delete_many(['a', 'c'])
+    assert provider.values == {'b': b'2'}
+
+    async def batch(provider: AsyncDictCacheProvider) -> dict:
+        await provider.set_many({'a': b'1', 'b': b'2'}, 10)
+        await provider.delete_many(['a', 'c'])
+        return await provider.get_many(['a', 'b'])
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(batch(AsyncDictCacheProvider())) == {'b': b'2'}
+    finally:
+        loop.close()
+
+
+def test_custom_provider_tiered_timeout() -> None:
+    """Testing L1 entries use the cache timeout when the remote provider has no TTL."""
+    remote = DictCacheProvider({'timeout': 1})
+    provider = TieredCacheProvider(remote, timeout=30)
+    remote.set_cache('a', b'1')
+    assert provider.get_cache('a') == b'1'
+
+    # the entry is read from the L1 tier until the cache timeout
+    remote.delete_cache('a')
+    assert provider.get_cache('a') == b'1'
+    time.sleep(1.1)
+    assert provider.get_cache('a') is None
@@ -0,0 +1,66 @@
+"""Test middleware SQLite provider module."""
+# standard library
+import threading
+import uuid
+
+# third-party
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_cache.local import SQLiteCacheProvider
+
+from .app import sqlite_provider
+
+
+def test_sqlite_get_invalidate(client_sqlite: object) -> None:
+    """Testing responses are cached and invalidated by unsafe requests.
+
+    Args:
+        client_sqlite(fixture): The test client.
+    """
+    path = f'/items/{uuid.uuid4().hex}'
+    response: Result = client_sqlite.simulate_get(path)
+    assert response.headers.get('x-cache') == 'MISS'
+    response = client_sqlite.simulate_get(path)
+    assert response.headers.get('x-cache') == 'HIT'
+
+    response = client_sqlite.simulate_put(path)
+    assert response.status_code == 204
+    response = client_sqlite.simulate_get(path)
+    assert response.headers.get('x-cache') == 'MISS'
+
+
+def test_sqlite_shared() -> None:
+    """Testing entries and locks are shared by providers using the same database."""
+    other = SQLiteCacheProvider(sqlite_provider.path)
+    key = uuid.uuid4().hex
+    sqlite_provider.set_cache(key, b'value', 10)
+    assert other.get_cache(key) == b'value'
+
+    assert sqlite_provider.acquire_lock(key, 10) is True
+    assert other.acquire_lock(key, 10) is False
+    sqlite_provider.release_lock(key)
+    assert other.acquire_lock(key, 10) is True
+    other.release_lock(key)
+
+    # each thread uses its own connection
+    values = []
+    thread = threading.Thread(target=lambda: values.append(other.get_cache(key)))
+    thread.start()
+    thread.join()
+    assert values == [b'value']
+
+
+def test_sqlite_many() -> None:
+    """Testing batch operations with more keys than the SQL variable limit."""
+    mapping = {f'{uuid.uuid4().hex}-{i}': f'value-{i}'.encode() for i in range(1500)}
+    sqlite_provider.set_many(mapping, 10)
+    keys = [*mapping, 'missing']
+    assert sqlite_provider.get_many(keys) == mapping
+
+    sqlite_provider.delete_many(keys)
+    assert not sqlite_provider.get_many(keys)
+
+    # expired entries are not returned
+    sqlite_provider.set_cache('expired', b'value', -1)
+    assert sqlite_provider.get_cache('expired') is None
@@ -4,8 +4,10 @@ import os
 
 # third-party
 import falcon
+import falcon.asgi
 
 # first-party
+from falcon_provider_cache.async_utils import AsyncMemcacheProvider
 from falcon_provider_cache.middleware import CacheMiddleware
 from falcon_provider_cache.utils import MemcacheProvider
 
@@ -86,3 +88,45 @@ app_memcache_global = falcon.App(
     middleware=[CacheMiddleware(memcache_provider_global_cache_control)]
 )
 app_memcache_global.add_route('/middleware', MemcacheGlobalResource())
+
+
+class MemcacheAsyncResource:
+    """Memcache cache middleware testing resource with tag invalidation for ASGI."""
+
+    cache_control = {
+        'enabled': True,
+        'invalidate': True,
+        'methods': ['GET'],
+        'tags': ['item:{item_id}'],
+        'timeout': 10,
+    }
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.version = 0
+
+    async def on_get(
+        self,
+        req: falcon.asgi.Request,  # pylint: disable=unused-argument
+        resp: falcon.asgi.Response,
+        item_id: str,
+    ):
+        """Support GET method."""
+        resp.text = f'{item_id}-{self.version}'
+
+    async def on_put(
+        self,
+        req: falcon.asgi.Request,  # pylint: disable=unused-argument
+        resp: falcon.asgi.Response,
+        item_id: str,  # pylint: disable=unused-argument
+    ):
+        """Support PUT method."""
+        self.version += 1
+        resp.status = falcon.HTTP_204
+
+
+# async provider (requires aiomcache)
+memcache_provider_async = AsyncMemcacheProvider(host=MEMCACHE_HOST, port=MEMCACHE_PORT)
+app_memcache_async = falcon.asgi.App(middleware=[CacheMiddleware(memcache_provider_async)])
+memcache_async_resource = MemcacheAsyncResource()
+app_memcache_async.add_route('/items/{item_id}', memcache_async_resource)
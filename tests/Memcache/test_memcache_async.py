@@ -0,0 +1,86 @@
+"""Test async middleware memcache provider module."""
+# standard library
+import asyncio
+import uuid
+
+# third-party
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_cache.async_utils import AsyncCacheProvider
+from falcon_provider_cache.utils import CacheProvider
+
+from .app import memcache_async_resource, memcache_provider_async
+
+
+def test_memcache_async_provider() -> None:
+    """Testing the async provider is not a sync provider."""
+    assert isinstance(memcache_provider_async, AsyncCacheProvider)
+    assert not isinstance(memcache_provider_async, CacheProvider)
+
+
+def test_memcache_async_get(client_memcache_async: object) -> None:
+    """Testing GET method
+
+    Args:
+        client_memcache_async (fixture): The test client.
+    """
+    item_id = uuid.uuid4().hex
+    response: Result = client_memcache_async.simulate_get(f'/items/{item_id}')
+    assert response.headers.get('x-cache') == 'MISS'
+
+    response = client_memcache_async.simulate_get(f'/items/{item_id}')
+    assert response.status_code == 200
+    assert response.text == f'{item_id}-{memcache_async_resource.version}'
+    assert response.headers.get('x-cache') == 'HIT'
+
+
+def test_memcache_async_tags(client_memcache_async: object) -> None:
+    """Testing a successful PUT invalidates the cached entry (new tag generation).
+
+    Args:
+        client_memcache_async (fixture): The test client.
+    """
+    item_id = uuid.uuid4().hex
+    version = memcache_async_resource.version
+    client_memcache_async.simulate_get(f'/items/{item_id}')
+    response: Result = client_memcache_async.simulate_get(f'/items/{item_id}')
+    assert response.headers.get('x-cache') == 'HIT'
+
+    response = client_memcache_async.simulate_put(f'/items/{item_id}')
+    assert response.status_code == 204
+
+    response = client_memcache_async.simulate_get(f'/items/{item_id}')
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.text == f'{item_id}-{version + 1}'
+
+
+def test_memcache_async_tag_key_race(monkeypatch: object) -> None:
+    """Testing the stored generation is used when another request adds the tag first.
+
+    Args:
+        monkeypatch(fixture): The pytest monkeypatch fixture.
+    """
+    tag = f'race-{uuid.uuid4().hex}'
+    client = memcache_provider_async.memcache_client
+
+    async def multi_get(*keys: bytes) -> tuple:
+        """Return the tags as not cached."""
+        return (None,) * len(keys)
+
+    async def tag_keys() -> tuple:
+        """Return the cache key before and after another request added the tag."""
+        await client.set(f'tag:{tag}'.encode(), b'winner')
+        cache_key = await memcache_provider_async.tag_key('key', [tag])
+
+        # the generation is added by another request after this request read the tags
+        monkeypatch.setattr(client, 'multi_get', multi_get)
+        return cache_key, await memcache_provider_async.tag_key('key', [tag])
+
+    # a private loop, asyncio.run would close and unset the current event loop
+    loop = asyncio.new_event_loop()
+    try:
+        cache_key, race_key = loop.run_until_complete(tag_keys())
+    finally:
+        loop.close()
+    assert race_key == cache_key
@@ -0,0 +1,21 @@
+"""Test memcache provider tag generations."""
+# standard library
+import uuid
+
+from .app import memcache_provider
+
+
+def test_memcache_tag_key_race(monkeypatch: object) -> None:
+    """Testing the stored generation is used when another request adds the tag first.
+
+    Args:
+        monkeypatch(fixture): The pytest monkeypatch fixture.
+    """
+    tag = f'race-{uuid.uuid4().hex}'
+    client = memcache_provider.memcache_client
+    client.set(f'tag:{tag}', 'winner', expire=0)
+    cache_key = memcache_provider.tag_key('key', [tag])
+
+    # the generation is added by another request after this request read the tags
+    monkeypatch.setattr(client, 'get_many', lambda keys: {})
+    assert memcache_provider.tag_key('key', [tag]) == cache_key
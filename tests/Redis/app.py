@@ -1,13 +1,23 @@
 """Falcon app used for testing."""
+
 # standard library
 import os
+import time
 
 # third-party
 import falcon
+import falcon.asgi
 
 # first-party
+from falcon_provider_cache.async_utils import AsyncRedisCacheProvider
+from falcon_provider_cache.breaker import CircuitBreaker
+from falcon_provider_cache.compression import Compressor
+from falcon_provider_cache.metrics import CacheMetrics
 from falcon_provider_cache.middleware import CacheMiddleware
+from falcon_provider_cache.sharded import ShardedCacheProvider
+from falcon_provider_cache.tiered import TieredCacheProvider
 from falcon_provider_cache.utils import RedisCacheProvider
+from falcon_provider_cache.warming import WarmingLog
 
 # redis server
 REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
@@ -39,3 +49,662 @@ class RedisResource:
 
 app_redis = falcon.App(middleware=[CacheMiddleware(redis_provider)])
 app_redis.add_route('/middleware', RedisResource())
+
+
+class RedisMethodResource:
+    """Redis cache middleware testing resource using per method cache control."""
+
+    cache_control = {
+        'GET': {
+            'enabled': True,
+            'timeout': 2,
+            'use_query': True,
+        }
+    }
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        key = req.get_param('key')
+        resp.text = f'{key}-worked'
+        resp.status_code = falcon.HTTP_OK
+
+    def on_post(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support POST method."""
+        key = req.get_param('key')
+        resp.text = f'{key}-posted'
+        resp.status_code = falcon.HTTP_OK
+
+
+app_redis.add_route('/method', RedisMethodResource())
+
+
+class RedisAsyncResource:
+    """Redis cache middleware testing resource for ASGI."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'private': False,
+        'timeout': 2,
+        'use_query': True,
+    }
+
+    async def on_get(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+    ):
+        """Support GET method."""
+        key = req.get_param('key')
+        resp.text = f'{key}-worked'
+        resp.status_code = falcon.HTTP_OK
+
+
+redis_provider_async = AsyncRedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT)
+app_redis_async = falcon.asgi.App(middleware=[CacheMiddleware(redis_provider_async)])
+app_redis_async.add_route('/middleware', RedisAsyncResource())
+
+
+class RedisAsyncTagResource:
+    """Redis cache middleware testing resource with tag invalidation for ASGI."""
+
+    cache_control = {
+        'enabled': True,
+        'invalidate': True,
+        'methods': ['GET'],
+        'timeout': 10,
+    }
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.version = 0
+
+    async def on_get(
+        self,
+        req: falcon.asgi.Request,  # pylint: disable=unused-argument
+        resp: falcon.asgi.Response,
+        user_id: str,
+    ):
+        """Support GET method."""
+        resp.text = f'{user_id}-{self.version}'
+
+    async def on_put(
+        self,
+        req: falcon.asgi.Request,  # pylint: disable=unused-argument
+        resp: falcon.asgi.Response,
+        user_id: str,  # pylint: disable=unused-argument
+    ):
+        """Support PUT method."""
+        self.version += 1
+        resp.status = falcon.HTTP_204
+
+
+app_redis_async.add_route('/users/{user_id}', RedisAsyncTagResource())
+
+# provider with an in-process L1 tier
+redis_provider_tiered = TieredCacheProvider(redis_provider, max_entries=10, timeout=1)
+app_redis_tiered = falcon.App(middleware=[CacheMiddleware(redis_provider_tiered)])
+app_redis_tiered.add_route('/middleware', RedisResource())
+
+
+class RedisLockResource:
+    """Redis cache middleware testing resource with request coalescing."""
+
+    cache_control = {
+        'enabled': True,
+        'lock': True,
+        'lock_wait': 2,
+        'methods': ['GET'],
+        'timeout': 2,
+        'use_query': True,
+    }
+    calls = 0
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        RedisLockResource.calls += 1
+        time.sleep(0.5)  # simulate an expensive responder
+        key = req.get_param('key')
+        resp.text = f'{key}-worked'
+        resp.status_code = falcon.HTTP_OK
+
+
+app_redis.add_route('/lock', RedisLockResource())
+
+
+class RedisStaleResource:
+    """Redis cache middleware testing resource with stale serving."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'stale_if_error': 10,
+        'stale_while_revalidate': 10,
+        'timeout': 1,
+        'use_query': True,
+    }
+    calls = 0
+    fail = False
+    requests: list = []
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        if RedisStaleResource.fail:
+            raise falcon.HTTPServiceUnavailable()
+
+        RedisStaleResource.calls += 1
+        RedisStaleResource.requests.append(req)
+        key = req.get_param('key')
+        resp.text = f'{key}-worked-{RedisStaleResource.calls}'
+        resp.status_code = falcon.HTTP_OK
+
+
+app_redis.add_route('/stale', RedisStaleResource())
+
+
+class RedisAsyncStaleResource:
+    """Redis cache middleware testing resource with stale serving for ASGI."""
+
+    cache_control = {
+        'enabled': True,
+        'key_headers': ['Accept-Language'],
+        'methods': ['GET'],
+        'stale_while_revalidate': 10,
+        'timeout': 1,
+        'use_query': True,
+    }
+    requests: list = []
+
+    async def on_get(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+    ):
+        """Support GET method."""
+        RedisAsyncStaleResource.requests.append(req)
+        key = req.get_param('key')
+        resp.text = f'{key}-{req.get_header("Accept-Language")}-{len(self.requests)}'
+
+
+app_redis_async.add_route('/stale', RedisAsyncStaleResource())
+
+
+class RedisMediaResource:
+    """Redis cache middleware testing resource returning media."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'timeout': 2,
+        'use_query': True,
+    }
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        key = req.get_param('key')
+        resp.media = {'key': key, 'status': 'worked'}
+        resp.etag = f'"{key}"'
+        resp.status = falcon.HTTP_202
+
+
+class RedisBinaryResource:
+    """Redis cache middleware testing resource returning binary data."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'timeout': 2,
+    }
+
+    def on_get(
+        self,
+        req: falcon.Request,  # pylint: disable=unused-argument
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        resp.content_type = falcon.MEDIA_PNG
+        resp.data = bytes(range(256))
+
+
+app_redis.add_route('/media', RedisMediaResource())
+app_redis.add_route('/binary', RedisBinaryResource())
+
+
+class RedisLargeResource:
+    """Redis cache middleware testing resource returning a large response."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'timeout': 2,
+        'use_query': True,
+    }
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        key = req.get_param('key')
+        resp.media = {'key': key, 'items': [f'{key}-{i}' for i in range(500)]}
+
+
+# provider with compression
+redis_provider_compressed = RedisCacheProvider(
+    host=REDIS_HOST, port=REDIS_PORT, compressor=Compressor(threshold=256)
+)
+app_redis_compressed = falcon.App(middleware=[CacheMiddleware(redis_provider_compressed)])
+app_redis_compressed.add_route('/middleware', RedisLargeResource())
+
+
+class RedisETagResource:
+    """Redis cache middleware testing resource with conditional requests."""
+
+    cache_control = {
+        'enabled': True,
+        'etag': True,
+        'methods': ['GET'],
+        'timeout': 2,
+        'use_query': True,
+    }
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        key = req.get_param('key')
+        resp.text = f'{key}-worked'
+
+
+app_redis.add_route('/etag', RedisETagResource())
+
+
+class RedisTagResource:
+    """Redis cache middleware testing resource with tag invalidation."""
+
+    cache_control = {
+        'enabled': True,
+        'invalidate': True,
+        'methods': ['GET'],
+        'tags': ['user:{user_id}'],
+        'timeout': 10,
+    }
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.version = 0
+
+    def on_get(
+        self,
+        req: falcon.Request,  # pylint: disable=unused-argument
+        resp: falcon.Response,
+        user_id: str = 'all',
+    ):
+        """Support GET method."""
+        resp.text = f'{user_id}-{self.version}'
+
+    def on_put(
+        self,
+        req: falcon.Request,  # pylint: disable=unused-argument
+        resp: falcon.Response,
+        user_id: str = 'all',  # pylint: disable=unused-argument
+    ):
+        """Support PUT method."""
+        self.version += 1
+        resp.status = falcon.HTTP_204
+
+
+redis_tag_resource = RedisTagResource()
+app_redis.add_route('/users', redis_tag_resource)
+app_redis.add_route('/users/{user_id}', redis_tag_resource)
+app_redis.add_route('/users/{user_id}/posts', redis_tag_resource)
+
+
+class RedisKeyResource:
+    """Redis cache middleware testing resource with a cache key template."""
+
+    cache_control = {
+        'enabled': True,
+        'key_headers': ['Accept-Language'],
+        'key_params': ['key'],
+        'methods': ['GET'],
+        'timeout': 2,
+        'use_query': True,
+    }
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        key = req.get_param('key')
+        resp.text = f'{key}-{req.get_header("Accept-Language")}-worked'
+
+
+app_redis.add_route('/key', RedisKeyResource())
+
+
+class RecordingMetrics(CacheMetrics):
+    """Cache metrics that keep the recorded values for testing."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.errors = []
+        self.latency = []
+        self.results = []
+        self.size = []
+
+    def record_result(self, route: str, result: str):
+        """Record the cache result for a request."""
+        self.results.append((route, result))
+
+    def record_error(self, operation: str):
+        """Record a cache backend error."""
+        self.errors.append(operation)
+
+    def observe_latency(self, operation: str, seconds: float):
+        """Record the latency of a cache backend operation."""
+        self.latency.append((operation, seconds))
+
+    def observe_size(self, operation: str, size: int):
+        """Record the size of a payload read from or written to the cache backend."""
+        self.size.append((operation, size))
+
+
+redis_metrics = RecordingMetrics()
+app_redis_metrics = falcon.App(middleware=[CacheMiddleware(redis_provider, metrics=redis_metrics)])
+app_redis_metrics.add_route('/users/{user_id}', RedisTagResource())
+
+redis_write_behind = CacheMiddleware(redis_provider, write_behind=True)
+app_redis_write_behind = falcon.App(middleware=[redis_write_behind])
+app_redis_write_behind.add_route('/middleware', RedisETagResource())
+
+
+class RedisFailingCacheProvider(RedisCacheProvider):
+    """Redis cache provider that fails reads while failing is set."""
+
+    failing = False
+    reads = 0
+
+    def get_cache(self, key: str) -> bytes | str | None:
+        """Read cache from Redis or fail."""
+        self.reads += 1
+        if self.failing:
+            raise ConnectionError('cache backend unavailable')
+        return super().get_cache(key)
+
+
+redis_provider_failing = RedisFailingCacheProvider(host=REDIS_HOST, port=REDIS_PORT)
+redis_breaker = CircuitBreaker(failure_threshold=2, window=10, reset_timeout=1)
+app_redis_breaker = falcon.App(
+    middleware=[CacheMiddleware(redis_provider_failing, circuit_breaker=redis_breaker)]
+)
+app_redis_breaker.add_route('/middleware', RedisETagResource())
+
+# provider distributing keys across multiple nodes (databases for testing)
+redis_provider_sharded = ShardedCacheProvider(
+    {
+        f'redis-{db}': RedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT, db=db)
+        for db in (1, 2, 3)
+    },
+    eject_after=2,
+)
+app_redis_sharded = falcon.App(middleware=[CacheMiddleware(redis_provider_sharded)])
+app_redis_sharded.add_route('/middleware', RedisETagResource())
+
+
+class RedisVaryResource:
+    """Redis cache middleware testing resource with content negotiation."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'timeout': 2,
+        'use_query': True,
+        'vary': ['Accept-Encoding', 'Accept-Language'],
+    }
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        key = req.get_param('key')
+        resp.text = f'{key}-{req.get_header("Accept-Language")}-worked'
+
+
+app_redis.add_route('/vary', RedisVaryResource())
+
+
+class RedisHeadersResource:
+    """Redis cache middleware testing resource with HTTP cache headers."""
+
+    cache_control = {
+        'cache_headers': True,
+        'enabled': True,
+        'methods': ['GET'],
+        's_maxage': 30,
+        'stale_while_revalidate': 5,
+        'timeout': 10,
+        'use_query': True,
+    }
+    calls = 0
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        RedisHeadersResource.calls += 1
+        key = req.get_param('key')
+        resp.text = f'{key}-worked'
+
+
+app_redis_trusted = falcon.App(
+    middleware=[CacheMiddleware(redis_provider, trust_request_cache_control=True)]
+)
+app_redis_trusted.add_route('/headers', RedisHeadersResource())
+app_redis.add_route('/headers', RedisHeadersResource())
+app_redis_breaker.add_route('/headers', RedisHeadersResource())
+
+
+class RedisWarmResource:
+    """Redis cache middleware testing resource for cache warming."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'timeout': 10,
+        'use_query': True,
+    }
+    calls = 0
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        RedisWarmResource.calls += 1
+        key = req.get_param('key')
+        resp.text = f'{key}-worked'
+
+
+redis_warming_log = WarmingLog()
+app_redis_warm = falcon.App(
+    middleware=[CacheMiddleware(redis_provider, warming_log=redis_warming_log)]
+)
+app_redis_warm.add_route('/warm', RedisWarmResource())
+
+
+class RedisNegativeResource:
+    """Redis cache middleware testing resource with negative caching."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'status_timeouts': {404: 1},
+        'timeout': 10,
+        'use_query': True,
+    }
+    calls = 0
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        RedisNegativeResource.calls += 1
+        key = req.get_param('key')
+        if key.startswith('missing'):
+            raise falcon.HTTPNotFound(description=f'{key} not found')
+        if key.startswith('error'):
+            resp.status = falcon.HTTP_503
+        resp.text = f'{key}-worked'
+
+
+app_redis.add_route('/negative', RedisNegativeResource())
+
+
+class RedisStreamResource:
+    """Redis cache middleware testing resource with a streamed response."""
+
+    cache_control = {
+        'enabled': True,
+        'methods': ['GET'],
+        'stream_max_size': 4096,
+        'timeout': 10,
+        'use_query': True,
+    }
+    calls = 0
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        RedisStreamResource.calls += 1
+        size = req.get_param_as_int('size')
+        resp.content_type = falcon.MEDIA_TEXT
+        resp.stream = (str(i % 10).encode() * 100 for i in range(size // 100))
+
+
+app_redis_stream = falcon.App(middleware=[CacheMiddleware(redis_provider, stream_chunk_size=1000)])
+app_redis_stream.add_route('/stream', RedisStreamResource())
+
+
+class RedisAsyncStreamResource:
+    """Redis cache middleware testing resource with a streamed response for ASGI."""
+
+    cache_control = RedisStreamResource.cache_control
+
+    async def on_get(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+    ):
+        """Support GET method."""
+        size = req.get_param_as_int('size')
+
+        async def stream():
+            for i in range(size // 100):
+                yield str(i % 10).encode() * 100
+
+        resp.content_type = falcon.MEDIA_TEXT
+        resp.stream = stream()
+
+
+app_redis_stream_async = falcon.asgi.App(
+    middleware=[CacheMiddleware(redis_provider_async, stream_chunk_size=1000)]
+)
+app_redis_stream_async.add_route('/stream', RedisAsyncStreamResource())
+
+
+class RedisAdmissionResource:
+    """Redis cache middleware testing resource with an admission filter."""
+
+    cache_control = {
+        'admit_after': 2,
+        'enabled': True,
+        'methods': ['GET'],
+        'timeout': 10,
+        'use_query': True,
+    }
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        key = req.get_param('key')
+        resp.text = f'{key}-worked'
+
+
+app_redis.add_route('/admission', RedisAdmissionResource())
+
+
+class RedisAdmissionHeadersResource(RedisAdmissionResource):
+    """Redis cache middleware testing resource with an admission filter and cache headers."""
+
+    cache_control = {
+        **RedisAdmissionResource.cache_control,
+        'admit_after': 3,
+        'cache_headers': True,
+    }
+
+
+app_redis.add_route('/admission-headers', RedisAdmissionHeadersResource())
+
+
+class RedisAdaptiveResource:
+    """Redis cache middleware testing resource with an adaptive TTL."""
+
+    cache_control = {
+        'cache_headers': True,
+        'enabled': True,
+        'max_timeout': 8,
+        'methods': ['GET'],
+        'timeout': 1,
+        'use_query': True,
+    }
+
+    def on_get(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+    ):
+        """Support GET method."""
+        key = req.get_param('key')
+        resp.text = f'{key}-worked'
+
+
+app_redis.add_route('/adaptive', RedisAdaptiveResource())
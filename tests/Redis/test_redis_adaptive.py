@@ -0,0 +1,76 @@
+"""Test middleware redis provider admission and adaptive TTLs."""
+# standard library
+import time
+import uuid
+
+# third-party
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_cache.adaptive import FrequencySketch, adaptive_timeout
+
+from .app import redis_provider
+
+
+def test_redis_admission(client_redis: object) -> None:
+    """Testing responses are only written once the key was requested admit_after times.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': uuid.uuid4().hex}
+    for x_cache in ('MISS', 'MISS', 'HIT'):
+        response: Result = client_redis.simulate_get('/admission', params=params)
+        assert response.headers.get('x-cache') == x_cache
+        assert response.text == f'{params["key"]}-worked'
+
+
+def test_redis_adaptive_ttl(client_redis: object, monkeypatch: object) -> None:
+    """Testing the TTL grows when the entry is regenerated with the same content.
+
+    Args:
+        client_redis(fixture): The test client.
+        monkeypatch(fixture): The pytest monkeypatch fixture.
+    """
+    keys = []
+    get_cache = redis_provider.get_cache
+
+    def get_cache_keys(key: str) -> bytes | str | None:
+        keys.append(key)
+        return get_cache(key)
+
+    monkeypatch.setattr(redis_provider, 'get_cache', get_cache_keys)
+    params = {'key': uuid.uuid4().hex}
+    for max_age in (1, 2):
+        response: Result = client_redis.simulate_get('/adaptive', params=params)
+        assert response.headers.get('x-cache') == 'MISS'
+        assert response.headers.get('cache-control') == f'public, max-age={max_age}'
+        time.sleep(max_age + 0.1)
+
+    # the TTL state is read with the entry, not with a separate read on the miss
+    assert not [k for k in keys if k.endswith('.ttl')]
+
+
+def test_adaptive_timeout() -> None:
+    """Testing the TTL is doubled for unchanged content up to the max and reset on change."""
+    ttl, state = adaptive_timeout(None, 'abc', 10, 35)
+    assert (ttl, state) == (10, b'abc:10')
+    ttl, state = adaptive_timeout(state, 'abc', 10, 35)
+    assert ttl == 20
+    ttl, state = adaptive_timeout(state.decode(), 'abc', 10, 35)
+    assert ttl == 35
+    assert adaptive_timeout(state, 'changed', 10, 35) == (10, b'changed:10')
+
+
+def test_frequency_sketch() -> None:
+    """Testing the sketch counts keys and ages the counters."""
+    sketch = FrequencySketch(width=1024, sample_size=10)
+    for i in range(3):
+        assert sketch.increment('hot') == i + 1
+    assert sketch.estimate('hot') == 3
+    assert sketch.estimate('cold') == 0
+
+    # the counters are halved after sample_size increments
+    for i in range(7):
+        sketch.increment(f'key-{i}')
+    assert sketch.estimate('hot') == 1
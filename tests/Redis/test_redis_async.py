@@ -0,0 +1,81 @@
+"""Test async middleware redis provider module."""
+# standard library
+import time
+
+# third-party
+import falcon
+import pytest
+from falcon.testing import Result, create_req
+
+# first-party
+from falcon_provider_cache.middleware import CacheMiddleware
+
+from .app import RedisAsyncResource, redis_provider, redis_provider_async
+
+
+def test_redis_async_get(client_redis_async: object) -> None:
+    """Testing GET method
+
+    Args:
+        client_redis_async(fixture): The test client.
+    """
+    params = {'key': 'async'}
+    response: Result = client_redis_async.simulate_get('/middleware', params=params)
+
+    # make request to cache
+    if response.headers.get('x-cache') == 'MISS':
+        response = client_redis_async.simulate_get('/middleware', params=params)
+
+    assert response.text == 'async-worked'
+    assert response.status_code == 200
+    assert response.headers.get('x-cache') == 'HIT'
+
+
+def test_redis_async_get_cache_timeout(client_redis_async: object) -> None:
+    """Testing GET method
+
+    Args:
+        client_redis_async(fixture): The test client.
+    """
+    # make request to ensure data is cached
+    params = {'key': 'async'}
+    response: Result = client_redis_async.simulate_get('/middleware', params=params)
+
+    # assume cache timeout is set to 2 seconds
+    time.sleep(3)
+    response = client_redis_async.simulate_get('/middleware', params=params)
+
+    assert response.text == 'async-worked'
+    assert response.status_code == 200
+    assert response.headers.get('x-cache') == 'MISS'
+
+
+def test_redis_async_tags(client_redis_async: object) -> None:
+    """Testing a successful PUT invalidates the cached entry for the path.
+
+    Args:
+        client_redis_async(fixture): The test client.
+    """
+    try:
+        response: Result = client_redis_async.simulate_get('/users/async')
+        assert response.headers.get('x-cache') == 'MISS'
+        response = client_redis_async.simulate_get('/users/async')
+        assert response.headers.get('x-cache') == 'HIT'
+
+        response = client_redis_async.simulate_put('/users/async')
+        assert response.status_code == 204
+
+        response = client_redis_async.simulate_get('/users/async')
+        assert response.headers.get('x-cache') == 'MISS'
+    finally:
+        # remove the tag index sets (same database as the async provider)
+        tags = redis_provider.path_tags('/users/async')
+        redis_provider.redis_client.delete(*(f'tag:{t}' for t in tags))
+
+
+def test_redis_async_provider_wsgi() -> None:
+    """Testing an async provider used with a WSGI app raises a clear error."""
+    middleware = CacheMiddleware(redis_provider_async)
+    req = create_req(path='/middleware', query_string='key=async-wsgi')
+    with pytest.raises(TypeError, match='AsyncRedisCacheProvider requires a falcon.asgi.App'):
+        middleware.process_resource(req, falcon.Response(), RedisAsyncResource(), {})
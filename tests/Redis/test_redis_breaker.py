@@ -0,0 +1,39 @@
+"""Test middleware redis provider circuit breaker."""
+# standard library
+import time
+
+# third-party
+from falcon.testing import Result
+
+from .app import redis_breaker, redis_provider_failing
+
+
+def test_redis_breaker(client_redis_breaker: object) -> None:
+    """Testing the cache is bypassed while the circuit breaker is open.
+
+    Args:
+        client_redis_breaker(fixture): The test client.
+    """
+    params = {'key': 'breaker'}
+    redis_provider_failing.failing = True
+    for _ in range(2):
+        response: Result = client_redis_breaker.simulate_get('/middleware', params=params)
+        assert response.status_code == 200
+    assert redis_breaker.state == redis_breaker.OPEN
+
+    # the cache is not used while the breaker is open
+    reads = redis_provider_failing.reads
+    response = client_redis_breaker.simulate_get('/middleware', params=params)
+    assert response.text == 'breaker-worked'
+    assert response.headers.get('x-cache') == 'MISS'
+    assert redis_provider_failing.reads == reads
+
+    # a probe request closes the breaker once the backend recovered
+    redis_provider_failing.failing = False
+    time.sleep(1.1)
+    response = client_redis_breaker.simulate_get('/middleware', params=params)
+    assert redis_provider_failing.reads > reads
+    assert redis_breaker.state == redis_breaker.CLOSED
+
+    response = client_redis_breaker.simulate_get('/middleware', params=params)
+    assert response.headers.get('x-cache') == 'HIT'
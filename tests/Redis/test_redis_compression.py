@@ -0,0 +1,57 @@
+"""Test middleware redis provider compression."""
+# third-party
+from falcon.testing import Result, create_req
+
+# first-party
+from falcon_provider_cache.compression import Compressor
+from falcon_provider_cache.utils import RedisCacheProvider
+
+from .app import REDIS_HOST, REDIS_PORT, RedisLargeResource, redis_provider_compressed
+
+
+def test_redis_compression(client_redis_compressed: object) -> None:
+    """Testing GET method with a compressed cache entry.
+
+    Args:
+        client_redis_compressed(fixture): The test client.
+    """
+    params = {'key': 'compressed'}
+    response: Result = client_redis_compressed.simulate_get('/middleware', params=params)
+
+    # make request to cache
+    if response.headers.get('x-cache') == 'MISS':
+        response = client_redis_compressed.simulate_get('/middleware', params=params)
+
+    assert response.json['items'][-1] == 'compressed-499'
+    assert response.status_code == 200
+    assert response.headers.get('x-cache') == 'HIT'
+
+    # the raw stored value is compressed and smaller than the response
+    resource = RedisLargeResource()
+    req = create_req(path='/middleware', query_string='key=compressed')
+    policy = redis_provider_compressed.cache_policy(resource, 'GET')
+    cache_key = redis_provider_compressed.cache_key(req, resource, policy)
+    raw = redis_provider_compressed.redis_client.execute_command(
+        'GET', cache_key, NEVER_DECODE=True
+    )
+    assert raw.startswith(b'\xfcZ')
+    assert len(raw) < len(response.content)
+
+
+def test_redis_compression_algorithms() -> None:
+    """Testing values compressed with the zstd and lz4 algorithms."""
+    value = b'compressed-value ' * 100
+    for algorithm in ('zstd', 'lz4'):
+        provider = RedisCacheProvider(
+            host=REDIS_HOST, port=REDIS_PORT, compressor=Compressor(algorithm, threshold=256)
+        )
+        provider.set_cache(f'compression-{algorithm}', value, 5)
+        raw = provider.redis_client.execute_command(
+            'GET', f'compression-{algorithm}', NEVER_DECODE=True
+        )
+        assert raw.startswith(b'\xfcZ')
+        assert len(raw) < len(value)
+        assert provider.get_cache(f'compression-{algorithm}') == value
+
+        # the zlib provider reads the values compressed with the other algorithms
+        assert redis_provider_compressed.get_cache(f'compression-{algorithm}') == value
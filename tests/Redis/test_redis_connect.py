@@ -0,0 +1,60 @@
+"""Test redis provider lazy and fork-safe connections."""
+# standard library
+import multiprocessing
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_cache.utils import CacheProvider, ClientMixin, RedisCacheProvider
+
+from .app import REDIS_HOST, REDIS_PORT, redis_provider_sharded
+
+
+def _child_client(provider: RedisCacheProvider, parent_client: object, conn: object):
+    """Send whether the provider uses a new client in the forked process."""
+    client = provider.redis_client
+    conn.send(client is not parent_client and provider.redis_client is client)
+    conn.close()
+
+
+def test_redis_connect_lazy() -> None:
+    """Testing the client is created on first use or by connect."""
+    provider = RedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT)
+    assert provider._cache_client is None  # pylint: disable=protected-access
+
+    provider.connect()
+    client = provider.redis_client
+    assert client is not None
+    assert provider.redis_client is client
+
+    # the nodes of a sharded provider are all connected
+    redis_provider_sharded.connect()
+    for node in redis_provider_sharded.nodes.values():
+        assert node._cache_client is not None  # pylint: disable=protected-access
+
+
+def test_redis_connect_fork() -> None:
+    """Testing the client is recreated in a forked process."""
+    provider = RedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT)
+    client = provider.redis_client
+
+    context = multiprocessing.get_context('fork')
+    parent_conn, child_conn = context.Pipe()
+    process = context.Process(target=_child_client, args=(provider, client, child_conn))
+    process.start()
+    assert parent_conn.recv() is True
+    process.join()
+
+    # the parent keeps its client
+    assert provider.redis_client is client
+
+
+def test_redis_connect_create_client() -> None:
+    """Testing a client provider without _create_client fails when it is created."""
+
+    class ClientProvider(ClientMixin, CacheProvider):  # pylint: disable=abstract-method
+        """Client provider missing _create_client."""
+
+    with pytest.raises(TypeError, match='_create_client'):
+        ClientProvider()  # pylint: disable=abstract-class-instantiated
@@ -0,0 +1,79 @@
+"""Test middleware redis provider conditional requests."""
+# standard library
+import time
+
+# third-party
+import falcon
+from falcon.testing import Result, create_req
+
+# first-party
+from falcon_provider_cache.middleware import CacheMiddleware
+
+from .app import RedisETagResource, redis_provider
+
+
+def test_redis_etag_not_modified(client_redis: object) -> None:
+    """Testing conditional GET requests are answered with 304 from cache.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': 'etag'}
+    response: Result = client_redis.simulate_get('/etag', params=params)
+    etag = response.headers.get('etag')
+    last_modified = response.headers.get('last-modified')
+    assert response.text == 'etag-worked'
+    assert etag is not None
+    assert last_modified is not None
+
+    response = client_redis.simulate_get('/etag', params=params, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers.get('etag') == etag
+    assert response.headers.get('x-cache') == 'HIT'
+
+    response = client_redis.simulate_get(
+        '/etag', params=params, headers={'If-Modified-Since': last_modified}
+    )
+    assert response.status_code == 304
+    assert response.headers.get('x-cache') == 'HIT'
+
+
+def test_redis_etag_modified(client_redis: object) -> None:
+    """Testing conditional GET requests with a different ETag return the cached body.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': 'etag-modified'}
+    response: Result = client_redis.simulate_get('/etag', params=params)
+    etag = response.headers.get('etag')
+
+    response = client_redis.simulate_get('/etag', params=params, headers={'If-None-Match': '"x"'})
+    assert response.status_code == 200
+    assert response.text == 'etag-modified-worked'
+    assert response.headers.get('etag') == etag
+    assert response.headers.get('x-cache') == 'HIT'
+
+
+def test_redis_etag_meta_expired(client_redis: object) -> None:
+    """Testing a metadata entry that expires before the response is processed is a 304.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    response: Result = client_redis.simulate_get('/etag', params={'key': 'etag-expired'})
+    etag = response.headers.get('etag')
+
+    middleware = CacheMiddleware(redis_provider)
+    resource = RedisETagResource()
+    req = create_req(path='/etag', query_string='key=etag-expired', headers={'If-None-Match': etag})
+    resp = falcon.Response()
+    middleware.process_resource(req, resp, resource, {})
+    assert resp.complete
+
+    # the metadata entry (no body) expires before process_response
+    resp.context['cache_entry'].expires = time.time() - 1
+    middleware.process_response(req, resp, resource, True)
+    assert resp.status in (304, falcon.HTTP_304)
+    assert resp.data is None
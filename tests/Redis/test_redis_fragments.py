@@ -0,0 +1,98 @@
+"""Test redis provider batch operations and fragment caching."""
+# standard library
+import asyncio
+
+# first-party
+from falcon_provider_cache.async_utils import AsyncRedisCacheProvider
+from falcon_provider_cache.fragments import cached
+
+from .app import REDIS_HOST, REDIS_PORT, redis_provider
+
+
+def test_redis_many() -> None:
+    """Testing get_many, set_many and delete_many."""
+    redis_provider.set_many({'many-1': b'one', 'many-2': 'two'}, 5)
+
+    values = redis_provider.get_many(['many-1', 'many-2', 'many-3'])
+    assert values == {'many-1': b'one', 'many-2': b'two'}
+
+    redis_provider.delete_many(['many-1', 'many-2'])
+    assert not redis_provider.get_many(['many-1', 'many-2'])
+
+
+def test_redis_cached() -> None:
+    """Testing cached fragments are computed once and read in a single batch."""
+    calls = []
+
+    @cached(redis_provider, timeout=5, key=lambda user_id: user_id)
+    def user_card(user_id: int) -> dict:
+        calls.append(user_id)
+        return {'user_id': user_id, 'name': f'user-{user_id}'}
+
+    assert user_card(1) == {'user_id': 1, 'name': 'user-1'}
+    assert calls == [1]
+
+    # only the missing fragments are computed
+    cards = user_card.many([1, 2, 3])
+    assert [c['name'] for c in cards] == ['user-1', 'user-2', 'user-3']
+    assert calls == [1, 2, 3]
+
+    assert user_card.many([3, 2, 1]) == cards[::-1]
+    assert calls == [1, 2, 3]
+
+    user_card.invalidate(2)
+    user_card.many([1, 2, 3])
+    assert calls == [1, 2, 3, 2]
+
+
+def test_redis_cached_async() -> None:
+    """Testing cached fragments with a coroutine function and an async provider."""
+    provider = AsyncRedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT)
+    calls = []
+
+    @cached(provider, timeout=5)
+    async def post_summary(post_id: int) -> list:
+        calls.append(post_id)
+        return [post_id, 'summary']
+
+    async def run() -> list:
+        await post_summary.invalidate(10)
+        await post_summary.invalidate(11)
+        first = await post_summary.many([10, 11])
+        return [first, await post_summary.many([10, 11]), await post_summary(10)]
+
+    # a private loop, asyncio.run would close and unset the current event loop
+    loop = asyncio.new_event_loop()
+    try:
+        first, second, single = loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert first == second == [[10, 'summary'], [11, 'summary']]
+    assert single == [10, 'summary']
+    assert calls == [10, 11]
+
+
+def test_redis_cached_method() -> None:
+    """Testing a cached method is bound to the instance and shares results across instances."""
+
+    class Cards:
+        """Resource helper with a cached method."""
+
+        def __init__(self, calls: list):
+            """Initialize class properties."""
+            self.calls = calls
+
+        @cached(redis_provider, timeout=5, key=lambda user_id: user_id)
+        def card(self, user_id: int) -> dict:
+            """Return the user card."""
+            self.calls.append(user_id)
+            return {'user_id': user_id}
+
+    calls = []
+    Cards.card.invalidate(20)  # pylint: disable=no-member
+    Cards.card.invalidate(21)  # pylint: disable=no-member
+
+    assert Cards(calls).card(20) == {'user_id': 20}
+    assert Cards(calls).card(20) == {'user_id': 20}
+    assert Cards(calls).card.many([20, 21]) == [{'user_id': 20}, {'user_id': 21}]
+    assert calls == [20, 21]
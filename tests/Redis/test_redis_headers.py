@@ -0,0 +1,102 @@
+"""Test middleware redis provider HTTP cache headers."""
+# standard library
+import time
+import uuid
+
+# third-party
+from falcon.testing import Result
+
+from .app import RedisHeadersResource, redis_breaker, redis_provider_failing
+
+
+def test_redis_cache_headers(client_redis: object) -> None:
+    """Testing Cache-Control, Expires and Age headers are set from the cache control.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': 'headers'}
+    response: Result = client_redis.simulate_get('/headers', params=params)
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.headers.get('cache-control') == (
+        'public, max-age=10, s-maxage=30, stale-while-revalidate=5'
+    )
+    assert response.headers.get('expires') is not None
+    assert response.headers.get('age') is None
+
+    time.sleep(1)
+    response = client_redis.simulate_get('/headers', params=params)
+    assert response.headers.get('x-cache') == 'HIT'
+    assert response.headers.get('cache-control').startswith('public, max-age=10')
+    assert int(response.headers.get('age')) >= 1
+
+
+def test_redis_request_cache_control(client_redis_trusted: object) -> None:
+    """Testing trusted request no-cache and no-store directives bypass the cache.
+
+    Args:
+        client_redis_trusted(fixture): The test client.
+    """
+    params = {'key': 'request-cache-control'}
+    response: Result = client_redis_trusted.simulate_get('/headers', params=params)
+    assert response.headers.get('x-cache') == 'MISS'
+
+    # no-store does not read or write the cache
+    calls = RedisHeadersResource.calls
+    response = client_redis_trusted.simulate_get(
+        '/headers', params=params, headers={'Cache-Control': 'no-store'}
+    )
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.headers.get('cache-control').startswith('public, max-age=10')
+    assert RedisHeadersResource.calls == calls + 1
+
+    # no-cache skips the cache read and refreshes the entry
+    response = client_redis_trusted.simulate_get(
+        '/headers', params=params, headers={'Cache-Control': 'no-cache'}
+    )
+    assert response.headers.get('x-cache') == 'MISS'
+    assert RedisHeadersResource.calls == calls + 2
+
+    response = client_redis_trusted.simulate_get('/headers', params=params)
+    assert response.headers.get('x-cache') == 'HIT'
+    assert response.headers.get('age') == '0'
+
+
+def test_redis_cache_headers_not_admitted(client_redis: object) -> None:
+    """Testing cache headers are set on responses not written to the cache (admit_after).
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': uuid.uuid4().hex}
+    for x_cache in ('MISS', 'MISS', 'MISS', 'HIT'):
+        response: Result = client_redis.simulate_get('/admission-headers', params=params)
+        assert response.headers.get('x-cache') == x_cache
+        assert response.headers.get('cache-control').startswith('public, max-age=10')
+        assert response.headers.get('expires') is not None
+
+
+def test_redis_cache_headers_breaker_open(client_redis_breaker: object) -> None:
+    """Testing cache headers are set while the circuit breaker bypasses the cache.
+
+    Args:
+        client_redis_breaker(fixture): The test client.
+    """
+    params = {'key': uuid.uuid4().hex}
+    redis_provider_failing.failing = True
+    try:
+        for _ in range(2):
+            client_redis_breaker.simulate_get('/headers', params=params)
+        assert redis_breaker.state == redis_breaker.OPEN
+
+        response: Result = client_redis_breaker.simulate_get('/headers', params=params)
+        assert response.headers.get('x-cache') == 'MISS'
+        assert response.headers.get('cache-control') == (
+            'public, max-age=10, s-maxage=30, stale-while-revalidate=5'
+        )
+    finally:
+        # close the breaker with a probe request once the backend recovered
+        redis_provider_failing.failing = False
+        time.sleep(1.1)
+        client_redis_breaker.simulate_get('/headers', params=params)
+    assert redis_breaker.state == redis_breaker.CLOSED
@@ -0,0 +1,74 @@
+"""Test middleware redis provider cache keys."""
+# third-party
+import xxhash
+from falcon.testing import Result, create_req
+
+# first-party
+from falcon_provider_cache.utils import RedisCacheProvider
+
+from .app import REDIS_HOST, REDIS_PORT, RedisKeyResource, redis_provider
+
+
+def test_redis_key_params(client_redis: object) -> None:
+    """Testing query params not in key_params do not change the cache key.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    response: Result = client_redis.simulate_get('/key', params={'key': 'params', 'utm': '1'})
+    assert response.headers.get('x-cache') == 'MISS'
+
+    response = client_redis.simulate_get('/key', params={'key': 'params', 'utm': '2'})
+    assert response.headers.get('x-cache') == 'HIT'
+
+    response = client_redis.simulate_get('/key', params={'key': 'params-other'})
+    assert response.headers.get('x-cache') == 'MISS'
+
+
+def test_redis_key_headers(client_redis: object) -> None:
+    """Testing headers in key_headers change the cache key.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': 'headers'}
+    response: Result = client_redis.simulate_get(
+        '/key', params=params, headers={'Accept-Language': 'en'}
+    )
+    assert response.headers.get('x-cache') == 'MISS'
+
+    response = client_redis.simulate_get('/key', params=params, headers={'Accept-Language': 'en'})
+    assert response.headers.get('x-cache') == 'HIT'
+
+    response = client_redis.simulate_get('/key', params=params, headers={'Accept-Language': 'fr'})
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.text == 'headers-fr-worked'
+
+
+def test_redis_key_list_params(client_redis: object) -> None:
+    """Testing multi-value query params do not collide.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    response: Result = client_redis.simulate_get('/key', query_string='key=1&key=23')
+    assert response.headers.get('x-cache') == 'MISS'
+
+    response = client_redis.simulate_get('/key', query_string='key=23&key=1')
+    assert response.headers.get('x-cache') == 'HIT'
+
+    response = client_redis.simulate_get('/key', query_string='key=12&key=3')
+    assert response.headers.get('x-cache') == 'MISS'
+
+
+def test_redis_key_hash_xxhash() -> None:
+    """Testing cache keys hashed with the xxhash key hash."""
+    provider = RedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT, key_hash='xxhash')
+    assert provider.key_hash is xxhash.xxh3_128_hexdigest
+
+    resource = RedisKeyResource()
+    req = create_req(path='/key', query_string='key=xxhash')
+    policy = provider.cache_policy(resource, 'GET')
+    cache_key = provider.cache_key(req, resource, policy)
+    assert len(cache_key) == 32
+    assert cache_key != redis_provider.cache_key(req, resource, policy)
@@ -0,0 +1,29 @@
+"""Test middleware redis provider request coalescing."""
+# standard library
+from concurrent.futures import ThreadPoolExecutor
+
+# third-party
+from falcon.testing import Result
+
+from .app import RedisLockResource
+
+
+def test_redis_lock_coalesce(client_redis: object) -> None:
+    """Testing concurrent GET requests only run the responder once.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    RedisLockResource.calls = 0
+    params = {'key': 'lock'}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        responses: list[Result] = list(
+            executor.map(lambda _: client_redis.simulate_get('/lock', params=params), range(5))
+        )
+
+    assert RedisLockResource.calls == 1
+    for response in responses:
+        assert response.text == 'lock-worked'
+        assert response.status_code == 200
+    assert sorted(r.headers.get('x-cache') for r in responses) == ['HIT'] * 4 + ['MISS']
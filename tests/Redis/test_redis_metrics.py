@@ -0,0 +1,65 @@
+"""Test middleware redis provider metrics."""
+# third-party
+import prometheus_client
+from falcon.testing import Result
+from opentelemetry import metrics as otel_metrics
+
+# first-party
+from falcon_provider_cache.metrics import OpenTelemetryMetrics, PrometheusMetrics
+
+from .app import redis_metrics
+
+
+def test_redis_metrics(client_redis_metrics: object) -> None:
+    """Testing cache results, latency and payload sizes are recorded.
+
+    Args:
+        client_redis_metrics(fixture): The test client.
+    """
+    redis_metrics.results.clear()
+    redis_metrics.size.clear()
+
+    response: Result = client_redis_metrics.simulate_get('/users/metrics')
+    assert response.headers.get('x-cache') == 'MISS'
+    response = client_redis_metrics.simulate_get('/users/metrics')
+    assert response.headers.get('x-cache') == 'HIT'
+    response = client_redis_metrics.simulate_put('/users/metrics')
+    assert response.status_code == 204
+
+    assert redis_metrics.results == [
+        ('/users/{user_id}', 'miss'),
+        ('/users/{user_id}', 'hit'),
+        ('/users/{user_id}', 'bypass'),
+    ]
+    assert {o for o, _ in redis_metrics.latency} == {'get', 'set'}
+    assert [o for o, _ in redis_metrics.size] == ['set', 'get']
+    assert not redis_metrics.errors
+
+
+def test_redis_metrics_prometheus() -> None:
+    """Testing the prometheus exporter records to the provided registry."""
+    registry = prometheus_client.CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry)
+    metrics.record_result('/users/{user_id}', 'hit')
+    metrics.record_error('get')
+    metrics.observe_latency('get', 0.002)
+    metrics.observe_size('set', 512)
+
+    labels = {'route': '/users/{user_id}', 'result': 'hit'}
+    assert registry.get_sample_value('falcon_cache_requests_total', labels) == 1
+    assert registry.get_sample_value('falcon_cache_errors_total', {'operation': 'get'}) == 1
+    latency = 'falcon_cache_backend_latency_seconds_count'
+    assert registry.get_sample_value(latency, {'operation': 'get'}) == 1
+    assert registry.get_sample_value('falcon_cache_payload_bytes_sum', {'operation': 'set'}) == 512
+
+
+def test_redis_metrics_opentelemetry() -> None:
+    """Testing the OpenTelemetry exporter records to the global meter provider."""
+    metrics = OpenTelemetryMetrics()
+    assert isinstance(metrics.results, otel_metrics.Counter)
+    assert isinstance(metrics.latency, otel_metrics.Histogram)
+
+    metrics.record_result('/users/{user_id}', 'miss')
+    metrics.record_error('set')
+    metrics.observe_latency('set', 0.003)
+    metrics.observe_size('get', 128)
@@ -0,0 +1,49 @@
+"""Test middleware redis provider negative caching."""
+# standard library
+import time
+import uuid
+
+# third-party
+from falcon.testing import Result
+
+from .app import RedisNegativeResource
+
+
+def test_redis_negative(client_redis: object) -> None:
+    """Testing error statuses in status_timeouts are cached with their own TTL.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': f'missing-{uuid.uuid4().hex}'}
+    calls = RedisNegativeResource.calls
+    response: Result = client_redis.simulate_get('/negative', params=params)
+    assert response.status_code == 404
+    assert response.headers.get('x-cache') == 'MISS'
+
+    response = client_redis.simulate_get('/negative', params=params)
+    assert response.status_code == 404
+    assert response.headers.get('x-cache') == 'HIT'
+    assert response.json['description'] == f'{params["key"]} not found'
+    assert RedisNegativeResource.calls == calls + 1
+
+    # the 404 TTL is shorter than the timeout
+    time.sleep(1.1)
+    response = client_redis.simulate_get('/negative', params=params)
+    assert response.headers.get('x-cache') == 'MISS'
+    assert RedisNegativeResource.calls == calls + 2
+
+
+def test_redis_negative_not_cached(client_redis: object) -> None:
+    """Testing error statuses not in status_timeouts are not cached.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': f'error-{uuid.uuid4().hex}'}
+    response: Result = client_redis.simulate_get('/negative', params=params)
+    assert response.status_code == 503
+
+    response = client_redis.simulate_get('/negative', params=params)
+    assert response.status_code == 503
+    assert response.headers.get('x-cache') == 'MISS'
@@ -0,0 +1,42 @@
+"""Test middleware redis provider cache policy."""
+
+# third-party
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_cache.policy import CachePolicy
+
+from .app import RedisMethodResource, redis_provider
+
+
+def test_redis_policy_method(client_redis: object) -> None:
+    """Testing GET method with per method cache control.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': 'method'}
+    response: Result = client_redis.simulate_get('/method', params=params)
+
+    # make request to cache
+    if response.headers.get('x-cache') == 'MISS':
+        response = client_redis.simulate_get('/method', params=params)
+
+    assert response.text == 'method-worked'
+    assert response.status_code == 200
+    assert response.headers.get('x-cache') == 'HIT'
+
+    # POST is not cached and must not be served the cached GET response
+    response = client_redis.simulate_post('/method', params=params)
+    assert response.text == 'method-posted'
+    assert response.headers.get('x-cache') is None
+
+
+def test_redis_policy_immutable() -> None:
+    """Testing that resolving a policy does not modify provider state."""
+    policy: CachePolicy = redis_provider.cache_policy(RedisMethodResource(), 'GET')
+
+    assert policy.cacheable is True
+    assert policy.timeout == 2
+    assert redis_provider.timeout == 60
+    assert redis_provider.cache_policy(RedisMethodResource(), 'POST').cacheable is False
@@ -0,0 +1,41 @@
+"""Test middleware redis provider full response caching."""
+# third-party
+from falcon.testing import Result
+
+
+def test_redis_response_media(client_redis: object) -> None:
+    """Testing GET method with media, headers and status.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': 'media'}
+    response: Result = client_redis.simulate_get('/media', params=params)
+
+    # make request to cache
+    if response.headers.get('x-cache') == 'MISS':
+        response = client_redis.simulate_get('/media', params=params)
+
+    assert response.json == {'key': 'media', 'status': 'worked'}
+    assert response.status_code == 202
+    assert response.headers.get('content-type') == 'application/json'
+    assert response.headers.get('etag') == '"media"'
+    assert response.headers.get('x-cache') == 'HIT'
+
+
+def test_redis_response_binary(client_redis: object) -> None:
+    """Testing GET method with binary data.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    response: Result = client_redis.simulate_get('/binary')
+
+    # make request to cache
+    if response.headers.get('x-cache') == 'MISS':
+        response = client_redis.simulate_get('/binary')
+
+    assert response.content == bytes(range(256))
+    assert response.status_code == 200
+    assert response.headers.get('content-type') == 'image/png'
+    assert response.headers.get('x-cache') == 'HIT'
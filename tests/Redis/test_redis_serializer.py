@@ -0,0 +1,77 @@
+"""Test redis provider value serialization."""
+# standard library
+import datetime
+import pickle  # nosec
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_cache.serializers import Serializer
+from falcon_provider_cache.utils import RedisCacheProvider
+
+from .app import REDIS_HOST, REDIS_PORT, redis_provider
+
+
+def test_redis_serializer_json() -> None:
+    """Testing values are serialized with the default (json) format."""
+    value = {'user': 42, 'roles': ['admin']}
+    redis_provider.set_cache('serializer-json', redis_provider.serialize(value), 5)
+
+    assert redis_provider.deserialize(redis_provider.get_cache('serializer-json')) == value
+
+    # values that are not serialized are returned as is
+    assert redis_provider.deserialize(b'not-serialized') == b'not-serialized'
+
+
+def test_redis_serializer_orjson() -> None:
+    """Testing values are serialized with the orjson format."""
+    provider = RedisCacheProvider(
+        host=REDIS_HOST, port=REDIS_PORT, value_serializer=Serializer('orjson')
+    )
+    value = {'user': 42, 'roles': ['admin']}
+    provider.set_cache('serializer-orjson', provider.serialize(value), 5)
+    assert provider.deserialize(provider.get_cache('serializer-orjson')) == value
+
+    # the json provider reads the values written with the orjson format
+    assert redis_provider.deserialize(redis_provider.get_cache('serializer-orjson')) == value
+
+
+def test_redis_serializer_msgpack() -> None:
+    """Testing values are serialized with the msgpack format."""
+    provider = RedisCacheProvider(
+        host=REDIS_HOST, port=REDIS_PORT, value_serializer=Serializer('msgpack')
+    )
+    value = {'user': 42, 'roles': ['admin']}
+    provider.set_cache('serializer-msgpack', provider.serialize(value), 5)
+    assert provider.deserialize(provider.get_cache('serializer-msgpack')) == value
+
+    # the json provider reads the values written with the msgpack format
+    assert redis_provider.deserialize(redis_provider.get_cache('serializer-msgpack')) == value
+
+
+def test_redis_serializer_format_change() -> None:
+    """Testing values written with another format are still readable."""
+    provider = RedisCacheProvider(
+        host=REDIS_HOST, port=REDIS_PORT, value_serializer=Serializer('pickle')
+    )
+    created = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    provider.set_cache('serializer-pickle', provider.serialize({'created': created}), 5)
+
+    # the json provider reads values written by the pickle provider's previous format
+    redis_provider.set_cache('serializer-change', redis_provider.serialize([1, 2]), 5)
+    assert provider.deserialize(provider.get_cache('serializer-change')) == [1, 2]
+    assert provider.deserialize(provider.get_cache('serializer-pickle')) == {'created': created}
+
+    # pickled values are never loaded without a configured allowlist
+    with pytest.raises(ValueError):
+        redis_provider.deserialize(redis_provider.get_cache('serializer-pickle'))
+
+
+def test_redis_serializer_pickle_allowlist() -> None:
+    """Testing the pickle format only loads allowed classes."""
+    serializer = Serializer('pickle', allowlist={'builtins.dict'})
+    assert serializer.loads(serializer.dumps({'a': 1})) == {'a': 1}
+
+    with pytest.raises(pickle.UnpicklingError):
+        serializer.loads(serializer.dumps(datetime.date(2024, 1, 1)))
@@ -0,0 +1,112 @@
+"""Test middleware redis sharded provider."""
+# third-party
+import pytest
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_cache.async_utils import AsyncCacheProvider, AsyncRedisCacheProvider
+from falcon_provider_cache.metrics import CacheMetrics
+from falcon_provider_cache.sharded import AsyncShardedCacheProvider, HashRing, ShardedCacheProvider
+from falcon_provider_cache.utils import CacheProvider, RedisCacheProvider
+
+from .app import REDIS_HOST, REDIS_PORT, redis_provider_sharded
+
+
+def test_redis_sharded_get(client_redis_sharded: object) -> None:
+    """Testing GET method with keys distributed across nodes.
+
+    Args:
+        client_redis_sharded(fixture): The test client.
+    """
+    for i in range(10):
+        params = {'key': f'sharded-{i}'}
+        response: Result = client_redis_sharded.simulate_get('/middleware', params=params)
+        assert response.headers.get('x-cache') == 'MISS'
+        response = client_redis_sharded.simulate_get('/middleware', params=params)
+        assert response.headers.get('x-cache') == 'HIT'
+        assert response.text == f'sharded-{i}-worked'
+
+
+def test_redis_sharded_ring() -> None:
+    """Testing adding a node only remaps a fraction of the keys."""
+    keys = [f'key-{i}' for i in range(1000)]
+    ring = HashRing(['a', 'b', 'c'])
+    nodes = [next(ring.nodes_for(k)) for k in keys]
+    assert {n: nodes.count(n) for n in 'abc'} == pytest.approx({n: 333 for n in 'abc'}, rel=0.25)
+
+    ring = HashRing(['a', 'b', 'c', 'd'])
+    moved = [k for k, n in zip(keys, nodes) if next(ring.nodes_for(k)) != n]
+    assert len(moved) < 400
+    assert all(next(ring.nodes_for(k)) == 'd' for k in moved)
+
+
+def test_redis_sharded_ejection(monkeypatch: object) -> None:
+    """Testing a failing node is ejected and its keys move to the next node.
+
+    Args:
+        monkeypatch(fixture): The pytest monkeypatch fixture.
+    """
+    key = 'sharded-ejection'
+    node = redis_provider_sharded.node_for(key)
+
+    def get_cache(key: str):
+        raise ConnectionError('cache backend unavailable')
+
+    monkeypatch.setattr(redis_provider_sharded.nodes[node], 'get_cache', get_cache)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            redis_provider_sharded.get_cache(key)
+
+    assert redis_provider_sharded.node_for(key) != node
+    assert redis_provider_sharded.get_cache(key) is None
+    monkeypatch.setattr(redis_provider_sharded, '_ejected', {})
+    assert redis_provider_sharded.node_for(key) == node
+
+
+def test_redis_sharded_replica_failure(caplog: object, monkeypatch: object) -> None:
+    """Testing a failing replica is logged, recorded and ejected.
+
+    Args:
+        caplog(fixture): The pytest log capture fixture.
+        monkeypatch(fixture): The pytest monkeypatch fixture.
+    """
+    errors = []
+
+    class Metrics(CacheMetrics):
+        """Record the cache backend errors."""
+
+        def record_error(self, operation: str):
+            """Record a cache backend error."""
+            errors.append(operation)
+
+    node = RedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT, db=1)
+    replica = RedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT, db=1)
+    provider = ShardedCacheProvider(
+        {'redis-1': node}, replicas={'redis-1': replica}, eject_after=2, metrics=Metrics()
+    )
+    node.set_cache('sharded-replica', 'value', 5)
+    calls = []
+
+    def get_cache(key: str):
+        calls.append(key)
+        raise ConnectionError('cache replica unavailable')
+
+    monkeypatch.setattr(replica, 'get_cache', get_cache)
+    for _ in range(3):
+        assert provider.get_cache('sharded-replica') == b'value'
+
+    # the replica is ejected after two failures, the third read goes to the node
+    assert len(calls) == 2
+    assert errors == ['replica', 'replica']
+    assert 'replica of redis-1 failed on get_cache' in caplog.text
+    assert not provider._healthy('redis-1:replica')  # pylint: disable=protected-access
+    assert provider._healthy('redis-1')  # pylint: disable=protected-access
+
+
+def test_redis_sharded_async() -> None:
+    """Testing the async sharded provider is not a sync provider."""
+    provider = AsyncShardedCacheProvider(
+        {'redis-1': AsyncRedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT, db=1)}
+    )
+    assert isinstance(provider, AsyncCacheProvider)
+    assert not isinstance(provider, CacheProvider)
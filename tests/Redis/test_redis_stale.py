@@ -0,0 +1,103 @@
+"""Test middleware redis provider stale serving."""
+# standard library
+import asyncio
+import time
+
+# third-party
+from falcon.testing import ASGIConductor, Result
+
+from .app import RedisAsyncStaleResource, RedisStaleResource, app_redis_async
+
+
+def test_redis_stale_while_revalidate(client_redis: object) -> None:
+    """Testing stale entries are served while being refreshed.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    RedisStaleResource.calls = 0
+    RedisStaleResource.fail = False
+    RedisStaleResource.requests.clear()
+
+    params = {'key': 'swr'}
+    response: Result = client_redis.simulate_get('/stale', params=params)
+    assert response.text == 'swr-worked-1'
+    assert response.headers.get('x-cache') == 'MISS'
+
+    # wait for the entry to become stale
+    time.sleep(1.5)
+    response = client_redis.simulate_get('/stale', params=params)
+    assert response.text == 'swr-worked-1'
+    assert response.headers.get('x-cache') == 'STALE'
+
+    # wait for the background refresh
+    time.sleep(0.5)
+    response = client_redis.simulate_get('/stale', params=params)
+    assert response.text == 'swr-worked-2'
+    assert response.headers.get('x-cache') == 'HIT'
+
+    # the entry is refreshed with a new request, not the finished request served stale
+    refresh_req = RedisStaleResource.requests[-1]
+    assert refresh_req.get_param('key') == 'swr'
+    assert refresh_req.context.get('cache_key') is None
+
+
+def test_redis_stale_if_error(client_redis: object) -> None:
+    """Testing stale entries are served when the responder fails.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    RedisStaleResource.calls = 0
+    RedisStaleResource.fail = False
+    RedisStaleResource.cache_control['stale_while_revalidate'] = 0
+
+    try:
+        params = {'key': 'sie'}
+        response: Result = client_redis.simulate_get('/stale', params=params)
+        assert response.headers.get('x-cache') == 'MISS'
+
+        # wait for the entry to become stale
+        time.sleep(1.5)
+        RedisStaleResource.fail = True
+        response = client_redis.simulate_get('/stale', params=params)
+        assert response.text == 'sie-worked-1'
+        assert response.status_code == 200
+        assert response.headers.get('x-cache') == 'STALE'
+    finally:
+        RedisStaleResource.fail = False
+        RedisStaleResource.cache_control['stale_while_revalidate'] = 10
+
+
+def test_redis_stale_while_revalidate_async() -> None:
+    """Testing stale entries are refreshed by a background task with a new request (ASGI)."""
+    RedisAsyncStaleResource.requests.clear()
+    params = {'key': f'swr-{time.time_ns()}'}
+    headers = {'Accept-Language': 'en', 'X-Request-Id': 'swr-test'}
+
+    async def run() -> list:
+        async with ASGIConductor(app_redis_async) as conductor:
+            responses = [await conductor.simulate_get('/stale', params=params, headers=headers)]
+
+            # wait for the entry to become stale and for the background refresh
+            await asyncio.sleep(1.5)
+            responses.append(await conductor.simulate_get('/stale', params=params, headers=headers))
+            await asyncio.sleep(0.5)
+            responses.append(await conductor.simulate_get('/stale', params=params, headers=headers))
+            return responses
+
+    # a private loop, asyncio.run would close and unset the current event loop
+    loop = asyncio.new_event_loop()
+    try:
+        miss, stale, hit = loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert miss.headers.get('x-cache') == 'MISS'
+    assert (stale.text, stale.headers.get('x-cache')) == (f'{params["key"]}-en-1', 'STALE')
+    assert (hit.text, hit.headers.get('x-cache')) == (f'{params["key"]}-en-2', 'HIT')
+
+    # the refresh request has the query and key headers but not the other request headers
+    refresh_req = RedisAsyncStaleResource.requests[-1]
+    assert refresh_req.get_param('key') == params['key']
+    assert refresh_req.get_header('X-Request-Id') is None
+    assert refresh_req.context.get('cache_key') is None
@@ -0,0 +1,91 @@
+"""Test middleware redis provider streamed response caching."""
+# standard library
+import uuid
+
+# third-party
+import pytest
+from falcon.testing import Result
+
+from .app import RedisStreamResource, redis_provider
+
+
+def _body(size: int) -> str:
+    """Return the body streamed by the resource."""
+    return ''.join(str(i % 10) * 100 for i in range(size // 100))
+
+
+def test_redis_stream_chunked(client_redis_stream: object) -> None:
+    """Testing a streamed response is cached in chunks and served from the chunks.
+
+    Args:
+        client_redis_stream(fixture): The test client.
+    """
+    params = {'key': uuid.uuid4().hex, 'size': 2500}
+    response: Result = client_redis_stream.simulate_get('/stream', params=params)
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.text == _body(2500)
+
+    calls = RedisStreamResource.calls
+    response = client_redis_stream.simulate_get('/stream', params=params)
+    assert response.headers.get('x-cache') == 'HIT'
+    assert response.headers.get('content-type') == 'text/plain; charset=utf-8'
+    assert response.text == _body(2500)
+    assert RedisStreamResource.calls == calls
+
+    # small streams are stored in the entry
+    params = {'key': uuid.uuid4().hex, 'size': 500}
+    client_redis_stream.simulate_get('/stream', params=params)
+    response = client_redis_stream.simulate_get('/stream', params=params)
+    assert response.headers.get('x-cache') == 'HIT'
+    assert response.text == _body(500)
+
+
+def test_redis_stream_max_size(client_redis_stream: object) -> None:
+    """Testing streams over the max size are sent but not cached.
+
+    Args:
+        client_redis_stream(fixture): The test client.
+    """
+    chunks = len(redis_provider.redis_client.keys('*.chunk.*'))
+    params = {'key': uuid.uuid4().hex, 'size': 5000}
+    for _ in range(2):
+        response: Result = client_redis_stream.simulate_get('/stream', params=params)
+        assert response.headers.get('x-cache') == 'MISS'
+        assert response.text == _body(5000)
+
+    # the chunks written before the stream exceeded the max size are deleted
+    assert len(redis_provider.redis_client.keys('*.chunk.*')) == chunks
+
+
+def test_redis_stream_missing_chunk(client_redis_stream: object) -> None:
+    """Testing a missing chunk fails the response and deletes the entry.
+
+    Args:
+        client_redis_stream(fixture): The test client.
+    """
+    params = {'key': uuid.uuid4().hex, 'size': 3000}
+    client_redis_stream.simulate_get('/stream', params=params)
+    redis_provider.redis_client.delete(*redis_provider.redis_client.keys('*.chunk.*.1'))
+
+    with pytest.raises(RuntimeError):
+        client_redis_stream.simulate_get('/stream', params=params)
+
+    response: Result = client_redis_stream.simulate_get('/stream', params=params)
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.text == _body(3000)
+
+
+def test_redis_stream_async(client_redis_stream_async: object) -> None:
+    """Testing a streamed response is cached with an async provider.
+
+    Args:
+        client_redis_stream_async(fixture): The test client.
+    """
+    params = {'key': uuid.uuid4().hex, 'size': 2500}
+    response: Result = client_redis_stream_async.simulate_get('/stream', params=params)
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.text == _body(2500)
+
+    response = client_redis_stream_async.simulate_get('/stream', params=params)
+    assert response.headers.get('x-cache') == 'HIT'
+    assert response.text == _body(2500)
@@ -0,0 +1,93 @@
+"""Test middleware redis provider tag invalidation."""
+# third-party
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_cache.utils import RedisCacheProvider
+
+from .app import REDIS_HOST, REDIS_PORT, redis_provider, redis_tag_resource
+
+
+def test_redis_tags_unsafe_method(client_redis: object) -> None:
+    """Testing a successful PUT invalidates the entries for the path and child paths.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    version = redis_tag_resource.version
+    for path in ('/users/1', '/users/1/posts', '/users/2'):
+        response: Result = client_redis.simulate_get(path)
+        assert response.headers.get('x-cache') == 'MISS'
+        response = client_redis.simulate_get(path)
+        assert response.headers.get('x-cache') == 'HIT'
+
+    response = client_redis.simulate_put('/users/1')
+    assert response.status_code == 204
+
+    response = client_redis.simulate_get('/users/1')
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.text == f'1-{version + 1}'
+    response = client_redis.simulate_get('/users/1/posts')
+    assert response.headers.get('x-cache') == 'MISS'
+
+    # entries for other paths are not invalidated
+    response = client_redis.simulate_get('/users/2')
+    assert response.headers.get('x-cache') == 'HIT'
+    assert response.text == f'2-{version}'
+
+
+def test_redis_tags_invalidate(client_redis: object) -> None:
+    """Testing the provider invalidate API with tags and path prefixes.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    for path in ('/users/3', '/users/4'):
+        client_redis.simulate_get(path)
+
+    keys = redis_provider.invalidate(tags=['user:3'])
+    assert len(keys) == 1
+    response: Result = client_redis.simulate_get('/users/3')
+    assert response.headers.get('x-cache') == 'MISS'
+    response = client_redis.simulate_get('/users/4')
+    assert response.headers.get('x-cache') == 'HIT'
+
+    assert redis_provider.invalidate(paths=['/users'])
+    response = client_redis.simulate_get('/users/4')
+    assert response.headers.get('x-cache') == 'MISS'
+
+
+def test_redis_tags_missing_param(client_redis: object) -> None:
+    """Testing tags with placeholders missing from the route params are omitted.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    response: Result = client_redis.simulate_get('/users')
+    assert response.status_code == 200
+    assert response.headers.get('x-cache') == 'MISS'
+    response = client_redis.simulate_get('/users')
+    assert response.headers.get('x-cache') == 'HIT'
+
+    # the entry is still tagged with its path
+    response = client_redis.simulate_put('/users')
+    assert response.status_code == 204
+    response = client_redis.simulate_get('/users')
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.text == f'all-{redis_tag_resource.version}'
+
+
+def test_redis_tags_expire_fallback() -> None:
+    """Testing the tag index TTL is extended without the EXPIRE NX and GT options (Redis < 7.0)."""
+    provider = RedisCacheProvider(host=REDIS_HOST, port=REDIS_PORT)
+    provider._expire_options = False  # pylint: disable=protected-access
+    name = 'tag:expire-fallback'
+    try:
+        provider.add_tags(['expire-fallback-1'], ['expire-fallback'], 5)
+        provider.add_tags(['expire-fallback-2'], ['expire-fallback'], 20)
+        # a shorter timeout does not reduce the TTL of the index
+        provider.add_tags(['expire-fallback-3'], ['expire-fallback'], 5)
+        assert 5 < provider.redis_client.ttl(name) <= 20
+        assert len(provider.redis_client.smembers(name)) == 3
+    finally:
+        provider.redis_client.delete(name)
@@ -0,0 +1,69 @@
+"""Test middleware tiered (L1 + redis) provider module."""
+# standard library
+import time
+import uuid
+
+# third-party
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_cache.fragments import cached
+from falcon_provider_cache.tiered import TieredCacheProvider
+
+from .app import RedisResource, redis_provider, redis_provider_tiered
+
+
+def test_redis_tiered_get(client_redis_tiered: object) -> None:
+    """Testing GET method
+
+    Args:
+        client_redis_tiered(fixture): The test client.
+    """
+    RedisResource.cache_control['enabled'] = True
+    RedisResource.cache_control['private'] = False
+
+    params = {'key': 'tiered'}
+    response: Result = client_redis_tiered.simulate_get('/middleware', params=params)
+
+    # make request to cache
+    if response.headers.get('x-cache') == 'MISS':
+        response = client_redis_tiered.simulate_get('/middleware', params=params)
+
+    assert response.text == 'tiered-worked'
+    assert response.status_code == 200
+    assert response.headers.get('x-cache') == 'HIT'
+    assert len(redis_provider_tiered.l1) >= 1
+
+
+def test_redis_tiered_l1_bounded() -> None:
+    """Testing the L1 tier entry and byte limits."""
+    for i in range(20):
+        redis_provider_tiered.l1.set(f'key-{i}', 'value', 10)
+
+    assert len(redis_provider_tiered.l1) == 10
+    assert redis_provider_tiered.l1.get('key-0') is None
+    assert redis_provider_tiered.l1.get('key-19') == 'value'
+
+
+def test_redis_tiered_remote_ttl() -> None:
+    """Testing fragments read from the remote provider are kept in L1 no longer than their TTL."""
+    provider = TieredCacheProvider(redis_provider, timeout=30)
+    prefix = f'fragment:tiered-{uuid.uuid4().hex}'
+    calls = []
+
+    def user_card(user_id: int) -> dict:
+        calls.append(user_id)
+        return {'user_id': user_id}
+
+    # the fragment is written to the remote provider by another process
+    remote_card = cached(redis_provider, timeout=1, prefix=prefix)(user_card)
+    tiered_card = cached(provider, timeout=1, prefix=prefix)(user_card)
+    remote_card(1)
+    assert tiered_card(1) == {'user_id': 1}
+    assert tiered_card.many([1]) == [{'user_id': 1}]
+    assert calls == [1]
+
+    # the L1 entry expires with the remote entry
+    time.sleep(1.1)
+    assert tiered_card(1) == {'user_id': 1}
+    assert calls == [1, 1]
@@ -0,0 +1,28 @@
+"""Test middleware redis provider content negotiation."""
+# third-party
+from falcon.testing import Result
+
+
+def test_redis_vary(client_redis: object) -> None:
+    """Testing vary headers select the cache entry and are sent in the Vary header.
+
+    Args:
+        client_redis(fixture): The test client.
+    """
+    params = {'key': 'vary'}
+    headers = {'Accept-Encoding': 'gzip, br', 'Accept-Language': 'en-US,en;q=0.9'}
+    response: Result = client_redis.simulate_get('/vary', params=params, headers=headers)
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.headers.get('vary') == 'Accept-Encoding, Accept-Language'
+
+    # equivalent headers share the cache entry
+    headers = {'Accept-Encoding': 'br;q=1.0, GZIP', 'Accept-Language': 'en;q=0.9, en-us'}
+    response = client_redis.simulate_get('/vary', params=params, headers=headers)
+    assert response.headers.get('x-cache') == 'HIT'
+    assert response.headers.get('vary') == 'Accept-Encoding, Accept-Language'
+    assert response.text == 'vary-en-US,en;q=0.9-worked'
+
+    headers = {'Accept-Encoding': 'gzip, br', 'Accept-Language': 'fr'}
+    response = client_redis.simulate_get('/vary', params=params, headers=headers)
+    assert response.headers.get('x-cache') == 'MISS'
+    assert response.text == 'vary-fr-worked'
@@ -0,0 +1,71 @@
+"""Test middleware redis provider cache warming."""
+# standard library
+import time
+import uuid
+
+# third-party
+from falcon.testing import Result, TestClient
+
+# first-party
+from falcon_provider_cache.warming import CacheWarmer
+
+from .app import RedisWarmResource, app_redis_async, app_redis_warm, redis_warming_log
+
+
+def test_redis_warming(client_redis_warm: object) -> None:
+    """Testing the top requests are replayed and expiring entries are regenerated.
+
+    Args:
+        client_redis_warm(fixture): The test client.
+    """
+    run = uuid.uuid4().hex
+    response: Result = client_redis_warm.simulate_get('/warm', params={'key': f'a-{run}'})
+    assert response.headers.get('x-cache') == 'MISS'
+    client_redis_warm.simulate_get('/warm', params={'key': f'a-{run}'})
+    client_redis_warm.simulate_get('/warm', params={'key': f'b-{run}'})
+
+    top = redis_warming_log.top(2)
+    assert top[0]['query_string'] == f'key=a-{run}'
+    assert top[1]['query_string'] == f'key=b-{run}'
+
+    warmer = CacheWarmer(
+        app_redis_warm, specs=[f'/warm?key=c-{run}'], warming_log=redis_warming_log, top=2
+    )
+    assert warmer.warm() == {'hit': 2, 'miss': 1}
+
+    # warming requests are not counted
+    assert [s for s in redis_warming_log.top(100) if run in s['query_string']] == top
+
+    # entries expiring within the refresh ahead time are regenerated
+    calls = RedisWarmResource.calls
+    assert warmer.warm(refresh_ahead=60) == {'miss': 3}
+    assert RedisWarmResource.calls == calls + 3
+
+    response = client_redis_warm.simulate_get('/warm', params={'key': f'c-{run}'})
+    assert response.headers.get('x-cache') == 'HIT'
+
+
+def test_redis_warming_periodic() -> None:
+    """Testing the cache is warmed periodically."""
+    run = uuid.uuid4().hex
+    warmer = CacheWarmer(app_redis_warm, specs=[f'/warm?key=periodic-{run}'])
+    calls = RedisWarmResource.calls
+
+    warmer.start(interval=0.05, refresh_ahead=60)
+    time.sleep(0.3)
+    warmer.stop()
+    assert RedisWarmResource.calls >= calls + 2
+
+
+def test_redis_warming_asgi() -> None:
+    """Testing the requests of an ASGI app are replayed concurrently on one event loop."""
+    run = uuid.uuid4().hex
+    specs = [f'/middleware?key=warm-{run}-{i}' for i in range(8)]
+    warmer = CacheWarmer(app_redis_async, specs=specs, workers=4)
+
+    assert warmer.warm() == {'miss': 8}
+    assert warmer.warm() == {'hit': 8}
+
+    # the current event loop of the thread is left unchanged for the test client
+    response: Result = TestClient(app_redis_async).simulate_get(specs[0])
+    assert response.headers.get('x-cache') == 'HIT'
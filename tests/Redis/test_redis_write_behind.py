@@ -0,0 +1,32 @@
+"""Test middleware redis provider write-behind."""
+# third-party
+from falcon.testing import Result
+
+from .app import redis_write_behind
+
+
+def test_redis_write_behind(client_redis_write_behind: object) -> None:
+    """Testing cache misses are written by the write-behind queue.
+
+    Args:
+        client_redis_write_behind(fixture): The test client.
+    """
+    for key in ('write-behind-1', 'write-behind-2'):
+        response: Result = client_redis_write_behind.simulate_get(
+            '/middleware', params={'key': key}
+        )
+        assert response.headers.get('x-cache') == 'MISS'
+        assert response.text == f'{key}-worked'
+
+    # wait for the queued writes (entry and etag metadata) to be written
+    redis_write_behind._writer.flush()  # pylint: disable=protected-access
+
+    for key in ('write-behind-1', 'write-behind-2'):
+        response = client_redis_write_behind.simulate_get('/middleware', params={'key': key})
+        assert response.headers.get('x-cache') == 'HIT'
+        assert response.text == f'{key}-worked'
+
+        response = client_redis_write_behind.simulate_get(
+            '/middleware', params={'key': key}, headers={'If-None-Match': response.headers['etag']}
+        )
+        assert response.status_code == 304
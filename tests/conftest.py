@@ -3,8 +3,28 @@
 import pytest
 from falcon import testing
 
-from .Memcache.app import app_memcache_enabled, app_memcache_global
-from .Redis.app import app_redis
+from .Local.app import app_memory, app_sqlite
+from .Memcache.app import app_memcache_async, app_memcache_enabled, app_memcache_global
+from .Redis.app import (
+    app_redis,
+    app_redis_async,
+    app_redis_breaker,
+    app_redis_compressed,
+    app_redis_metrics,
+    app_redis_sharded,
+    app_redis_stream,
+    app_redis_stream_async,
+    app_redis_tiered,
+    app_redis_trusted,
+    app_redis_warm,
+    app_redis_write_behind,
+)
+
+
+@pytest.fixture
+def client_memcache_async() -> testing.TestClient:
+    """Create testing client fixture for async (ASGI) memcache middleware app"""
+    return testing.TestClient(app_memcache_async)
 
 
 @pytest.fixture
@@ -19,7 +39,85 @@ def client_memcache_global() -> testing.TestClient:
     return testing.TestClient(app_memcache_global)
 
 
+@pytest.fixture
+def client_memory() -> testing.TestClient:
+    """Create testing client fixture for in-memory middleware app"""
+    return testing.TestClient(app_memory)
+
+
+@pytest.fixture
+def client_sqlite() -> testing.TestClient:
+    """Create testing client fixture for SQLite middleware app"""
+    return testing.TestClient(app_sqlite)
+
+
 @pytest.fixture
 def client_redis() -> testing.TestClient:
     """Create testing client fixture for middleware app"""
     return testing.TestClient(app_redis)
+
+
+@pytest.fixture
+def client_redis_async() -> testing.TestClient:
+    """Create testing client fixture for async middleware app"""
+    return testing.TestClient(app_redis_async)
+
+
+@pytest.fixture
+def client_redis_tiered() -> testing.TestClient:
+    """Create testing client fixture for tiered middleware app"""
+    return testing.TestClient(app_redis_tiered)
+
+
+@pytest.fixture
+def client_redis_compressed() -> testing.TestClient:
+    """Create testing client fixture for compressed middleware app"""
+    return testing.TestClient(app_redis_compressed)
+
+
+@pytest.fixture
+def client_redis_metrics() -> testing.TestClient:
+    """Create testing client fixture for instrumented middleware app"""
+    return testing.TestClient(app_redis_metrics)
+
+
+@pytest.fixture
+def client_redis_write_behind() -> testing.TestClient:
+    """Create testing client fixture for write-behind middleware app"""
+    return testing.TestClient(app_redis_write_behind)
+
+
+@pytest.fixture
+def client_redis_breaker() -> testing.TestClient:
+    """Create testing client fixture for circuit breaker middleware app"""
+    return testing.TestClient(app_redis_breaker)
+
+
+@pytest.fixture
+def client_redis_sharded() -> testing.TestClient:
+    """Create testing client fixture for sharded middleware app"""
+    return testing.TestClient(app_redis_sharded)
+
+
+@pytest.fixture
+def client_redis_trusted() -> testing.TestClient:
+    """Create testing client fixture for middleware app trusting request cache control"""
+    return testing.TestClient(app_redis_trusted)
+
+
+@pytest.fixture
+def client_redis_warm() -> testing.TestClient:
+    """Create testing client fixture for middleware app with a warming log"""
+    return testing.TestClient(app_redis_warm)
+
+
+@pytest.fixture
+def client_redis_stream() -> testing.TestClient:
+    """Create testing client fixture for middleware app caching streamed responses"""
+    return testing.TestClient(app_redis_stream)
+
+
+@pytest.fixture
+def client_redis_stream_async() -> testing.TestClient:
+    """Create testing client fixture for async middleware app caching streamed responses"""
+    return testing.TestClient(app_redis_stream_async)